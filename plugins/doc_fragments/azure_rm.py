@@ -26,6 +26,21 @@ options:
         description: A list of resource group names to search for virtual machine scale sets (VMSSs). '\*' will
             include all resource groups in the subscription.
         default: []
+    include_vmss_names:
+        description:
+        - A list of virtual machine scale set names to enumerate instances from. Shell-style wildcards such as
+          C(app-*) are supported. Scale sets whose name does not match are skipped before their instances are listed.
+        - Only applies to scale sets found through C(include_vmss_resource_groups).
+        type: list
+        elements: str
+        default: ['*']
+    include_vmss_tags:
+        description:
+        - A dictionary of tags a virtual machine scale set must carry for its instances to be enumerated.
+        - A tag with an empty value matches any value of that tag.
+        - Only applies to scale sets found through C(include_vmss_resource_groups).
+        type: dict
+        default: {}
     fail_on_template_errors:
         description: When false, template failures during group and filter processing are silently ignored (eg,
             if a filter or group expression refers to an undefined host variable)
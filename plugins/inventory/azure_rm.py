@@ -59,6 +59,12 @@ include_vm_resource_groups:
 include_vmss_resource_groups:
     - '*'
 
+# only enumerates instances of the VMSSs whose name matches one of these patterns and that carry these tags
+include_vmss_names:
+    - 'web-*'
+include_vmss_tags:
+    env: prod
+
 # places a host in the named group if the associated condition evaluates to true
 conditional_groups:
     # since this will be true for every host, every host sourced from this inventory plugin config will be in the
@@ -119,6 +125,7 @@ include_host_filters:
 # eg, powerstate==running, provisioning_state==succeeded
 
 
+import fnmatch
 import hashlib
 import json
 import re
@@ -191,6 +198,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         # FUTURE: use API profiles with defaults
         self._compute_api_version = '2021-11-01'
         self._network_api_version = '2015-06-15'
+        # the scale-set-level NIC and public IP list operations are not available in the older network API version
+        self._vmss_network_api_version = '2018-10-01'
 
         self._default_header_parameters = {'Content-Type': 'application/json; charset=utf-8'}
 
@@ -228,6 +237,10 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         self._include_filters = self.get_option('include_host_filters')
 
+        self._vmss_names = self.get_option('include_vmss_names') or ['*']
+
+        self._vmss_tags = self.get_option('include_vmss_tags') or {}
+
         try:
             self._credential_setup()
             self._get_hosts()
@@ -397,16 +410,17 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         except Empty:
             pass
 
-    def _on_vm_page_response(self, response, vmss=None):
+    def _on_vm_page_response(self, response, vmss=None, vmss_network=None):
         next_link = response.get('nextLink')
 
         if next_link:
-            self._enqueue_get(url=next_link, api_version=self._compute_api_version, handler=self._on_vm_page_response)
+            self._enqueue_get(url=next_link, api_version=self._compute_api_version, handler=self._on_vm_page_response,
+                              handler_args=dict(vmss=vmss, vmss_network=vmss_network))
 
         if 'value' in response:
             for h in response['value']:
                 # FUTURE: add direct VM filtering by tag here (performance optimization)?
-                self._hosts.append(AzureHost(h, self, vmss=vmss, legacy_name=self._legacy_hostnames))
+                self._hosts.append(AzureHost(h, self, vmss=vmss, vmss_network=vmss_network, legacy_name=self._legacy_hostnames))
 
     def _on_vmss_page_response(self, response):
         next_link = response.get('nextLink')
@@ -414,11 +428,30 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         if next_link:
             self._enqueue_get(url=next_link, api_version=self._compute_api_version, handler=self._on_vmss_page_response)
 
-        # FUTURE: add direct VMSS filtering by tag here (performance optimization)?
         for vmss in response['value']:
-            url = '{0}/virtualMachines'.format(vmss['id'])
+            if not self._vmss_included(vmss):
+                continue
+            vmss_network = None
+            # uniform VMSS instances expose their NICs and public IPs through list operations on the scale set itself,
+            # flexible orchestration instances are plain VMs and keep the per-VM NIC fetches
+            if vmss.get('properties', {}).get('orchestrationMode', 'Uniform') == 'Uniform':
+                vmss_network = AzureVmssNetwork(vmss, self)
+            # expand the instance view on the list so each instance doesn't need a separate GET for its power state
+            url = '{0}/virtualMachines?$expand=instanceView'.format(vmss['id'])
             # VMSS instances look close enough to regular VMs that we can share the handler impl...
-            self._enqueue_get(url=url, api_version=self._compute_api_version, handler=self._on_vm_page_response, handler_args=dict(vmss=vmss))
+            self._enqueue_get(url=url, api_version=self._compute_api_version, handler=self._on_vm_page_response,
+                              handler_args=dict(vmss=vmss, vmss_network=vmss_network))
+
+    def _vmss_included(self, vmss):
+        if not any(fnmatch.fnmatchcase(vmss['name'], pattern) for pattern in self._vmss_names):
+            return False
+        vmss_tags = vmss.get('tags') or {}
+        for key, value in iteritems(self._vmss_tags):
+            if key not in vmss_tags:
+                return False
+            if value and vmss_tags[key] != value:
+                return False
+        return True
 
     # use the undocumented /batch endpoint to bulk-send up to 500 requests in a single round-trip
     #
@@ -512,10 +545,11 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 class AzureHost(object):
     _powerstate_regex = re.compile('^PowerState/(?P<powerstate>.+)$')
 
-    def __init__(self, vm_model, inventory_client, vmss=None, legacy_name=False):
+    def __init__(self, vm_model, inventory_client, vmss=None, vmss_network=None, legacy_name=False):
         self._inventory_client = inventory_client
         self._vm_model = vm_model
         self._vmss = vmss
+        self._vmss_network = vmss_network
 
         self._instanceview = None
 
@@ -530,9 +564,17 @@ class AzureHost(object):
 
         self._hostvars = {}
 
-        inventory_client._enqueue_get(url="{0}/instanceView".format(vm_model['id']),
-                                      api_version=self._inventory_client._compute_api_version,
-                                      handler=self._on_instanceview_response)
+        if vm_model['properties'].get('instanceView'):
+            # already expanded by the list call
+            self._on_instanceview_response(vm_model['properties']['instanceView'])
+        else:
+            inventory_client._enqueue_get(url="{0}/instanceView".format(vm_model['id']),
+                                          api_version=self._inventory_client._compute_api_version,
+                                          handler=self._on_instanceview_response)
+
+        if vmss_network:
+            # NICs are collected by the scale set level list
+            return
 
         nic_refs = vm_model['properties']['networkProfile']['networkInterfaces']
         for nic in nic_refs:
@@ -599,8 +641,12 @@ class AzureHost(object):
             license_type=self._vm_model['properties'].get('licenseType', 'Unknown')
         )
 
+        nics = self.nics
+        if self._vmss_network:
+            nics = self._vmss_network.get_nics(self._vm_model['id'])
+
         # set nic-related values from the primary NIC first
-        for nic in sorted(self.nics, key=lambda n: n.is_primary, reverse=True):
+        for nic in sorted(nics, key=lambda n: n.is_primary, reverse=True):
             # and from the primary IP config per NIC first
             for ipc in sorted(nic._nic_model['properties']['ipConfigurations'], key=lambda i: i['properties'].get('primary', False), reverse=True):
                 try:
@@ -680,12 +726,61 @@ class AzureHost(object):
         self.nics.append(nic)
 
 
+class AzureVmssNetwork(object):
+    # lists the NICs and public IPs of all instances of a uniform VMSS in a few pages instead of per-instance GETs
+    def __init__(self, vmss, inventory_client):
+        self._inventory_client = inventory_client
+        self._nics = {}
+        self.public_ips = {}
+
+        inventory_client._enqueue_get(url='{0}/networkInterfaces'.format(vmss['id']),
+                                      api_version=inventory_client._vmss_network_api_version,
+                                      handler=self._on_nic_page_response)
+        inventory_client._enqueue_get(url='{0}/publicIPAddresses'.format(vmss['id']),
+                                      api_version=inventory_client._vmss_network_api_version,
+                                      handler=self._on_pip_page_response)
+
+    def get_nics(self, vm_id):
+        return self._nics.get(vm_id.lower(), [])
+
+    def _on_nic_page_response(self, response):
+        next_link = response.get('nextLink')
+
+        if next_link:
+            self._inventory_client._enqueue_get(url=next_link, api_version=self._inventory_client._vmss_network_api_version,
+                                                handler=self._on_nic_page_response)
+
+        for nic_model in response.get('value', []):
+            vm_id = nic_model.get('properties', {}).get('virtualMachine', {}).get('id')
+            if not vm_id:
+                continue
+            # VMSS NICs always carry the primary flag when there is more than one per instance
+            nic = AzureNic(nic_model=nic_model, inventory_client=self._inventory_client,
+                           is_primary=nic_model['properties'].get('primary', True), public_ips=self.public_ips)
+            self._nics.setdefault(vm_id.lower(), []).append(nic)
+
+    def _on_pip_page_response(self, response):
+        next_link = response.get('nextLink')
+
+        if next_link:
+            self._inventory_client._enqueue_get(url=next_link, api_version=self._inventory_client._vmss_network_api_version,
+                                                handler=self._on_pip_page_response)
+
+        for pip_model in response.get('value', []):
+            self.public_ips[pip_model['id']] = AzurePip(pip_model)
+
+
 class AzureNic(object):
-    def __init__(self, nic_model, inventory_client, is_primary=False):
+    def __init__(self, nic_model, inventory_client, is_primary=False, public_ips=None):
         self._nic_model = nic_model
         self.is_primary = is_primary
         self._inventory_client = inventory_client
 
+        if public_ips is not None:
+            # shared with the owning scale set, which lists its public IPs in bulk
+            self.public_ips = public_ips
+            return
+
         self.public_ips = {}
 
         if nic_model.get('properties', {}).get('ipConfigurations'):
@@ -21,7 +21,9 @@ description:
   - When ansible host is MSI enabled Azure VM, user don't need provide any credential to access to Azure Key Vault.
 options:
     _terms:
-        description: Secret name, version can be included like secret_name/secret_version.
+        description:
+            - Secret name, version can be included like secret_name/secret_version.
+            - Not used when I(bulk=true).
         required: True
     vault_url:
         description: Url of Azure Key Vault.
@@ -34,6 +36,35 @@ options:
         description: Tenant id of service principal.
     use_msi:
         description: MSI token autodiscover, default is true.
+    cache_ttl:
+        description:
+            - Number of seconds a fetched secret value is kept in memory and reused by later lookups of the same
+              vault, secret name and version with the same identity in the same process.
+            - The cache only lasts for one worker process. Ansible forks a worker for every task and host, so values
+              are reused by the lookups of one task on one host, not across hosts or tasks.
+            - C(0) disables the secret value cache. Access tokens are always reused until they expire.
+        type: int
+        default: 0
+    max_workers:
+        description:
+            - Maximum number of secrets fetched concurrently when several terms are given to one lookup.
+        type: int
+        default: 8
+    bulk:
+        description:
+            - Return the latest value of every enabled secret in the vault as a dictionary keyed by secret name,
+              instead of looking up the secrets given as terms.
+            - Use I(prefix) and I(tags) to narrow down the secrets returned.
+        type: bool
+        default: false
+    prefix:
+        description:
+            - Only return secrets whose name starts with this prefix when I(bulk=true).
+        type: str
+    tags:
+        description:
+            - Only return secrets carrying all of these tags with the same values when I(bulk=true).
+        type: dict
 notes:
     - If version is not provided, this plugin will return the latest version of the secret.
     - If ansible is running on Azure Virtual Machine with MSI enabled, client_id, secret and tenant isn't required.
@@ -44,6 +75,10 @@ notes:
       AZURE_CLIENT_ID, AZURE_CLIENT_SECRET and AZURE_TENANT_ID.
     - Authentication via C(az login) is also supported.
     - To use a plugin from a collection, please reference the full namespace, collection name, and lookup plugin name that you want to use.
+    - Tokens, clients and cached secret values live in the memory of the Ansible worker process that runs the lookup,
+      they are never written to disk and are discarded when the worker process exits.
+    - Cached secret values are keyed by the identity used to read them, the MSI of the host, a service principal
+      (I(client_id) and I(tenant_id)) or the default credential, and are never served to another identity.
 """
 
 EXAMPLE = """
@@ -61,6 +96,15 @@ EXAMPLE = """
         )
       }}"
 
+- name: Look up several secrets in one call, reusing them for 10 minutes
+  debug:
+    msg: "{{ lookup('azure.azcollection.azure_keyvault_secret', 'dbuser', 'dbpassword', 'apikey',
+                    vault_url=key_vault_uri, cache_ttl=600, max_workers=4) }}"
+
+- name: Look up all secrets of a service in one call
+  set_fact:
+    app1_config: "{{ lookup('azure.azcollection.azure_keyvault_secret', vault_url=key_vault_uri, bulk=true, prefix='app1-') }}"
+
 - name: Look up secret when ansible host is general VM
   vars:
     url: 'https://yourvault.vault.azure.net'
@@ -111,15 +155,22 @@ EXAMPLE = """
 
 RETURN = """
   _raw:
-    description: secret content string
+    description:
+      - secret content string
+      - A dictionary of secret names and values when I(bulk=true).
 """
 
+import os
+import threading
+import time
+
 from ansible.errors import AnsibleError
 from ansible.plugins.lookup import LookupBase
 from ansible.utils.display import Display
 try:
     import logging
     import requests
+    from concurrent.futures import ThreadPoolExecutor
     from azure.keyvault.secrets import SecretClient
     from azure.identity import DefaultAzureCredential, ClientSecretCredential
     from azure.keyvault.secrets import SecretClient
@@ -142,72 +193,232 @@ token_headers = {
     'Metadata': 'true'
 }
 
+# refresh the MSI token this many seconds before it actually expires
+TOKEN_EXPIRY_MARGIN = 300
+
+# process-level state shared by every invocation of the lookup
+_cache_lock = threading.Lock()
+_msi_token = {}
+_secret_clients = {}
+_secret_values = {}
+_session = None
+
+
+def get_session():
+    global _session
+    with _cache_lock:
+        if _session is None:
+            _session = requests.Session()
+        return _session
+
+
+def get_msi_token():
+    with _cache_lock:
+        if _msi_token and _msi_token['expires_on'] - TOKEN_EXPIRY_MARGIN > time.time():
+            return _msi_token['access_token']
+
+    token_res = get_session().get('http://169.254.169.254/metadata/identity/oauth2/token',
+                                  params=token_params,
+                                  headers=token_headers,
+                                  timeout=(3.05, 27))
+    if not token_res.ok:
+        display.v("Unable to query MSI endpoint, Error Code %s. Will use service principal if provided" % token_res.status_code)
+        return None
+    token_json = token_res.json()
+    token = token_json.get("access_token")
+    if token is None:
+        display.v('Successfully called MSI endpoint, but no token was available. Will use service principal if provided.')
+        return None
+    with _cache_lock:
+        _msi_token['access_token'] = token
+        _msi_token['expires_on'] = int(token_json.get('expires_on', 0))
+    return token
+
+
+def get_secret_client(vault_url, client_id, secret, tenant_id):
+    key = (vault_url, client_id, secret, tenant_id)
+    with _cache_lock:
+        client = _secret_clients.get(key)
+        if client is None:
+            if all(v is not None for v in [client_id, secret, tenant_id]):
+                credential = ClientSecretCredential(
+                    tenant_id=tenant_id,
+                    client_id=client_id,
+                    client_secret=secret,
+                )
+            else:
+                credential = DefaultAzureCredential()
+            client = SecretClient(vault_url, credential)
+            _secret_clients[key] = client
+        return client
+
+
+def split_term(term):
+    name, dummy, version = term.partition('/')
+    return name, version or None
+
+
+def get_cached_secret(identity, vault_url, term):
+    name, version = split_term(term)
+    with _cache_lock:
+        cached = _secret_values.get((identity, vault_url, name, version))
+    if cached and cached[1] > time.time():
+        return cached
+    return None
+
+
+def cache_secret(identity, vault_url, term, value, cache_ttl):
+    if cache_ttl <= 0:
+        return
+    name, version = split_term(term)
+    with _cache_lock:
+        _secret_values[(identity, vault_url, name, version)] = (value, time.time() + cache_ttl)
+
+
+def fetch_secrets(terms, vault_url, identity, fetch, cache_ttl, max_workers):
+    '''
+    Fetch the secrets not found in the value cache, in parallel.
+
+    :param identity: tuple identifying the credential used by fetch, part of the cache key
+    '''
+    ret = [None] * len(terms)
+    missing = []
+    for index, term in enumerate(terms):
+        cached = get_cached_secret(identity, vault_url, term) if cache_ttl > 0 else None
+        if cached:
+            ret[index] = cached[0]
+        else:
+            missing.append(index)
+
+    if len(missing) == 1:
+        values = [fetch(terms[missing[0]])]
+    elif missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+            values = list(executor.map(fetch, [terms[index] for index in missing]))
+    else:
+        values = []
+
+    for index, value in zip(missing, values):
+        ret[index] = value
+        cache_secret(identity, vault_url, terms[index], value, cache_ttl)
+    return ret
+
+
+def secret_matches(name, secret_tags, prefix, tags):
+    if prefix and not name.startswith(prefix):
+        return False
+    secret_tags = secret_tags or {}
+    return all(secret_tags.get(key) == value for key, value in (tags or {}).items())
+
+
+def lookup_secrets_bulk(names, vault_url, identity, fetch, cache_ttl, max_workers):
+    values = fetch_secrets(names, vault_url, identity, fetch, cache_ttl, max_workers)
+    return [dict(zip(names, values))]
+
+
+def list_secret_names_msi(vault_url, token, prefix, tags):
+    session = get_session()
+    url = vault_url + '/secrets'
+    secret_params = {'api-version': '2016-10-01', 'maxresults': 25}
+    secret_headers = {'Authorization': 'Bearer ' + token}
+
+    names = []
+    while url:
+        try:
+            secret_res = session.get(url, params=secret_params, headers=secret_headers)
+            secret_res.raise_for_status()
+            page = secret_res.json()
+        except Exception:
+            raise AnsibleError('Failed to list secrets of ' + vault_url + ' via MSI endpoint.')
+        for item in page.get('value', []):
+            name = item['id'].rstrip('/').rsplit('/', 1)[-1]
+            if item.get('attributes', {}).get('enabled', True) and secret_matches(name, item.get('tags'), prefix, tags):
+                names.append(name)
+        url = page.get('nextLink')
+        # the next link already carries the query parameters
+        secret_params = None
+    return names
+
 
-def lookup_secret_non_msi(terms, vault_url, kwargs):
+def list_secret_names_non_msi(client, vault_url, prefix, tags):
+    try:
+        return [item.name for item in client.list_properties_of_secrets()
+                if item.enabled is not False and secret_matches(item.name, item.tags, prefix, tags)]
+    except Exception:
+        raise AnsibleError('Failed to list secrets of ' + vault_url + '.')
+
+
+def lookup_secret_msi(terms, vault_url, token, cache_ttl, max_workers, bulk=None):
+    session = get_session()
+    secret_params = {'api-version': '2016-10-01'}
+    secret_headers = {'Authorization': 'Bearer ' + token}
+    identity = ('msi',)
+
+    def fetch(term):
+        try:
+            secret_res = session.get(vault_url + '/secrets/' + term, params=secret_params, headers=secret_headers)
+            return secret_res.json()["value"]
+        except KeyError:
+            raise AnsibleError('Failed to fetch secret ' + term + '.')
+        except Exception:
+            raise AnsibleError('Failed to fetch secret: ' + term + ' via MSI endpoint.')
+
+    if bulk is not None:
+        names = list_secret_names_msi(vault_url, token, bulk['prefix'], bulk['tags'])
+        return lookup_secrets_bulk(names, vault_url, identity, fetch, cache_ttl, max_workers)
+    return fetch_secrets(terms, vault_url, identity, fetch, cache_ttl, max_workers)
+
+
+def lookup_secret_non_msi(terms, vault_url, kwargs, cache_ttl=0, max_workers=1, bulk=None):
 
     client_id = kwargs['client_id'] if kwargs.get('client_id') else None
     secret = kwargs['secret'] if kwargs.get('secret') else None
     tenant_id = kwargs['tenant_id'] if kwargs.get('tenant_id') else None
 
+    client = get_secret_client(vault_url, client_id, secret, tenant_id)
     if all(v is not None for v in [client_id, secret, tenant_id]):
-        credential = ClientSecretCredential(
-            tenant_id=tenant_id,
-            client_id=client_id,
-            client_secret=secret,
-        )
+        identity = ('service_principal', client_id, tenant_id)
     else:
-        credential = DefaultAzureCredential()
-    client = SecretClient(vault_url, credential)
+        # the default credential picks its identity from the environment
+        identity = ('default', os.environ.get('AZURE_CLIENT_ID'), os.environ.get('AZURE_TENANT_ID'))
 
-    ret = []
-    for term in terms:
+    def fetch(term):
+        name, version = split_term(term)
         try:
-            secret_val = client.get_secret(term).value
-            ret.append(secret_val)
+            return client.get_secret(name, version).value
         except Exception:
             raise AnsibleError('Failed to fetch secret ' + term + '.')
-    return ret
+
+    if bulk is not None:
+        names = list_secret_names_non_msi(client, vault_url, bulk['prefix'], bulk['tags'])
+        return lookup_secrets_bulk(names, vault_url, identity, fetch, cache_ttl, max_workers)
+    return fetch_secrets(terms, vault_url, identity, fetch, cache_ttl, max_workers)
 
 
 class LookupModule(LookupBase):
 
     def run(self, terms, variables, **kwargs):
-        ret = []
         vault_url = kwargs.pop('vault_url', None)
         use_msi = kwargs.pop('use_msi', True)
+        cache_ttl = int(kwargs.pop('cache_ttl', 0) or 0)
+        max_workers = int(kwargs.pop('max_workers', 8) or 1)
+        bulk = None
+        if kwargs.pop('bulk', False):
+            bulk = dict(prefix=kwargs.pop('prefix', None), tags=kwargs.pop('tags', None))
         TOKEN_ACQUIRED = False
         token = None
 
         if use_msi:
             try:
-                token_res = requests.get('http://169.254.169.254/metadata/identity/oauth2/token',
-                                         params=token_params,
-                                         headers=token_headers,
-                                         timeout=(3.05, 27))
-                if token_res.ok:
-                    token = token_res.json().get("access_token")
-                    if token is not None:
-                        TOKEN_ACQUIRED = True
-                    else:
-                        display.v('Successfully called MSI endpoint, but no token was available. Will use service principal if provided.')
-                else:
-                    display.v("Unable to query MSI endpoint, Error Code %s. Will use service principal if provided" % token_res.status_code)
+                token = get_msi_token()
+                if token is not None:
+                    TOKEN_ACQUIRED = True
             except Exception:
                 display.v('Unable to fetch MSI token. Will use service principal if provided.')
 
         if vault_url is None:
             raise AnsibleError('Failed to get valid vault url.')
         if TOKEN_ACQUIRED:
-            secret_params = {'api-version': '2016-10-01'}
-            secret_headers = {'Authorization': 'Bearer ' + token}
-            for term in terms:
-                try:
-                    secret_res = requests.get(vault_url + '/secrets/' + term, params=secret_params, headers=secret_headers)
-                    ret.append(secret_res.json()["value"])
-                except KeyError:
-                    raise AnsibleError('Failed to fetch secret ' + term + '.')
-                except Exception:
-                    raise AnsibleError('Failed to fetch secret: ' + term + ' via MSI endpoint.')
-            return ret
+            return lookup_secret_msi(terms, vault_url, token, cache_ttl, max_workers, bulk)
         else:
-            return lookup_secret_non_msi(terms, vault_url, kwargs)
+            return lookup_secret_non_msi(terms, vault_url, kwargs, cache_ttl, max_workers, bulk)
@@ -29,6 +29,15 @@ options:
     description: azure tenant
   azure_cloud_environment:
     description: azure cloud environment
+  cache_ttl:
+    description:
+      - Number of seconds the object id of a service principal is remembered by the Ansible worker process running the
+        lookup, so repeated calls with the same credentials while a task is templated only query Microsoft Graph once.
+      - Ansible forks a worker for every task and host, so the result isn't reused across hosts or tasks.
+      - The credential, Graph client and event loop are always reused within the worker process.
+      - C(0) disables the result cache.
+    type: int
+    default: 600
 """
 
 EXAMPLES = """
@@ -45,6 +54,9 @@ _raw:
     Returns object id of service principal.
 """
 
+import threading
+import time
+
 from ansible.errors import AnsibleError
 from ansible.plugins.lookup import LookupBase
 from ansible.module_utils._text import to_native
@@ -58,6 +70,42 @@ try:
 except ImportError:
     pass
 
+# process-level state shared by the invocations of the lookup in one worker process
+_cache_lock = threading.Lock()
+_event_loop = None
+_cloud_environments = {}
+_graph_clients = {}
+_results = {}
+
+
+def get_event_loop():
+    # the Graph client keeps connections bound to the loop it first ran on, so every call has to use the same one
+    global _event_loop
+    with _cache_lock:
+        if _event_loop is None or _event_loop.is_closed():
+            _event_loop = asyncio.new_event_loop()
+        return _event_loop
+
+
+def get_cloud_environment(cloud_environment):
+    if cloud_environment is None:
+        return azure_cloud.AZURE_PUBLIC_CLOUD
+    with _cache_lock:
+        if cloud_environment not in _cloud_environments:
+            _cloud_environments[cloud_environment] = azure_cloud.get_cloud_from_metadata_endpoint(cloud_environment)
+        return _cloud_environments[cloud_environment]
+
+
+def get_graph_client(key, client_id, secret, tenant, authority):
+    with _cache_lock:
+        if key not in _graph_clients:
+            azure_credential_track2 = ClientSecretCredential(client_id=client_id,
+                                                             client_secret=secret,
+                                                             tenant_id=tenant,
+                                                             authority=authority)
+            _graph_clients[key] = GraphServiceClient(azure_credential_track2)
+        return _graph_clients[key]
+
 
 class LookupModule(LookupBase):
     def run(self, terms, variables, **kwargs):
@@ -68,29 +116,40 @@ class LookupModule(LookupBase):
         credentials['azure_client_id'] = self.get_option('azure_client_id', None)
         credentials['azure_secret'] = self.get_option('azure_secret', None)
         credentials['azure_tenant'] = self.get_option('azure_tenant', 'common')
+        credentials['azure_cloud_environment'] = self.get_option('azure_cloud_environment', None)
+        cache_ttl = self.get_option('cache_ttl')
 
         if credentials['azure_client_id'] is None or credentials['azure_secret'] is None:
             raise AnsibleError("Must specify azure_client_id and azure_secret")
 
-        _cloud_environment = azure_cloud.AZURE_PUBLIC_CLOUD
-        if self.get_option('azure_cloud_environment', None) is not None:
-            _cloud_environment = azure_cloud.get_cloud_from_metadata_endpoint(credentials['azure_cloud_environment'])
+        # the secret is part of the key so a wrong secret never gets a remembered answer
+        key = (credentials['azure_tenant'], credentials['azure_client_id'], credentials['azure_cloud_environment'], credentials['azure_secret'])
+
+        with _cache_lock:
+            cached = _results.get(key)
+        if cached and cached[1] > time.time():
+            return list(cached[0])
 
         try:
-            azure_credential_track2 = ClientSecretCredential(client_id=credentials['azure_client_id'],
-                                                             client_secret=credentials['azure_secret'],
-                                                             tenant_id=credentials['azure_tenant'],
-                                                             authority=_cloud_environment.endpoints.active_directory)
+            _cloud_environment = get_cloud_environment(credentials['azure_cloud_environment'])
 
-            client = GraphServiceClient(azure_credential_track2)
+            client = get_graph_client(key,
+                                      credentials['azure_client_id'],
+                                      credentials['azure_secret'],
+                                      credentials['azure_tenant'],
+                                      _cloud_environment.endpoints.active_directory)
 
-            response = asyncio.get_event_loop().run_until_complete(self.get_service_principals(client, credentials['azure_client_id']))
+            response = get_event_loop().run_until_complete(self.get_service_principals(client, credentials['azure_client_id']))
             if not response:
                 return []
-            return list(response.value)[0].id.split(',')
+            result = list(response.value)[0].id.split(',')
         except Exception as ex:
             raise AnsibleError("Failed to get service principal object id: %s" % to_native(ex))
-        return False
+
+        if cache_ttl:
+            with _cache_lock:
+                _results[key] = (list(result), time.time() + cache_ttl)
+        return result
 
     async def get_service_principals(self, _client, app_id):
         request_configuration = ServicePrincipalsRequestBuilder.ServicePrincipalsRequestBuilderGetRequestConfiguration(
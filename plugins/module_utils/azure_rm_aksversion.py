@@ -0,0 +1,34 @@
+# Copyright (c) 2026 xuzhang3 (@xuzhang3), Fred-sun (@Fred-sun)
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import normalize_location_name
+
+# Kubernetes versions offered by AKS change a few times a month
+AKS_METADATA_CACHE_TTL = 3600
+
+
+def list_orchestrators(module, location, cache_ttl=AKS_METADATA_CACHE_TTL):
+    '''
+    Get the Kubernetes versions of managed clusters in a location, cached on disk per location.
+
+    :param module: AzureRMModuleBase instance
+    :param location: Azure location
+    :param cache_ttl: seconds the versions are cached, 0 disables the cache
+    :return: list of dict with orchestrator_version, is_preview and upgrades, a list of dict with
+             orchestrator_version and is_preview
+    '''
+    def fetch():
+        response = module.containerservice_client.container_services.list_orchestrators(location, resource_type='managedClusters')
+        return [dict(
+            orchestrator_version=item.orchestrator_version,
+            is_preview=bool(item.is_preview),
+            upgrades=[dict(orchestrator_version=upgrade.orchestrator_version,
+                           is_preview=bool(upgrade.is_preview)) for upgrade in item.upgrades or []]
+        ) for item in response.orchestrators]
+
+    return module.get_cached_metadata('aks_orchestrators', normalize_location_name(location), cache_ttl, fetch)
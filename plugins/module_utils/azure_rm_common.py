@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+import asyncio
 import os
 import re
 import types
@@ -14,6 +15,7 @@ import copy
 import inspect
 import traceback
 import json
+import tempfile
 
 from os.path import expanduser
 
@@ -297,7 +299,8 @@ except ImportError as exc:
 from base64 import b64encode, b64decode
 from hashlib import sha256
 from hmac import HMAC
-from time import time
+from concurrent.futures import ThreadPoolExecutor
+from time import time, sleep
 
 try:
     from urllib import (urlencode, quote_plus)
@@ -314,6 +317,42 @@ except ImportError:
     CLIError = Exception
 
 
+DEFAULT_ASYNC_CONCURRENCY = 10
+
+# on-disk cache of slowly changing metadata, shared by module runs on the same host
+METADATA_CACHE_DIR = os.path.join(expanduser('~'), '.ansible', 'azure_rm_cache')
+
+
+async def gather_bounded(coroutines, max_concurrency=DEFAULT_ASYNC_CONCURRENCY, return_exceptions=False):
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*[run(coroutine) for coroutine in coroutines], return_exceptions=return_exceptions)
+
+
+def map_bounded(function, items, max_workers=DEFAULT_ASYNC_CONCURRENCY):
+    '''
+    Call function on every item on a thread pool of at most max_workers threads.
+
+    :return: list of results in the order of items, the exception raised by a failed call in place of its result
+    '''
+    items = list(items)
+    results = []
+    if not items:
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        futures = [executor.submit(function, item) for item in items]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                results.append(exc)
+    return results
+
+
 def azure_id_to_dict(id):
     pieces = re.sub(r'^\/', '', id).split('/')
     result = {}
@@ -458,6 +497,7 @@ class AzureRMModuleBase(object):
         self._datafactory_client = None
         self._notification_hub_client = None
         self._event_hub_client = None
+        self._event_loop = None
 
         self.check_mode = self.module.check_mode
         self.api_profile = self.module.params.get('api_profile')
@@ -639,30 +679,76 @@ class AzureRMModuleBase(object):
             self.log(str(exc))
             raise
 
-    def get_multiple_pollers_results(self, pollers, wait=0.05):
+    def get_multiple_pollers_results(self, pollers, wait=0.05, return_exceptions=False):
         '''
         Consistent method of waiting on and retrieving results from multiple Azure's long poller
 
         :param pollers list of Azure poller object
         :param wait Period of time to wait for the long running operation to complete.
+        :param return_exceptions If True, wait for all pollers and return the exception of a failed
+                                 operation in place of its result instead of raising it.
         :return list of object resulting from the original request
         '''
 
         def _continue_polling():
             return not all(poller.done() for poller in pollers)
 
+        def _result(poller):
+            try:
+                return poller.result()
+            except Exception as exc:
+                self.log(str(exc))
+                return exc
+
         try:
             while _continue_polling():
                 for poller in pollers:
                     if poller.done():
                         continue
                     self.log("Waiting for {0} sec".format(wait))
-                    poller.wait(timeout=wait)
+                    try:
+                        poller.wait(timeout=wait)
+                    except Exception:
+                        # a failed poller is done, its exception is returned by result()
+                        if not return_exceptions:
+                            raise
+            if return_exceptions:
+                return [_result(poller) for poller in pollers]
             return [poller.result() for poller in pollers]
         except Exception as exc:
             self.log(str(exc))
             raise
 
+    def wait_for_provisioning_state(self, get, is_ready, timeout, description, initial_delay=5, max_delay=60, timeout_message=None):
+        '''
+        Poll a resource until it is ready, doubling the delay between polls up to max_delay.
+
+        :param get: function returning the current resource
+        :param is_ready: function returning True when the resource passed to it is ready
+        :param timeout: seconds to wait for the resource before failing
+        :param description: description of the resource used in messages
+        :param initial_delay: seconds between the first poll, done at once, and the second one
+        :param max_delay: maximum seconds between polls
+        :param timeout_message: message to fail with on timeout, instead of the provisioning state one
+        :return the ready resource
+        '''
+        deadline = time() + timeout
+        delay = initial_delay
+        resource = get()
+        while not is_ready(resource):
+            remaining = deadline - time()
+            if remaining <= 0:
+                if timeout_message:
+                    self.fail(timeout_message)
+                self.fail("Error {0} has a provisioning state of {1} after {2} seconds. Expecting state to be {3}.".format(
+                          description, getattr(resource, 'provisioning_state', None), timeout, AZURE_SUCCESS_STATE))
+            self.log("Waiting {0} sec for {1} in provisioning state {2}".format(min(delay, remaining), description,
+                                                                               getattr(resource, 'provisioning_state', None)))
+            sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+            resource = get()
+        return resource
+
     def check_provisioning_state(self, azure_object, requested_state='present'):
         '''
         Check an Azure object's provisioning state. If something did not complete the provisioning
@@ -891,6 +977,79 @@ class AzureRMModuleBase(object):
     def get_msgraph_client(self):
         return GraphServiceClient(self.azure_auth.azure_credential_track2)
 
+    def get_event_loop(self):
+        '''
+        Event loop shared by every asynchronous (msgraph) call of the module, created on first use.
+        '''
+        if self._event_loop is None:
+            self._event_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._event_loop)
+        return self._event_loop
+
+    def run_async(self, coroutine):
+        '''
+        Run a single coroutine on the module's event loop.
+
+        :param coroutine: coroutine object, eg. a msgraph request
+        :return result of the coroutine
+        '''
+        return self.get_event_loop().run_until_complete(coroutine)
+
+    def run_async_batch(self, coroutines, max_concurrency=DEFAULT_ASYNC_CONCURRENCY, return_exceptions=False):
+        '''
+        Run a batch of coroutines on the module's event loop, with at most max_concurrency of them awaiting at a time.
+
+        :param coroutines: iterable of coroutine objects
+        :param max_concurrency: maximum number of coroutines in flight
+        :param return_exceptions: return exceptions in place of the results instead of raising the first one
+        :return list of results, in the order of coroutines
+        '''
+        coroutines = list(coroutines)
+        if not coroutines:
+            return []
+        return self.run_async(gather_bounded(coroutines, max_concurrency, return_exceptions))
+
+    def get_cached_metadata(self, name, key, ttl, fetch, refresh=False):
+        '''
+        Return metadata cached on disk for the subscription and cloud of the module, calling fetch when
+        it is missing or older than ttl seconds.
+
+        :param name: name of the kind of metadata, used as file name prefix
+        :param key: JSON serializable key of the entry, e.g. the location
+        :param ttl: seconds a cached value is used, 0 or None disables the cache
+        :param fetch: function returning the JSON serializable value, None is returned without being cached
+        :param refresh: call fetch and replace the cached value even if it hasn't expired
+        :return the cached or fetched value
+        '''
+        if not ttl or ttl <= 0:
+            return fetch()
+
+        digest = sha256(json.dumps([self.subscription_id, self._cloud_environment.name, key], sort_keys=True).encode('utf-8')).hexdigest()
+        path = os.path.join(METADATA_CACHE_DIR, '{0}-{1}.json'.format(name, digest))
+        if not refresh:
+            try:
+                with open(path) as cache_file:
+                    entry = json.load(cache_file)
+                if entry['expires'] > time():
+                    self.log('Using cached {0} from {1}'.format(name, path))
+                    return entry['value']
+            except (IOError, OSError, ValueError, KeyError, TypeError):
+                pass
+
+        value = fetch()
+        if value is None:
+            return value
+        try:
+            os.makedirs(METADATA_CACHE_DIR, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=METADATA_CACHE_DIR, prefix=name)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(dict(expires=time() + ttl, value=value), cache_file)
+            # replaced atomically, concurrent runs read either the old or the new entry
+            os.replace(tmp_path, path)
+        except (IOError, OSError) as exc:
+            self.log('Failed to write {0} cache {1}: {2}'.format(name, path, str(exc)))
+        return value
+
     def get_mgmt_svc_client(self, client_type, base_url=None, api_version=None, suppress_subscription_id=False):
         self.log('Getting management service client {0}'.format(client_type.__name__))
         self.check_client_version(client_type)
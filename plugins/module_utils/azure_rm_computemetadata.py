@@ -0,0 +1,108 @@
+# Copyright (c) 2026 xuzhang3 (@xuzhang3), Fred-sun (@Fred-sun)
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import normalize_location_name
+
+try:
+    from azure.core.exceptions import ResourceNotFoundError
+    from azure.mgmt.core.tools import parse_resource_id
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+# VM sizes and marketplace image versions change a few times a month
+COMPUTE_METADATA_CACHE_TTL = 3600
+
+
+def list_vm_sizes(module, location, cache_ttl=COMPUTE_METADATA_CACHE_TTL):
+    '''
+    Get the virtual machine sizes available in a location, cached on disk per location.
+
+    :param module: AzureRMModuleBase instance
+    :param location: Azure location
+    :param cache_ttl: seconds the sizes are cached, 0 disables the cache
+    :return: list of dict of VirtualMachineSize
+    '''
+    def fetch():
+        return [size.as_dict() for size in module.compute_client.virtual_machine_sizes.list(location=location)]
+
+    return module.get_cached_metadata('vm_sizes', normalize_location_name(location), cache_ttl, fetch)
+
+
+def get_image_version(module, location, publisher, offer, sku, version, cache_ttl=COMPUTE_METADATA_CACHE_TTL):
+    '''
+    Get a marketplace image version, cached on disk per location, publisher, offer, SKU and version.
+
+    The latest version is the version with the greatest name, as sorted by the image API.
+
+    :param module: AzureRMModuleBase instance
+    :param location: Azure location
+    :param version: version name or latest
+    :param cache_ttl: seconds the version is cached, 0 disables the cache
+    :return: dict of VirtualMachineImageResource for latest, of VirtualMachineImage otherwise, None if not found
+    '''
+    def fetch():
+        try:
+            if version == 'latest':
+                versions = module.compute_client.virtual_machine_images.list(location, publisher, offer, sku, top=1, orderby='name desc')
+                return versions[0].as_dict() if versions else None
+            return module.compute_client.virtual_machine_images.get(location, publisher, offer, sku, version).as_dict()
+        except ResourceNotFoundError:
+            return None
+
+    key = [normalize_location_name(location), publisher.lower(), offer.lower(), sku.lower(), version.lower()]
+    return module.get_cached_metadata('vm_image_version', key, cache_ttl, fetch)
+
+
+def get_custom_image_id(module, name, resource_group=None, cache_ttl=COMPUTE_METADATA_CACHE_TTL):
+    '''
+    Get the id of a managed image by name.
+
+    With a resource group the image is read directly. Otherwise the name is looked up in an index of
+    the names and ids of all images of the subscription, cached on disk. An image found in a cached
+    index is checked with a direct read, and the index is rebuilt when the image is missing from it
+    or no longer exists.
+
+    :param module: AzureRMModuleBase instance
+    :param name: name of the image
+    :param resource_group: resource group of the image, if known
+    :param cache_ttl: seconds the index is cached, 0 disables the cache
+    :return: id of the image, None if not found
+    '''
+    if resource_group:
+        try:
+            return module.compute_client.images.get(resource_group, name).id
+        except ResourceNotFoundError:
+            return None
+
+    fetched = []
+
+    def fetch():
+        fetched.append(True)
+        index = dict()
+        for image in module.compute_client.images.list():
+            index.setdefault(image.name, []).append(image.id)
+        return index
+
+    index = module.get_cached_metadata('custom_image_index', 'images', cache_ttl, fetch)
+    image_ids = index.get(name)
+    if fetched:
+        return image_ids[0] if image_ids else None
+
+    if image_ids:
+        image = parse_resource_id(image_ids[0])
+        try:
+            module.compute_client.images.get(image['resource_group'], image['name'])
+            return image_ids[0]
+        except ResourceNotFoundError:
+            pass
+
+    module.log('Image {0} not found in the cached image index, rebuilding it'.format(name))
+    index = module.get_cached_metadata('custom_image_index', 'images', cache_ttl, fetch, refresh=True)
+    image_ids = index.get(name)
+    return image_ids[0] if image_ids else None
@@ -0,0 +1,116 @@
+# Copyright (c) 2026 xuzhang3 (@xuzhang3), Fred-sun (@Fred-sun)
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from azure.containerregistry import ArtifactTagOrder
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+
+def format_tag(tag):
+    return {
+        "name": tag.name,
+        "digest": tag.digest,
+        "created_on": tag.created_on,
+        "last_updated_on": tag.last_updated_on,
+    }
+
+
+class ContainerRegistryTagScanner(object):
+    '''
+    Lists and filters the tags of the repositories in a container registry,
+    listing the tags of several repositories in parallel.
+    '''
+
+    def __init__(self, client, name=None, name_pattern=None, last_updated_before=None, order_by=None, log=None):
+        '''
+        :param client: azure.containerregistry.ContainerRegistryClient of the registry
+        :param name: only return tags with this name
+        :param name_pattern: only return tags whose name matches this shell-style wildcard pattern
+        :param last_updated_before: only return tags last updated before this timezone aware datetime
+        :param order_by: azure.containerregistry.ArtifactTagOrder of the returned tags
+        :param log: function called with debug messages
+        '''
+        self.client = client
+        self.name = name
+        self.name_pattern = name_pattern
+        self.last_updated_before = last_updated_before
+        self.order_by = order_by
+        self.log = log or (lambda msg: None)
+
+        if self.last_updated_before and self.order_by is None:
+            # oldest first, so the listing can stop at the first tag updated after the cutoff
+            self.order_by = ArtifactTagOrder.LAST_UPDATED_ON_ASCENDING
+
+    def tag_matches(self, tag):
+        if self.name and tag.name != self.name:
+            return False
+        if self.name_pattern and not fnmatch.fnmatchcase(tag.name, self.name_pattern):
+            return False
+        if self.last_updated_before and tag.last_updated_on >= self.last_updated_before:
+            return False
+        return True
+
+    def list_tags(self, repository_name):
+        '''
+        Returns the properties of the matching tags in a repository.
+        '''
+        if self.order_by is not None:
+            response = self.client.list_tag_properties(repository=repository_name, order_by=self.order_by)
+        else:
+            response = self.client.list_tag_properties(repository=repository_name)
+        self.log(f"Response : {response}")
+
+        stop_at_cutoff = self.last_updated_before and self.order_by == ArtifactTagOrder.LAST_UPDATED_ON_ASCENDING
+        tags = []
+        for tag in response:
+            if stop_at_cutoff and tag.last_updated_on >= self.last_updated_before:
+                break
+            if self.tag_matches(tag):
+                tags.append(tag)
+        return tags
+
+    def scan(self, repository_prefix=None, max_workers=8):
+        '''
+        Lists the matching tags of every repository in the registry.
+
+        Listing the repository names fails the scan, a repository whose tags can't be listed is
+        reported in the returned errors and the scan continues with the other repositories.
+
+        :param repository_prefix: only scan repositories whose name starts with this prefix
+        :param max_workers: maximum number of repositories listed in parallel
+        :return: tuple of a list of (repository name, list of tag properties) in registry order and a list
+                 of dict(name, error) for the repositories that failed
+        '''
+        results = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = []
+            try:
+                # repository names are paged, listing of the first repositories starts while later pages are read
+                for repository_name in self.client.list_repository_names():
+                    if repository_prefix and not repository_name.startswith(repository_prefix):
+                        continue
+                    futures.append((repository_name, executor.submit(self.list_tags, repository_name)))
+            except Exception:
+                for dummy, future in futures:
+                    future.cancel()
+                raise
+
+            for repository_name, future in futures:
+                try:
+                    results.append((repository_name, future.result()))
+                except Exception as e:
+                    self.log(f"Could not get ACR tags for {repository_name} - {str(e)}")
+                    errors.append(dict(name=repository_name, error=str(e)))
+
+        return results, errors
@@ -0,0 +1,22 @@
+# Copyright (c) 2026 xuzhang3 (@xuzhang3), Fred-sun (@Fred-sun)
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import os
+
+
+def read_delta_link(path):
+    '''
+    Read the Microsoft Graph delta link saved by a previous run.
+
+    :return: the delta link, None if the file doesn't exist or is empty
+    '''
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'r') as delta_file:
+        return delta_file.read().strip() or None
+
@@ -102,7 +102,6 @@ account_info:
 
 
 try:
-    import asyncio
     from msgraph.generated.education.me.user.user_request_builder import UserRequestBuilder
 except ImportError:
     # This is handled in azure_rm_common
@@ -195,7 +194,7 @@ class AzureRMAccountInfo(AzureRMModuleBase):
 
         user = {}
 
-        user_info = asyncio.get_event_loop().run_until_complete(self.getAccount())
+        user_info = self.run_async(self.getAccount())
         user['name'] = user_info.user_principal_name
         user['type'] = user_info.user_type
         return user
@@ -382,7 +382,6 @@ try:
     import datetime
     import dateutil.parser
     import uuid
-    import asyncio
     from dateutil.relativedelta import relativedelta
     from msgraph.generated.applications.applications_request_builder import ApplicationsRequestBuilder
     from msgraph.generated.models.application import Application
@@ -579,7 +578,7 @@ class AzureRMADApplication(AzureRMModuleBaseExt):
                 optional_claims=self.optional_claims
                 # allow_guests_sign_in=self.allow_guests_sign_in,
             )
-            response = asyncio.get_event_loop().run_until_complete(self.create_application(create_app))
+            response = self.run_async(self.create_application(create_app))
             self.results['changed'] = True
             self.results.update(self.to_dict(response))
             return response
@@ -622,7 +621,7 @@ class AzureRMADApplication(AzureRMModuleBaseExt):
                 # allow_guests_sign_in=self.allow_guests_sign_in,
                 app_roles=app_roles,
                 optional_claims=self.optional_claims)
-            asyncio.get_event_loop().run_until_complete(self.update_application(
+            self.run_async(self.update_application(
                 obj_id=old_response['object_id'], update_app=app_update_param))
 
             self.results['changed'] = True
@@ -633,7 +632,7 @@ class AzureRMADApplication(AzureRMModuleBaseExt):
 
     def delete_resource(self, response):
         try:
-            asyncio.get_event_loop().run_until_complete(self.delete_application(response.get('object_id')))
+            self.run_async(self.delete_application(response.get('object_id')))
             self.results['changed'] = True
             return True
         except Exception as ge:
@@ -645,7 +644,7 @@ class AzureRMADApplication(AzureRMModuleBaseExt):
         try:
             existing_apps = []
             if self.app_id:
-                ret = asyncio.get_event_loop().run_until_complete(self.get_application_by_app_id(self.app_id))
+                ret = self.run_async(self.get_application_by_app_id(self.app_id))
                 existing_apps = ret.value
 
             if not existing_apps:
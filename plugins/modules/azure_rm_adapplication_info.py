@@ -36,6 +36,28 @@ options:
         description:
             - The applications' Name.
         type: str
+    max_results:
+        description:
+            - Maximum number of applications returned.
+            - Applications are fetched 999 per page and listing stops as soon as this many applications have been returned.
+        type: int
+    select:
+        description:
+            - The application attributes to return. Only these attributes are requested from Microsoft Graph.
+            - I(object_id) is always returned.
+            - All attributes are returned by default.
+        type: list
+        elements: str
+        choices:
+            - app_id
+            - object_id
+            - app_display_name
+            - identifier_uris
+            - available_to_other_tenants
+            - sign_in_audience
+            - web_reply_urls
+            - spa_reply_urls
+            - public_client_reply_urls
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -63,6 +85,12 @@ EXAMPLES = '''
 - name: get ad app info ---- by display name
   azure_rm_adapplication_info:
     app_display_name: "{{ display_name }}"
+
+- name: get the app id and name of all applications
+  azure_rm_adapplication_info:
+    select:
+      - app_id
+      - app_display_name
 '''
 
 RETURN = '''
@@ -134,13 +162,28 @@ applications:
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 
 try:
-    import asyncio
     from msgraph.generated.applications.applications_request_builder import ApplicationsRequestBuilder
     from kiota_abstractions.api_error import APIError
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
+# returned attribute name -> Microsoft Graph property name
+APPLICATION_ATTRIBUTES = dict(
+    app_id='appId',
+    object_id='id',
+    app_display_name='displayName',
+    identifier_uris='identifierUris',
+    available_to_other_tenants='signInAudience',
+    sign_in_audience='signInAudience',
+    web_reply_urls='web',
+    spa_reply_urls='spa',
+    public_client_reply_urls='publicClient'
+)
+
+# largest page size Microsoft Graph accepts for applications
+PAGE_SIZE = 999
+
 
 class AzureRMADApplicationInfo(AzureRMModuleBase):
 
@@ -149,12 +192,16 @@ class AzureRMADApplicationInfo(AzureRMModuleBase):
             app_id=dict(type='str'),
             object_id=dict(type='str'),
             identifier_uri=dict(type='str'),
-            app_display_name=dict(type='str')
+            app_display_name=dict(type='str'),
+            max_results=dict(type='int'),
+            select=dict(type='list', elements='str', choices=list(APPLICATION_ATTRIBUTES.keys()))
         )
         self.app_id = None
         self.app_display_name = None
         self.object_id = None
         self.identifier_uri = None
+        self.max_results = None
+        self.select = None
         self.results = dict(changed=False)
         self._client = None
         super(AzureRMADApplicationInfo, self).__init__(derived_arg_spec=self.module_arg_spec,
@@ -171,7 +218,7 @@ class AzureRMADApplicationInfo(AzureRMModuleBase):
         try:
             self._client = self.get_msgraph_client()
             if self.object_id:
-                applications = [asyncio.get_event_loop().run_until_complete(self.get_application(self.object_id))]
+                applications = [self.to_dict(self.run_async(self.get_application(self.object_id)))]
             else:
                 sub_filters = []
                 if self.identifier_uri:
@@ -180,9 +227,8 @@ class AzureRMADApplicationInfo(AzureRMModuleBase):
                     sub_filters.append("appId eq '{0}'".format(self.app_id))
                 if self.app_display_name:
                     sub_filters.append("displayName eq '{0}'".format(self.app_display_name))
-                apps = asyncio.get_event_loop().run_until_complete(self.get_applications(sub_filters))
-                applications = list(apps)
-            self.results['applications'] = [self.to_dict(app) for app in applications]
+                applications = self.run_async(self.get_applications(sub_filters))
+            self.results['applications'] = applications
         except APIError as e:
             if e.response_status_code != 404:
                 self.fail("failed to get application info {0}".format(str(e)))
@@ -192,47 +238,60 @@ class AzureRMADApplicationInfo(AzureRMModuleBase):
         return self.results
 
     def to_dict(self, object):
-        return dict(
+        result = dict(
             app_id=object.app_id,
             object_id=object.id,
             app_display_name=object.display_name,
             identifier_uris=object.identifier_uris,
             available_to_other_tenants=object.sign_in_audience,
             sign_in_audience=object.sign_in_audience,
-            web_reply_urls=object.web.redirect_uris,
-            spa_reply_urls=object.spa.redirect_uris,
-            public_client_reply_urls=object.public_client.redirect_uris
+            web_reply_urls=object.web.redirect_uris if object.web else None,
+            spa_reply_urls=object.spa.redirect_uris if object.spa else None,
+            public_client_reply_urls=object.public_client.redirect_uris if object.public_client else None
         )
+        if self.select:
+            return dict((key, value) for key, value in result.items() if key == 'object_id' or key in self.select)
+        return result
 
-    async def get_application(self, obj_id):
-        return await self._client.applications.by_application_id(obj_id).get()
+    def graph_select(self):
+        if not self.select:
+            return None
+        return sorted(set(APPLICATION_ATTRIBUTES[attribute] for attribute in self.select) | set(['id']))
 
-    async def get_applications(self, sub_filters):
-        if sub_filters:
+    async def get_application(self, obj_id):
+        if self.select:
             request_configuration = ApplicationsRequestBuilder.ApplicationsRequestBuilderGetRequestConfiguration(
                 query_parameters=ApplicationsRequestBuilder.ApplicationsRequestBuilderGetQueryParameters(
-                    filter=(' and '.join(sub_filters)),
+                    select=self.graph_select(),
                 ),
             )
-            applications = await self._client.applications.get(request_configuration=request_configuration)
-            return applications.value
-        else:
-            applications_list = []
-            applications = await self._client.applications.get()
-            for app in applications.value:
-                applications_list.append(app)
-
-            if applications.odata_next_link:
-                next_link = applications.odata_next_link
-            else:
-                next_link = None
-
-            while next_link:
-                applications = await self._client.applications.with_url(next_link).get()
-                next_link = applications.odata_next_link
-                for app in applications.value:
-                    applications_list.append(app)
-            return applications_list
+            return await self._client.applications.by_application_id(obj_id).get(request_configuration=request_configuration)
+        return await self._client.applications.by_application_id(obj_id).get()
+
+    async def get_applications(self, sub_filters):
+        page_size = PAGE_SIZE
+        if self.max_results:
+            page_size = min(page_size, self.max_results)
+        request_configuration = ApplicationsRequestBuilder.ApplicationsRequestBuilderGetRequestConfiguration(
+            query_parameters=ApplicationsRequestBuilder.ApplicationsRequestBuilderGetQueryParameters(
+                filter=(' and '.join(sub_filters)) if sub_filters else None,
+                select=self.graph_select(),
+                top=page_size,
+            ),
+        )
+
+        applications_list = []
+        # convert every page as it arrives so the SDK objects can be released
+        applications = await self._client.applications.get(request_configuration=request_configuration)
+        while applications is not None:
+            for app in applications.value or []:
+                if self.max_results and len(applications_list) >= self.max_results:
+                    return applications_list
+                applications_list.append(self.to_dict(app))
+            if not applications.odata_next_link or (self.max_results and len(applications_list) >= self.max_results):
+                break
+            applications = await self._client.applications.with_url(applications.odata_next_link).get()
+        return applications_list
 
 
 def main():
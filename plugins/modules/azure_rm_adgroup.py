@@ -45,11 +45,13 @@ options:
         description:
             - The azure ad objects asserted to be members of the group.
             - This list does not need to be all inclusive. Objects that are members and not on this list remain members.
+            - Missing members are added 20 at a time in a single request per chunk.
         type: list
         elements: str
     absent_members:
         description:
             - The azure ad objects asserted to not be members of the group.
+            - Members are removed through Microsoft Graph JSON batches of 20 requests.
         type: list
         elements: str
     present_owners:
@@ -214,11 +216,17 @@ description:
     sample: 'fortest'
 '''
 
+import json
+
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 
 try:
     import asyncio
+    from kiota_abstractions.method import Method
+    from kiota_abstractions.request_information import RequestInformation
     from msgraph.generated.groups.groups_request_builder import GroupsRequestBuilder
+    from msgraph.generated.groups.item.members.members_request_builder import MembersRequestBuilder
+    from msgraph.generated.groups.item.owners.owners_request_builder import OwnersRequestBuilder
     from msgraph.generated.models.group import Group
     from msgraph.generated.groups.item.transitive_members.transitive_members_request_builder import \
         TransitiveMembersRequestBuilder
@@ -227,6 +235,17 @@ except ImportError:
     # This is handled in azure_rm_common
     pass
 
+# Microsoft Graph accepts at most 20 references per members@odata.bind and 20 requests per $batch
+GRAPH_BATCH_SIZE = 20
+# number of Graph requests carrying a chunk that are in flight at the same time
+GRAPH_BATCH_CONCURRENCY = 4
+# times a throttled request of a $batch is sent again
+GRAPH_BATCH_RETRIES = 3
+
+
+def chunks(items, size=GRAPH_BATCH_SIZE):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
 
 class AzureRMADGroup(AzureRMModuleBase):
     def __init__(self):
@@ -276,18 +295,18 @@ class AzureRMADGroup(AzureRMModuleBase):
 
             if self.display_name and self.mail_nickname:
                 filter = "displayName eq '{0}' and mailNickname eq '{1}'".format(self.display_name, self.mail_nickname)
-                ad_groups = asyncio.get_event_loop().run_until_complete(self.get_group_list(filter))
+                ad_groups = self.run_async(self.get_group_list(filter))
                 if ad_groups:
                     self.object_id = ad_groups[0].id
 
             elif self.object_id:
-                ad_groups = [asyncio.get_event_loop().run_until_complete(self.get_group(self.object_id))]
+                ad_groups = [self.run_async(self.get_group(self.object_id))]
 
             if ad_groups:
                 if self.state == "present":
                     self.results["changed"] = False
                 elif self.state == "absent":
-                    asyncio.get_event_loop().run_until_complete(self.delete_group(self.object_id))
+                    self.run_async(self.delete_group(self.object_id))
                     ad_groups = []
                     self.results["changed"] = True
             else:
@@ -302,7 +321,7 @@ class AzureRMADGroup(AzureRMModuleBase):
                             description=self.description
                         )
 
-                        ad_groups = [asyncio.get_event_loop().run_until_complete(self.create_group(group))]
+                        ad_groups = [self.run_async(self.create_group(group))]
                         self.results["changed"] = True
                     else:
                         raise ValueError(
@@ -321,57 +340,68 @@ class AzureRMADGroup(AzureRMModuleBase):
         return self.results
 
     def update_members(self, group_id):
-        current_members = []
+        current_members = set()
 
         if self.present_members or self.absent_members:
-            ret = asyncio.get_event_loop().run_until_complete(self.get_group_members(group_id))
-            current_members = [object.id for object in ret.value]
+            current_members = set(self.run_async(self.get_direct_member_ids(group_id)))
 
         if self.present_members:
             present_members_by_object_id = self.dictionary_from_object_urls(self.present_members)
 
-            members_to_add = list(set(present_members_by_object_id.keys()) - set(current_members))
+            members_to_add = sorted(set(present_members_by_object_id.keys()) - current_members)
 
             if members_to_add:
-                for member_object_id in members_to_add:
-                    asyncio.get_event_loop().run_until_complete(
-                        self.add_group_member(group_id, present_members_by_object_id[member_object_id]))
+                self.run_async_batch([self.add_group_members(group_id, chunk) for chunk in chunks(members_to_add)],
+                                     max_concurrency=GRAPH_BATCH_CONCURRENCY)
                 self.results["changed"] = True
 
         if self.absent_members:
-            members_to_remove = list(set(self.absent_members).intersection(set(current_members)))
+            absent_members = self.dictionary_from_object_urls(self.absent_members).keys()
+            members_to_remove = sorted(set(absent_members).intersection(current_members))
 
             if members_to_remove:
-                for member in members_to_remove:
-                    asyncio.get_event_loop().run_until_complete(self.delete_group_member(group_id, member))
+                self.remove_references(group_id, 'members', members_to_remove)
                 self.results["changed"] = True
 
     def update_owners(self, group_id):
-        current_owners = []
+        current_owners = set()
 
         if self.present_owners or self.absent_owners:
-            ret = asyncio.get_event_loop().run_until_complete(self.get_group_owners(group_id))
-            current_owners = [object.id for object in ret.value]
+            current_owners = set(self.run_async(self.get_owner_ids(group_id)))
 
         if self.present_owners:
 
             present_owners_by_object_id = self.dictionary_from_object_urls(self.present_owners)
-            owners_to_add = list(set(present_owners_by_object_id.keys()) - set(current_owners))
+            owners_to_add = sorted(set(present_owners_by_object_id.keys()) - current_owners)
 
             if owners_to_add:
-                for owner_object_id in owners_to_add:
-                    asyncio.get_event_loop().run_until_complete(
-                        self.add_gropup_owner(group_id, present_owners_by_object_id[owner_object_id]))
+                # owners can't be bound in bulk, they are added one reference per request
+                self.run_async_batch([self.add_gropup_owner(group_id, owner_object_id) for owner_object_id in owners_to_add])
                 self.results["changed"] = True
 
         if self.absent_owners:
-            owners_to_remove = list(set(self.absent_owners).intersection(set(current_owners)))
+            absent_owners = self.dictionary_from_object_urls(self.absent_owners).keys()
+            owners_to_remove = sorted(set(absent_owners).intersection(current_owners))
 
             if owners_to_remove:
-                for owner in owners_to_remove:
-                    asyncio.get_event_loop().run_until_complete(self.remove_gropup_owner(group_id, owner))
+                self.remove_references(group_id, 'owners', owners_to_remove)
                 self.results["changed"] = True
 
+    def remove_references(self, group_id, relationship, obj_ids):
+        requests = [dict(id=str(index), method='DELETE', url='/groups/{0}/{1}/{2}/$ref'.format(group_id, relationship, obj_id))
+                    for index, obj_id in enumerate(obj_ids)]
+        responses = self.run_async_batch([self.send_batch(chunk) for chunk in chunks(requests)],
+                                         max_concurrency=GRAPH_BATCH_CONCURRENCY)
+
+        errors = []
+        for response in responses:
+            for item in response:
+                # 404 means the reference is already gone
+                if item.get('status', 500) >= 400 and item.get('status') != 404:
+                    errors.append("{0}: {1}".format(requests[int(item['id'])]['url'], item.get('body', {}).get('error', {}).get('message')))
+        if errors:
+            self.fail("Failed to remove {0} of group {1}: {2}".format(relationship, group_id, '; '.join(errors)))
+
     def dictionary_from_object_urls(self, object_urls):
         objects_by_object_id = {}
 
@@ -433,13 +463,16 @@ class AzureRMADGroup(AzureRMModuleBase):
     def set_results(self, object):
         results = self.group_to_dict(object)
 
+        requests = []
         if results["object_id"] and (self.present_owners or self.absent_owners):
-            ret = asyncio.get_event_loop().run_until_complete(self.get_group_owners(results["object_id"]))
-            results["group_owners"] = [self.result_to_dict(object) for object in ret.value]
+            requests.append(("group_owners", self.get_group_owners(results["object_id"])))
 
         if results["object_id"] and (self.present_members or self.absent_members):
-            ret = asyncio.get_event_loop().run_until_complete(self.get_group_members(results["object_id"]))
-            results["group_members"] = [self.result_to_dict(object) for object in ret.value]
+            requests.append(("group_members", self.get_group_members(results["object_id"])))
+
+        responses = self.run_async_batch([request[1] for request in requests])
+        for (key, dummy), ret in zip(requests, responses):
+            results[key] = [self.result_to_dict(object) for object in ret.value]
 
         return results
 
@@ -479,14 +512,75 @@ class AzureRMADGroup(AzureRMModuleBase):
         return await self._client.groups.by_group_id(group_id).transitive_members.get(
             request_configuration=request_configuration)
 
-    async def add_group_member(self, group_id, obj_id):
-        request_body = ReferenceCreate(
-            odata_id="https://graph.microsoft.com/v1.0/directoryObjects/{0}".format(obj_id),
+    async def get_direct_member_ids(self, group_id):
+        request_configuration = MembersRequestBuilder.MembersRequestBuilderGetRequestConfiguration(
+            query_parameters=MembersRequestBuilder.MembersRequestBuilderGetQueryParameters(
+                select=['id'],
+                top=999,
+            ),
         )
-        await self._client.groups.by_group_id(group_id).members.ref.post(body=request_body)
-
-    async def delete_group_member(self, group_id, member_id):
-        await self._client.groups.by_group_id(group_id).members.by_directory_object_id(member_id).ref.delete()
+        members = self._client.groups.by_group_id(group_id).members
+        ids = []
+        response = await members.get(request_configuration=request_configuration)
+        while response is not None:
+            ids.extend(object.id for object in response.value or [])
+            if response.odata_next_link is None:
+                break
+            response = await members.with_url(response.odata_next_link).get()
+        return ids
+
+    async def get_owner_ids(self, group_id):
+        request_configuration = OwnersRequestBuilder.OwnersRequestBuilderGetRequestConfiguration(
+            query_parameters=OwnersRequestBuilder.OwnersRequestBuilderGetQueryParameters(
+                select=['id'],
+                top=999,
+            ),
+        )
+        owners = self._client.groups.by_group_id(group_id).owners
+        ids = []
+        response = await owners.get(request_configuration=request_configuration)
+        while response is not None:
+            ids.extend(object.id for object in response.value or [])
+            if response.odata_next_link is None:
+                break
+            response = await owners.with_url(response.odata_next_link).get()
+        return ids
+
+    async def add_group_members(self, group_id, obj_ids):
+        request_body = Group(
+            additional_data={
+                "members@odata.bind": ["{0}/directoryObjects/{1}".format(self._client.request_adapter.base_url, obj_id)
+                                       for obj_id in obj_ids],
+            }
+        )
+        await self._client.groups.by_group_id(group_id).patch(body=request_body)
+
+    async def send_batch(self, requests):
+        # msgraph-sdk has no $batch support yet, send the JSON batch through the client's request adapter
+        pending = requests
+        responses = []
+        for attempt in range(GRAPH_BATCH_RETRIES + 1):
+            request_info = RequestInformation()
+            request_info.http_method = Method.POST
+            request_info.url = "{0}/$batch".format(self._client.request_adapter.base_url)
+            request_info.headers.try_add("Accept", "application/json")
+            request_info.headers.try_add("Content-Type", "application/json")
+            request_info.content = json.dumps(dict(requests=pending)).encode('utf-8')
+            content = await self._client.request_adapter.send_primitive_async(request_info, "bytes", None)
+
+            throttled = []
+            retry_after = 0
+            for item in json.loads(content).get('responses', []):
+                if item.get('status') == 429 and attempt < GRAPH_BATCH_RETRIES:
+                    throttled.append(item['id'])
+                    retry_after = max(retry_after, int(item.get('headers', {}).get('Retry-After', 1)))
+                else:
+                    responses.append(item)
+            if not throttled:
+                break
+            pending = [request for request in pending if request['id'] in throttled]
+            await asyncio.sleep(retry_after)
+        return responses
 
     async def get_group_owners(self, group_id):
         request_configuration = GroupsRequestBuilder.GroupsRequestBuilderGetRequestConfiguration(
@@ -502,9 +596,6 @@ class AzureRMADGroup(AzureRMModuleBase):
         )
         await self._client.groups.by_group_id(group_id).owners.ref.post(body=request_body)
 
-    async def remove_gropup_owner(self, group_id, obj_id):
-        await self._client.groups.by_group_id(group_id).owners.by_directory_object_id(obj_id).ref.delete()
-
 
 def main():
     AzureRMADGroup()
@@ -50,6 +50,16 @@ options:
             - Indicate whether the members of a group should be returned with the returned groups.
         default: False
         type: bool
+    transitive:
+        description:
+            - Return the complete nested membership of every returned group in I(group_members), following all pages,
+              and the members of all returned groups, without duplicates, in I(transitive_members).
+            - Membership is read from the Graph C(transitiveMembers) list. When Graph rejects that query as unsupported
+              for a group, the nested groups are expanded breadth first with the member lists of each level fetched
+              concurrently. Other errors, such as throttling or missing permissions, fail the module.
+            - Implies I(return_group_members=true).
+        default: False
+        type: bool
     return_member_groups:
         description:
             - Indicate whether the groups in which a groups is a member should be returned with the returned groups.
@@ -62,6 +72,17 @@ options:
             - It is recommended that you instead identify a subset of groups and use filter.
         default: False
         type: bool
+    delta_link_path:
+        description:
+            - Path of a file holding the Microsoft Graph delta link returned as I(delta_link) by a previous run.
+            - When the file doesn't exist yet or is empty, all groups are returned.
+            - On later runs only the groups created or changed since the previous run are returned, and the object IDs
+              of deleted groups are returned in I(removed_object_ids).
+            - If the saved delta link has expired, all groups are returned again.
+            - Changed groups only carry the properties that changed, their other properties are returned as C(None).
+            - The module only reads the file. Save the returned I(delta_link) to it for the next run, for example with M(ansible.builtin.copy).
+            - Mutually exclusive with I(object_id), I(attribute_name), I(odata_filter) and I(all).
+        type: path
 extends_documentation_fragment:
     - azure.azcollection.azure
 author:
@@ -85,6 +106,11 @@ EXAMPLES = '''
     return_owners: true
     return_group_members: true
 
+- name: Return every user nested anywhere below a set of groups
+  azure_rm_adgroup_info:
+    odata_filter: "startswith(displayName, 'app1-')"
+    transitive: true
+
 - name: Return a specific group using object_id and return the groups the group is a member of
   azure_rm_adgroup_info:
     object_id: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
@@ -107,6 +133,16 @@ EXAMPLES = '''
 - name: Return all groups
   azure_rm_adgroup_info:
     all: true
+
+- name: Return the groups changed since the previous run
+  azure_rm_adgroup_info:
+    delta_link_path: /var/lib/identity-sync/groups.delta
+  register: groups_delta
+
+- name: Save the delta link for the next run
+  ansible.builtin.copy:
+    content: "{{ groups_delta.delta_link }}"
+    dest: /var/lib/identity-sync/groups.delta
 '''
 
 RETURN = '''
@@ -162,21 +198,49 @@ description:
     type: str
     returned: always
     sample: 'fortest'
+transitive_members:
+    description:
+        - The members of all returned groups, including members of nested groups, without duplicates.
+    returned: when I(transitive=true)
+    type: list
+removed_object_ids:
+    description:
+        - The object IDs of the groups deleted since the previous run.
+    type: list
+    returned: when I(delta_link_path) is set
+    sample: ["xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx"]
+delta_link:
+    description:
+        - The Microsoft Graph delta link to read the next changes from, to be saved to I(delta_link_path) for the next run.
+    type: str
+    returned: when I(delta_link_path) is set
+    sample: https://graph.microsoft.com/v1.0/groups/delta()?$deltatoken=xxxx
 '''
 
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_graphdelta import read_delta_link
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import DEFAULT_ASYNC_CONCURRENCY
 
 try:
     import asyncio
+    from kiota_abstractions.api_error import APIError
     from msgraph.generated.groups.groups_request_builder import GroupsRequestBuilder
+    from msgraph.generated.groups.delta.delta_request_builder import DeltaRequestBuilder
     from msgraph.generated.groups.item.transitive_members.transitive_members_request_builder import \
         TransitiveMembersRequestBuilder
+    from msgraph.generated.groups.item.members.members_request_builder import MembersRequestBuilder
     from msgraph.generated.groups.item.get_member_groups.get_member_groups_post_request_body import \
         GetMemberGroupsPostRequestBody
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
+# status codes of a transitiveMembers query Microsoft Graph doesn't support, answered by walking the nested groups instead
+TRANSITIVE_UNSUPPORTED_STATUS_CODES = (400, 501)
+
+MEMBER_SELECT = ['id', 'displayName', 'userPrincipalName', 'mailNickname', 'mail', 'accountEnabled', 'userType',
+                 'appId', 'appRoleAssignmentRequired', 'mailEnabled', 'securityEnabled', 'description']
+
 
 class AzureRMADGroupInfo(AzureRMModuleBase):
     def __init__(self):
@@ -190,7 +254,9 @@ class AzureRMADGroupInfo(AzureRMModuleBase):
             return_owners=dict(type='bool', default=False),
             return_group_members=dict(type='bool', default=False),
             return_member_groups=dict(type='bool', default=False),
+            transitive=dict(type='bool', default=False),
             all=dict(type='bool', default=False),
+            delta_link_path=dict(type='path'),
         )
 
         self.object_id = None
@@ -201,14 +267,17 @@ class AzureRMADGroupInfo(AzureRMModuleBase):
         self.return_owners = False
         self.return_group_members = False
         self.return_member_groups = False
+        self.transitive = False
         self.all = False
+        self.delta_link_path = None
+        self._graph_semaphore = None
 
         self.results = dict(changed=False)
         self._client = None
 
-        mutually_exclusive = [['odata_filter', 'attribute_name', 'object_id', 'all']]
+        mutually_exclusive = [['odata_filter', 'attribute_name', 'object_id', 'all', 'delta_link_path']]
         required_together = [['attribute_name', 'attribute_value']]
-        required_one_of = [['odata_filter', 'attribute_name', 'object_id', 'all']]
+        required_one_of = [['odata_filter', 'attribute_name', 'object_id', 'all', 'delta_link_path']]
 
         super(AzureRMADGroupInfo, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                  supports_check_mode=True,
@@ -229,15 +298,19 @@ class AzureRMADGroupInfo(AzureRMModuleBase):
             self._client = self.get_msgraph_client()
 
             if self.object_id is not None:
-                ad_groups = [asyncio.get_event_loop().run_until_complete(self.get_group(self.object_id))]
+                ad_groups = [self.run_async(self.get_group(self.object_id))]
             elif self.attribute_name is not None and self.attribute_value is not None:
-                ad_groups = asyncio.get_event_loop().run_until_complete(
+                ad_groups = self.run_async(
                     self.get_group_list(filter="{0} eq '{1}'".format(self.attribute_name, self.attribute_value)))
             elif self.odata_filter is not None:  # run a filter based on user input
-                ad_groups = asyncio.get_event_loop().run_until_complete(self.get_group_list(filter=self.odata_filter))
+                ad_groups = self.run_async(self.get_group_list(filter=self.odata_filter))
             elif self.all:
-                ad_groups = asyncio.get_event_loop().run_until_complete(self.get_group_list())
-            self.results['ad_groups'] = [self.set_results(group) for group in ad_groups]
+                ad_groups = self.run_async(self.get_group_list())
+            elif self.delta_link_path is not None:
+                ad_groups, removed_object_ids, delta_link = self.run_async(self.get_groups_delta(read_delta_link(self.delta_link_path)))
+                self.results['removed_object_ids'] = removed_object_ids
+                self.results['delta_link'] = delta_link
+            self.results['ad_groups'] = self.set_results(ad_groups)
         except Exception as e:
             self.fail("failed to get ad group info {0}".format(str(e)))
 
@@ -292,28 +365,54 @@ class AzureRMADGroupInfo(AzureRMModuleBase):
         else:
             return object.odata_type
 
-    def set_results(self, object):
-        results = self.group_to_dict(object)
-
-        if results["object_id"] and self.return_owners:
-            ret = asyncio.get_event_loop().run_until_complete(self.get_group_owners(results["object_id"]))
-            results["group_owners"] = [self.result_to_dict(object) for object in ret.value]
-
-        if results["object_id"] and self.return_group_members:
-            ret = asyncio.get_event_loop().run_until_complete(self.get_group_members(results["object_id"]))
-            results["group_members"] = [self.result_to_dict(object) for object in ret.value]
-
-        if results["object_id"] and self.return_member_groups:
-            ret = asyncio.get_event_loop().run_until_complete(self.get_member_groups(results["object_id"]))
-            results["member_groups"] = [self.result_to_dict(object) for object in list(ret.value)]
-
-        if results["object_id"] and self.check_membership:
-            filter = "id eq '{0}' ".format(self.check_membership)
-            ret = asyncio.get_event_loop().run_until_complete(self.get_group_members(results["object_id"], filter))
-            results["is_member_of"] = True if ret.value and len(ret.value) != 0 else False
+    def set_results(self, ad_groups):
+        results = [self.group_to_dict(group) for group in ad_groups]
+
+        # all the per-group lookups of all groups are sent together
+        requests = []
+        for result in results:
+            if not result["object_id"]:
+                continue
+            if self.return_owners:
+                requests.append((result, "group_owners", self.get_group_owners(result["object_id"])))
+            if self.transitive:
+                requests.append((result, "group_members", self.get_all_transitive_members(result["object_id"])))
+            elif self.return_group_members:
+                requests.append((result, "group_members", self.get_group_members(result["object_id"])))
+            if self.return_member_groups:
+                requests.append((result, "member_groups", self.get_member_groups(result["object_id"])))
+            if self.check_membership:
+                filter = "id eq '{0}' ".format(self.check_membership)
+                requests.append((result, "is_member_of", self.get_group_members(result["object_id"], filter)))
+
+        # the Graph requests share one semaphore, the lookups themselves don't need a bound
+        responses = self.run_async_batch([request[2] for request in requests], max_concurrency=max(1, len(requests)))
+
+        transitive_members = {}
+        for (result, key, dummy), ret in zip(requests, responses):
+            if key == "is_member_of":
+                result[key] = True if ret.value and len(ret.value) != 0 else False
+            else:
+                objects = ret if isinstance(ret, list) else list(ret.value)
+                result[key] = [self.result_to_dict(object) for object in objects]
+                if self.transitive and key == "group_members":
+                    transitive_members.update((object.id, member) for object, member in zip(objects, result[key]))
+
+        if self.transitive:
+            self.results['transitive_members'] = list(transitive_members.values())
 
         return results
 
+    async def graph_request(self, request):
+        '''
+        Await a Microsoft Graph request, with at most DEFAULT_ASYNC_CONCURRENCY requests of the module in flight.
+        '''
+        if self._graph_semaphore is None:
+            # created on the running event loop
+            self._graph_semaphore = asyncio.Semaphore(DEFAULT_ASYNC_CONCURRENCY)
+        async with self._graph_semaphore:
+            return await request
+
     async def get_group(self, group_id):
         return await self._client.groups.by_group_id(group_id).get()
 
@@ -349,7 +448,7 @@ class AzureRMADGroupInfo(AzureRMModuleBase):
 
             ),
         )
-        return await self._client.groups.by_group_id(group_id).owners.get(request_configuration=request_configuration)
+        return await self.graph_request(self._client.groups.by_group_id(group_id).owners.get(request_configuration=request_configuration))
 
     async def get_group_members(self, group_id, filters=None):
         request_configuration = TransitiveMembersRequestBuilder.TransitiveMembersRequestBuilderGetRequestConfiguration(
@@ -362,12 +461,103 @@ class AzureRMADGroupInfo(AzureRMModuleBase):
         )
         if filters:
             request_configuration.query_parameters.filter = filters
-        return await self._client.groups.by_group_id(group_id).transitive_members.get(
-            request_configuration=request_configuration)
+        return await self.graph_request(self._client.groups.by_group_id(group_id).transitive_members.get(
+            request_configuration=request_configuration))
+
+    async def get_groups_delta(self, delta_link=None):
+        delta = self._client.groups.delta
+        try:
+            if delta_link:
+                response = await delta.with_url(delta_link).get()
+            else:
+                request_configuration = DeltaRequestBuilder.DeltaRequestBuilderGetRequestConfiguration(
+                    query_parameters=DeltaRequestBuilder.DeltaRequestBuilderGetQueryParameters(
+                        select=['id', 'displayName', 'mailNickname', 'mailEnabled', 'securityEnabled', 'mail', 'description'],
+                    ),
+                )
+                response = await delta.get(request_configuration=request_configuration)
+        except APIError as e:
+            # an expired delta token can't be resumed, start a full sync again
+            if delta_link and e.response_status_code in (400, 410):
+                return await self.get_groups_delta()
+            raise
+
+        groups = []
+        removed_object_ids = []
+        while response is not None:
+            for group in response.value or []:
+                if group.additional_data and '@removed' in group.additional_data:
+                    removed_object_ids.append(group.id)
+                else:
+                    groups.append(group)
+            if response.odata_next_link is None:
+                break
+            response = await delta.with_url(response.odata_next_link).get()
+
+        return groups, removed_object_ids, response.odata_delta_link if response is not None else None
+
+    async def get_all_transitive_members(self, group_id):
+        request_configuration = TransitiveMembersRequestBuilder.TransitiveMembersRequestBuilderGetRequestConfiguration(
+            query_parameters=TransitiveMembersRequestBuilder.TransitiveMembersRequestBuilderGetQueryParameters(
+                select=MEMBER_SELECT,
+                top=999,
+            ),
+        )
+        transitive_members = self._client.groups.by_group_id(group_id).transitive_members
+        try:
+            members = []
+            response = await self.graph_request(transitive_members.get(request_configuration=request_configuration))
+            while response is not None:
+                members.extend(response.value or [])
+                if response.odata_next_link is None:
+                    break
+                response = await self.graph_request(transitive_members.with_url(response.odata_next_link).get())
+            return members
+        except APIError as e:
+            if e.response_status_code not in TRANSITIVE_UNSUPPORTED_STATUS_CODES:
+                raise
+            self.log("Listing transitive members of group {0} is not supported, walking the nested groups - {1}".format(group_id, str(e)))
+            return await self.expand_members(group_id)
+
+    async def expand_members(self, group_id):
+        # breadth first walk of the nested groups, the visited set protects against membership cycles
+        visited = set([group_id])
+        members = {}
+        level = [group_id]
+        while level:
+            # every page request holds the shared Graph semaphore, the level itself isn't bounded again
+            pages = await asyncio.gather(*[self.get_direct_members(nested_group_id) for nested_group_id in level])
+            level = []
+            for page in pages:
+                for object in page:
+                    if object.id == group_id:
+                        continue
+                    members.setdefault(object.id, object)
+                    if object.odata_type == "#microsoft.graph.group" and object.id not in visited:
+                        visited.add(object.id)
+                        level.append(object.id)
+        return list(members.values())
+
+    async def get_direct_members(self, group_id):
+        request_configuration = MembersRequestBuilder.MembersRequestBuilderGetRequestConfiguration(
+            query_parameters=MembersRequestBuilder.MembersRequestBuilderGetQueryParameters(
+                select=MEMBER_SELECT,
+                top=999,
+            ),
+        )
+        direct_members = self._client.groups.by_group_id(group_id).members
+        members = []
+        response = await self.graph_request(direct_members.get(request_configuration=request_configuration))
+        while response is not None:
+            members.extend(response.value or [])
+            if response.odata_next_link is None:
+                break
+            response = await self.graph_request(direct_members.with_url(response.odata_next_link).get())
+        return members
 
     async def get_member_groups(self, obj_id):
         request_body = GetMemberGroupsPostRequestBody(security_enabled_only=False)
-        return await self._client.groups.by_group_id(obj_id).get_member_groups.post(body=request_body)
+        return await self.graph_request(self._client.groups.by_group_id(obj_id).get_member_groups.post(body=request_body))
 
 
 def main():
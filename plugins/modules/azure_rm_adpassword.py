@@ -110,7 +110,6 @@ from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common
 import datetime
 
 try:
-    import asyncio
     from msgraph.generated.models.password_credential import PasswordCredential
     from msgraph.generated.applications.item.add_password.add_password_post_request_body import \
         AddPasswordPostRequestBody
@@ -185,13 +184,13 @@ class AzureRMADPassword(AzureRMModuleBase):
                 return
             elif self.app_id or self.service_principal_object_id:
                 if not self.app_id:
-                    sp = asyncio.get_event_loop().run_until_complete(self.get_service_principal())
+                    sp = self.run_async(self.get_service_principal())
                     self.app_id = sp.app_id
                 if not self.app_id:
                     self.fail("can't resolve app via service principal object id {0}".format(
                         self.service_principal_object_id))
 
-                apps = asyncio.get_event_loop().run_until_complete(self.get_applications())
+                apps = self.run_async(self.get_applications())
                 result = list(apps.value)
                 if result:
                     self.app_object_id = result[0].id
@@ -206,7 +205,7 @@ class AzureRMADPassword(AzureRMModuleBase):
     def get_all_passwords(self):
 
         try:
-            application = asyncio.get_event_loop().run_until_complete(self.get_application())
+            application = self.run_async(self.get_application())
             passwordCredentials = application.password_credentials
             return passwordCredentials
         except Exception as ge:
@@ -218,8 +217,8 @@ class AzureRMADPassword(AzureRMModuleBase):
             self.results['changed'] = False
             return
         try:
-            for pd in old_passwords:
-                asyncio.get_event_loop().run_until_complete(self.remove_password(pd.key_id))
+            # removals rewrite the password credentials of the same application, keep them one at a time
+            self.run_async_batch([self.remove_password(pd.key_id) for pd in old_passwords], max_concurrency=1)
             self.results['changed'] = True
         except Exception as ge:
             self.fail("fail to purge all passwords for app: {0} - {1}".format(self.app_object_id, str(ge)))
@@ -234,7 +233,7 @@ class AzureRMADPassword(AzureRMModuleBase):
         for pd in old_passwords:
             if str(pd.key_id) == self.key_id:
                 try:
-                    asyncio.get_event_loop().run_until_complete(self.remove_password(pd.key_id))
+                    self.run_async(self.remove_password(pd.key_id))
 
                     num_of_passwords_after_delete = len(self.get_all_passwords())
                     if num_of_passwords_after_delete != num_of_passwords_before_delete:
@@ -257,7 +256,7 @@ class AzureRMADPassword(AzureRMModuleBase):
                     display_name=display_name
                 ),
             )
-            pd = asyncio.get_event_loop().run_until_complete(self.add_password(request_body))
+            pd = self.run_async(self.add_password(request_body))
 
             num_of_passwords_after_add = len(self.get_all_passwords())
             if num_of_passwords_after_add != num_of_passwords_before_add:
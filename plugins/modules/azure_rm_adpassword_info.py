@@ -100,7 +100,6 @@ passwords:
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
-    import asyncio
     from msgraph.generated.applications.applications_request_builder import ApplicationsRequestBuilder
 except ImportError:
     # This is handled in azure_rm_common
@@ -157,13 +156,13 @@ class AzureRMADPasswordInfo(AzureRMModuleBase):
                 return
             elif self.app_id or self.service_principal_object_id:
                 if not self.app_id:
-                    sp = asyncio.get_event_loop().run_until_complete(self.get_service_principal())
+                    sp = self.run_async(self.get_service_principal())
                     self.app_id = sp.app_id
                 if not self.app_id:
                     self.fail("can't resolve app via service principal object id {0}".format(
                         self.service_principal_object_id))
 
-                apps = asyncio.get_event_loop().run_until_complete(self.get_applications())
+                apps = self.run_async(self.get_applications())
                 result = list(apps.value)
                 if result:
                     self.app_object_id = result[0].id
@@ -178,7 +177,7 @@ class AzureRMADPasswordInfo(AzureRMModuleBase):
     def get_all_passwords(self):
 
         try:
-            application = asyncio.get_event_loop().run_until_complete(self.get_application())
+            application = self.run_async(self.get_application())
             passwordCredentials = application.password_credentials
             return passwordCredentials
         except Exception as ge:
@@ -90,7 +90,6 @@ except Exception:
     pass
 
 try:
-    import asyncio
     from msgraph.generated.service_principals.service_principals_request_builder import ServicePrincipalsRequestBuilder
 except ImportError:
     # This is handled in azure_rm_common
@@ -142,7 +141,7 @@ class AzureRMADServicePrincipal(AzureRMModuleBaseExt):
 
     def create_resource(self):
         try:
-            response = asyncio.get_event_loop().run_until_complete(self.create_service_principal())
+            response = self.run_async(self.create_service_principal())
             self.results['changed'] = True
             self.results.update(self.to_dict(response))
             return response
@@ -159,7 +158,7 @@ class AzureRMADServicePrincipal(AzureRMModuleBaseExt):
                     app_role_assignment_required=self.app_role_assignment_required
                 )
 
-            asyncio.get_event_loop().run_until_complete(self.update_service_principal(old_response, request_body))
+            self.run_async(self.update_service_principal(old_response, request_body))
             self.results['changed'] = True
             self.results.update(self.get_resource())
 
@@ -168,7 +167,7 @@ class AzureRMADServicePrincipal(AzureRMModuleBaseExt):
 
     def delete_resource(self, response):
         try:
-            asyncio.get_event_loop().run_until_complete(self.delete_service_principal(response))
+            self.run_async(self.delete_service_principal(response))
             self.results['changed'] = True
             return True
         except Exception as ge:
@@ -176,7 +175,7 @@ class AzureRMADServicePrincipal(AzureRMModuleBaseExt):
 
     def get_resource(self):
         try:
-            sps = asyncio.get_event_loop().run_until_complete(self.get_service_principals())
+            sps = self.run_async(self.get_service_principals())
             result = list(sps.value)
             if not result:
                 return False
@@ -84,7 +84,6 @@ service_principals:
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 
 try:
-    import asyncio
     from msgraph.generated.service_principals.service_principals_request_builder import ServicePrincipalsRequestBuilder
 except ImportError:
     # This is handled in azure_rm_common
@@ -119,9 +118,9 @@ class AzureRMADServicePrincipalInfo(AzureRMModuleBase):
 
         try:
             if self.object_id is None:
-                service_principals = asyncio.get_event_loop().run_until_complete(self.get_service_principals())
+                service_principals = self.run_async(self.get_service_principals())
             else:
-                service_principals = [asyncio.get_event_loop().run_until_complete(self.get_service_principal())]
+                service_principals = [self.run_async(self.get_service_principal())]
 
             self.results['service_principals'] = [self.to_dict(sp) for sp in service_principals]
         except Exception as ge:
@@ -210,7 +210,6 @@ company_name:
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 
 try:
-    import asyncio
     from msgraph.generated.models.password_profile import PasswordProfile
     from msgraph.generated.models.user import User
     from msgraph.generated.users.users_request_builder import UsersRequestBuilder
@@ -323,7 +322,7 @@ class AzureRMADUser(AzureRMModuleBase):
                         should_update = True
 
                     if should_update:
-                        asyncio.get_event_loop().run_until_complete(self.update_user(ad_user, password))
+                        self.run_async(self.update_user(ad_user, password))
 
                         self.results['changed'] = True
 
@@ -335,7 +334,7 @@ class AzureRMADUser(AzureRMModuleBase):
                         self.results['changed'] = False
 
                 else:  # Create, changed
-                    asyncio.get_event_loop().run_until_complete(self.create_user())
+                    self.run_async(self.create_user())
                     self.results['changed'] = True
                     ad_user = self.get_exisiting_user()
 
@@ -343,7 +342,7 @@ class AzureRMADUser(AzureRMModuleBase):
 
             elif self.state == 'absent':
                 if ad_user:  # Delete, changed
-                    asyncio.get_event_loop().run_until_complete(self.delete_user(ad_user))
+                    self.run_async(self.delete_user(ad_user))
                     self.results['changed'] = True
                 else:  # Do nothing unchanged
                     self.results['changed'] = False
@@ -358,12 +357,12 @@ class AzureRMADUser(AzureRMModuleBase):
 
         try:
             if self.user_principal_name is not None:
-                ad_user = asyncio.get_event_loop().run_until_complete(self.get_user(self.user_principal_name))
+                ad_user = self.run_async(self.get_user(self.user_principal_name))
             elif self.object_id is not None:
-                ad_user = asyncio.get_event_loop().run_until_complete(self.get_user(self.object_id))
+                ad_user = self.run_async(self.get_user(self.object_id))
             elif self.attribute_name is not None and self.attribute_value is not None:
                 try:
-                    users = asyncio.get_event_loop().run_until_complete(
+                    users = self.run_async(
                         self.get_users_by_filter("{0} eq '{1}'".format(self.attribute_name, self.attribute_value)))
                     ad_users = list(users.value)
                     ad_user = ad_users[0]
@@ -371,14 +370,14 @@ class AzureRMADUser(AzureRMModuleBase):
                     # the type doesn't get more specific. Could check the error message but no guarantees that message doesn't change in the future
                     # more stable to try again assuming the first error came from the attribute being a list
                     try:
-                        users = asyncio.get_event_loop().run_until_complete(self.get_users_by_filter(
+                        users = self.run_async(self.get_users_by_filter(
                             "{0}/any(c:c eq '{1}')".format(self.attribute_name, self.attribute_value)))
                         ad_users = list(users.value)
                         ad_user = ad_users[0]
                     except Exception as sub_e:
                         raise
             elif self.odata_filter is not None:  # run a filter based on user input to return based on any given attribute/query
-                users = asyncio.get_event_loop().run_until_complete(self.get_users_by_filter(self.odata_filter))
+                users = self.run_async(self.get_users_by_filter(self.odata_filter))
                 ad_users = list(users.value)
                 ad_user = ad_users[0]
         except Exception as e:
@@ -58,6 +58,39 @@ options:
             - It is recommended that you instead identify a subset of users and use filter.
             - Mutually exclusive with I(object_id), I(attribute_name), I(odata_filter) and I(user_principal_name).
         type: bool
+    delta_link_path:
+        description:
+            - Path of a file holding the Microsoft Graph delta link returned as I(delta_link) by a previous run.
+            - When the file doesn't exist yet or is empty, all users are returned.
+            - On later runs only the users created or changed since the previous run are returned, and the object IDs
+              of deleted users are returned in I(removed_object_ids).
+            - If the saved delta link has expired, all users are returned again.
+            - Changed users only carry the properties that changed, their other properties are returned as C(None).
+            - The module only reads the file. Save the returned I(delta_link) to it for the next run, for example with M(ansible.builtin.copy).
+            - Mutually exclusive with I(object_id), I(attribute_name), I(odata_filter), I(user_principal_name) and I(all).
+        type: path
+    max_results:
+        description:
+            - Maximum number of users returned when listing users with I(all), I(odata_filter) or I(attribute_name).
+            - Not used with I(delta_link_path).
+            - Users are fetched 999 per page and listing stops as soon as this many users have been returned.
+        type: int
+    select:
+        description:
+            - The user attributes to return. Only these attributes are requested from Microsoft Graph.
+            - I(object_id) is always returned.
+            - All attributes are returned by default.
+        type: list
+        elements: str
+        choices:
+            - object_id
+            - display_name
+            - user_principal_name
+            - mail_nickname
+            - mail
+            - account_enabled
+            - user_type
+            - company_name
 extends_documentation_fragment:
     - azure.azcollection.azure
 
@@ -92,6 +125,23 @@ EXAMPLES = '''
 - name: Using Filter proxyAddresses
   azure.azcollection.azure_rm_aduser_info:
     odata_filter: proxyAddresses/any(c:c eq 'SMTP:user@contoso.com')
+
+- name: List the principal names of the first 5000 users
+  azure.azcollection.azure_rm_aduser_info:
+    all: true
+    max_results: 5000
+    select:
+      - user_principal_name
+
+- name: Return the users changed since the previous run
+  azure.azcollection.azure_rm_aduser_info:
+    delta_link_path: /var/lib/identity-sync/users.delta
+  register: users_delta
+
+- name: Save the delta link for the next run
+  ansible.builtin.copy:
+    content: "{{ users_delta.delta_link }}"
+    dest: /var/lib/identity-sync/users.delta
 '''
 
 RETURN = '''
@@ -143,17 +193,46 @@ company_name:
     type: str
     returned: always
     sample: "Test Company"
+removed_object_ids:
+    description:
+        - The object IDs of the users deleted since the previous run.
+    type: list
+    returned: when I(delta_link_path) is set
+    sample: ["xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx"]
+delta_link:
+    description:
+        - The Microsoft Graph delta link to read the next changes from, to be saved to I(delta_link_path) for the next run.
+    type: str
+    returned: when I(delta_link_path) is set
+    sample: https://graph.microsoft.com/v1.0/users/delta()?$deltatoken=xxxx
 '''
 
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_graphdelta import read_delta_link
 
 try:
-    import asyncio
+    from kiota_abstractions.api_error import APIError
     from msgraph.generated.users.users_request_builder import UsersRequestBuilder
+    from msgraph.generated.users.delta.delta_request_builder import DeltaRequestBuilder
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
+# returned attribute name -> Microsoft Graph property name
+USER_ATTRIBUTES = dict(
+    object_id='id',
+    display_name='displayName',
+    user_principal_name='userPrincipalName',
+    mail_nickname='mailNickname',
+    mail='mail',
+    account_enabled='accountEnabled',
+    user_type='userType',
+    company_name='companyName'
+)
+
+# largest page size Microsoft Graph accepts for users
+PAGE_SIZE = 999
+
 
 class AzureRMADUserInfo(AzureRMModuleBase):
     def __init__(self):
@@ -165,6 +244,9 @@ class AzureRMADUserInfo(AzureRMModuleBase):
             attribute_value=dict(type='str'),
             odata_filter=dict(type='str'),
             all=dict(type='bool'),
+            delta_link_path=dict(type='path'),
+            max_results=dict(type='int'),
+            select=dict(type='list', elements='str', choices=list(USER_ATTRIBUTES.keys())),
         )
 
         self.user_principal_name = None
@@ -173,14 +255,17 @@ class AzureRMADUserInfo(AzureRMModuleBase):
         self.attribute_value = None
         self.odata_filter = None
         self.all = None
+        self.delta_link_path = None
+        self.max_results = None
+        self.select = None
         self.log_path = None
         self.log_mode = None
 
         self.results = dict(changed=False)
 
-        mutually_exclusive = [['odata_filter', 'attribute_name', 'object_id', 'user_principal_name', 'all']]
+        mutually_exclusive = [['odata_filter', 'attribute_name', 'object_id', 'user_principal_name', 'all', 'delta_link_path']]
         required_together = [['attribute_name', 'attribute_value']]
-        required_one_of = [['odata_filter', 'attribute_name', 'object_id', 'user_principal_name', 'all']]
+        required_one_of = [['odata_filter', 'attribute_name', 'object_id', 'user_principal_name', 'all', 'delta_link_path']]
 
         super(AzureRMADUserInfo, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                 supports_check_mode=True,
@@ -201,31 +286,32 @@ class AzureRMADUserInfo(AzureRMModuleBase):
             self._client = self.get_msgraph_client()
 
             if self.user_principal_name is not None:
-                ad_users = [asyncio.get_event_loop().run_until_complete(self.get_user(self.user_principal_name))]
+                ad_users = [self.to_dict(self.run_async(self.get_user(self.user_principal_name)))]
             elif self.object_id is not None:
-                ad_users = [asyncio.get_event_loop().run_until_complete(self.get_user(self.object_id))]
+                ad_users = [self.to_dict(self.run_async(self.get_user(self.object_id)))]
             elif self.attribute_name is not None and self.attribute_value is not None:
                 try:
-                    users = asyncio.get_event_loop().run_until_complete(
+                    ad_users = self.run_async(
                         self.get_users_by_filter("{0} eq '{1}'".format(self.attribute_name, self.attribute_value)))
-                    ad_users = list(users.value)
                 except Exception as e:
                     # the type doesn't get more specific. Could check the error message but no guarantees that message doesn't change in the future
                     # more stable to try again assuming the first error came from the attribute being a list
                     try:
-                        users = asyncio.get_event_loop().run_until_complete(self.get_users_by_filter(
+                        ad_users = self.run_async(self.get_users_by_filter(
                             "{0}/any(c:c eq '{1}')".format(self.attribute_name, self.attribute_value)))
-                        ad_users = list(users.value)
                     except Exception as sub_e:
                         raise
             elif self.odata_filter is not None:  # run a filter based on user input to return based on any given attribute/query
-                users = asyncio.get_event_loop().run_until_complete(self.get_users_by_filter(self.odata_filter))
-                ad_users = list(users.value)
+                ad_users = self.run_async(self.get_users_by_filter(self.odata_filter))
             elif self.all:
                 # this returns as a list, since we parse multiple pages
-                ad_users = asyncio.get_event_loop().run_until_complete(self.get_users())
+                ad_users = self.run_async(self.get_users())
+            elif self.delta_link_path is not None:
+                ad_users, removed_object_ids, delta_link = self.run_async(self.get_users_delta(read_delta_link(self.delta_link_path)))
+                self.results['removed_object_ids'] = removed_object_ids
+                self.results['delta_link'] = delta_link
 
-            self.results['ad_users'] = [self.to_dict(user) for user in ad_users]
+            self.results['ad_users'] = ad_users
 
         except Exception as e:
             self.fail("failed to get ad user info {0}".format(str(e)))
@@ -233,7 +319,7 @@ class AzureRMADUserInfo(AzureRMModuleBase):
         return self.results
 
     def to_dict(self, object):
-        return dict(
+        result = dict(
             object_id=object.id,
             display_name=object.display_name,
             user_principal_name=object.user_principal_name,
@@ -243,43 +329,82 @@ class AzureRMADUserInfo(AzureRMModuleBase):
             user_type=object.user_type,
             company_name=object.company_name
         )
+        if self.select:
+            return dict((key, value) for key, value in result.items() if key == 'object_id' or key in self.select)
+        return result
+
+    def graph_select(self):
+        attributes = self.select or USER_ATTRIBUTES.keys()
+        return sorted(set(USER_ATTRIBUTES[attribute] for attribute in attributes) | set(['id']))
 
     async def get_user(self, object):
         request_configuration = UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
             query_parameters=UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
-                select=["accountEnabled", "displayName", "mail", "mailNickname", "id", "userPrincipalName", "userType", "companyName"]
+                select=self.graph_select()
             ),
         )
         return await self._client.users.by_user_id(object).get(request_configuration=request_configuration)
 
-    async def get_users(self):
+    async def get_users(self, filter=None):
+        page_size = PAGE_SIZE
+        if self.max_results:
+            page_size = min(page_size, self.max_results)
         request_configuration = UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
             query_parameters=UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
-                select=["accountEnabled", "displayName", "mail", "mailNickname", "id", "userPrincipalName", "userType", "companyName"]
+                filter=filter,
+                select=self.graph_select(),
+                top=page_size,
+                count=True if filter else None
             ),
         )
         users = []
-        # paginated response can be quite large
+        # paginated response can be quite large, convert every page as it arrives so the SDK objects can be released
         response = await self._client.users.get(request_configuration=request_configuration)
-        if response:
-            users += response.value
-        while response is not None and response.odata_next_link is not None:
-            response = await self._client.users.with_url(response.odata_next_link).get(request_configuration=request_configuration)
-            if response:
-                users += response.value
+        while response is not None:
+            for user in response.value or []:
+                if self.max_results and len(users) >= self.max_results:
+                    return users
+                users.append(self.to_dict(user))
+            if response.odata_next_link is None or (self.max_results and len(users) >= self.max_results):
+                break
+            response = await self._client.users.with_url(response.odata_next_link).get()
 
         return users
 
     async def get_users_by_filter(self, filter):
-        return await self._client.users.get(
-            request_configuration=UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
-                query_parameters=UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
-                    filter=filter,
-                    select=["accountEnabled", "displayName", "mail", "mailNickname", "id", "userPrincipalName",
-                            "userType", "companyName"],
-                    count=True
-                ),
-            ))
+        return await self.get_users(filter=filter)
+
+    async def get_users_delta(self, delta_link=None):
+        delta = self._client.users.delta
+        try:
+            if delta_link:
+                response = await delta.with_url(delta_link).get()
+            else:
+                request_configuration = DeltaRequestBuilder.DeltaRequestBuilderGetRequestConfiguration(
+                    query_parameters=DeltaRequestBuilder.DeltaRequestBuilderGetQueryParameters(
+                        select=self.graph_select(),
+                    ),
+                )
+                response = await delta.get(request_configuration=request_configuration)
+        except APIError as e:
+            # an expired delta token can't be resumed, start a full sync again
+            if delta_link and e.response_status_code in (400, 410):
+                return await self.get_users_delta()
+            raise
+
+        users = []
+        removed_object_ids = []
+        while response is not None:
+            for user in response.value or []:
+                if user.additional_data and '@removed' in user.additional_data:
+                    removed_object_ids.append(user.id)
+                else:
+                    users.append(self.to_dict(user))
+            if response.odata_next_link is None:
+                break
+            response = await delta.with_url(response.odata_next_link).get()
+
+        return users, removed_object_ids, response.odata_delta_link if response is not None else None
 
 
 def main():
@@ -407,6 +407,14 @@ options:
                                 description:
                                     - The client ID of the user assigned identity.
                                 type: str
+    cache_ttl:
+        description:
+            - Seconds the Kubernetes versions available in the location, used to validate I(kubernetes_version), are cached
+              on disk in C(~/.ansible/azure_rm_cache).
+            - M(azure.azcollection.azure_rm_aksversion_info) reads and writes the same cache entries.
+            - Set to C(0) to disable the cache.
+        type: int
+        default: 3600
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -607,8 +615,30 @@ state:
         }
         tags: {}
         type: Microsoft.ContainerService/ManagedClusters
+agent_pool_operations:
+    description:
+        - The agent pools that were created or deleted because agent pools were added to or removed from I(agent_pool_profiles).
+        - The operations run concurrently. A system pool is only deleted once another system pool exists.
+    returned: when agent pools were added or removed
+    type: list
+    elements: dict
+    sample: [
+        {
+            "name": "pool2",
+            "operation": "create",
+            "succeeded": true,
+            "error": null
+        },
+        {
+            "name": "pool1",
+            "operation": "delete",
+            "succeeded": true,
+            "error": null
+        }
+    ]
 '''
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_aksversion import list_orchestrators, AKS_METADATA_CACHE_TTL
 
 try:
     from azure.core.exceptions import ResourceNotFoundError
@@ -917,7 +947,8 @@ class AzureRMManagedCluster(AzureRMModuleBaseExt):
                         )
                     )
                 )
-            )
+            ),
+            cache_ttl=dict(type='int', default=AKS_METADATA_CACHE_TTL)
         )
 
         self.resource_group = None
@@ -937,6 +968,7 @@ class AzureRMManagedCluster(AzureRMModuleBaseExt):
         self.addon = None
         self.node_resource_group = None
         self.pod_identity_profile = None
+        self.cache_ttl = None
 
         required_if = [
             ('state', 'present', [
@@ -1118,20 +1150,32 @@ class AzureRMManagedCluster(AzureRMModuleBaseExt):
                         else:
                             self.pod_identity_profile = response['pod_identity_profile']
 
+            agent_pool_operations = None
             if update_agentpool:
                 self.log("Need to update agentpool")
+                response_profile_name_list = [response_profile['name'] for response_profile in response['agent_pool_profiles']]
+                self_profile_name_list = [self_profile['name'] for self_profile in self.agent_pool_profiles]
+                to_update = [name for name in self_profile_name_list if name not in response_profile_name_list]
+                to_delete = [name for name in response_profile_name_list if name not in self_profile_name_list]
+                system_pools = [profile['name'] for profile in response['agent_pool_profiles']
+                                if profile['mode'] == 'System' and profile['name'] not in to_delete]
+                system_pools.extend(profile['name'] for profile in self.agent_pool_profiles if profile['mode'] == 'System' and profile['name'] in to_update)
+                deleted_system_pools = [profile['name'] for profile in response['agent_pool_profiles']
+                                        if profile['mode'] == 'System' and profile['name'] in to_delete]
+                if deleted_system_pools and not system_pools:
+                    self.fail("Cannot delete agentpools {0}, at least one agentpool with mode System must remain".format(deleted_system_pools))
                 if not self.check_mode:
-                    response_profile_name_list = [response_profile['name'] for response_profile in response['agent_pool_profiles']]
-                    self_profile_name_list = [self_profile['name'] for self_profile in self.agent_pool_profiles]
-                    to_update = list(set(self_profile_name_list) - set(response_profile_name_list))
-                    to_delete = list(set(response_profile_name_list) - set(self_profile_name_list))
-                    if len(to_delete) > 0:
-                        self.delete_agentpool(to_delete)
-                        for profile in self.results['agent_pool_profiles']:
-                            if profile['name'] in to_delete:
-                                self.results['agent_pool_profiles'].remove(profile)
-                    if len(to_update) > 0:
-                        self.results['agent_pool_profiles'].extend(self.create_update_agentpool(to_update))
+                    agent_pool_operations = self.update_agentpools(response['agent_pool_profiles'], to_update, to_delete)
+                    deleted = [operation['name'] for operation in agent_pool_operations if operation['operation'] == 'delete' and operation['succeeded']]
+                    self.results['agent_pool_profiles'] = [profile for profile in self.results['agent_pool_profiles'] if profile['name'] not in deleted]
+                    self.results['agent_pool_profiles'].extend(operation.pop('profile') for operation in agent_pool_operations
+                                                               if operation['operation'] == 'create' and operation['succeeded'])
+                    self.results['agent_pool_operations'] = agent_pool_operations
+                    failed = [operation for operation in agent_pool_operations if not operation['succeeded']]
+                    if failed:
+                        self.fail("Error attempting to update AKS agentpools: {0}".format(
+                                  ', '.join('{0} {1}: {2}'.format(operation['operation'], operation['name'], operation['error']) for operation in failed)),
+                                  agent_pool_operations=agent_pool_operations)
                     self.log("Creation / Update done")
                 self.results['changed'] = True
 
@@ -1140,6 +1184,8 @@ class AzureRMManagedCluster(AzureRMModuleBaseExt):
 
                 if not self.check_mode:
                     self.results = self.create_update_aks()
+                    if agent_pool_operations:
+                        self.results['agent_pool_operations'] = agent_pool_operations
                     self.log("Creation / Update done")
 
                 self.results['changed'] = True
@@ -1239,40 +1285,91 @@ class AzureRMManagedCluster(AzureRMModuleBaseExt):
         except Exception as exc:
             self.fail("Error attempting to update AKS tags: {0}".format(exc.message))
 
-    def create_update_agentpool(self, to_update_name_list):
-        response_all = []
-        for profile in self.agent_pool_profiles:
-            if (profile['name'] in to_update_name_list):
-                self.log("Creating / Updating the AKS agentpool {0}".format(profile['name']))
-                parameters = self.managedcluster_models.AgentPool(
-                    count=profile["count"],
-                    vm_size=profile["vm_size"],
-                    os_disk_size_gb=profile["os_disk_size_gb"],
-                    max_count=profile["max_count"],
-                    node_labels=profile["node_labels"],
-                    min_count=profile["min_count"],
-                    orchestrator_version=profile["orchestrator_version"],
-                    max_pods=profile["max_pods"],
-                    enable_auto_scaling=profile["enable_auto_scaling"],
-                    agent_pool_type=profile["type"],
-                    mode=profile["mode"]
-                )
-                try:
-                    poller = self.managedcluster_client.agent_pools.begin_create_or_update(self.resource_group, self.name, profile["name"], parameters)
-                    response = self.get_poller_result(poller)
-                    response_all.append(response)
-                except Exception as exc:
-                    self.fail("Error attempting to update AKS agentpool: {0}".format(exc.message))
-        return create_agent_pool_profiles_dict(response_all)
-
-    def delete_agentpool(self, to_delete_name_list):
-        for name in to_delete_name_list:
-            self.log("Deleting the AKS agentpool {0}".format(name))
+    def update_agentpools(self, current_profiles, to_update_name_list, to_delete_name_list):
+        '''
+        Creates and deletes agentpools concurrently.
+
+        System pools are deleted together with the other operations only when an existing system pool is kept,
+        otherwise they are deleted after the new pools were created, as a cluster must always have a system pool.
+
+        :return: list of dict with the name, operation, succeeded and error of every agentpool operation
+        '''
+        kept_system_pools = [profile['name'] for profile in current_profiles if profile['mode'] == 'System' and profile['name'] not in to_delete_name_list]
+        system_pool_names = [profile['name'] for profile in current_profiles if profile['mode'] == 'System']
+        deferred = [] if kept_system_pools else [name for name in to_delete_name_list if name in system_pool_names]
+
+        operations = [('create', name) for name in to_update_name_list]
+        operations.extend(('delete', name) for name in to_delete_name_list if name not in deferred)
+        results = self.run_agentpool_operations(operations)
+
+        if deferred:
+            new_system_pools = [profile['name'] for profile in self.agent_pool_profiles if profile['mode'] == 'System']
+            if any(result['succeeded'] for result in results if result['operation'] == 'create' and result['name'] in new_system_pools):
+                results.extend(self.run_agentpool_operations([('delete', name) for name in deferred]))
+            else:
+                results.extend(dict(name=name,
+                                    operation='delete',
+                                    succeeded=False,
+                                    error='Not deleted as no new agentpool with mode System was created') for name in deferred)
+        return results
+
+    def run_agentpool_operations(self, operations):
+        '''
+        Starts all agentpool operations and waits for them together.
+
+        :param operations: list of (operation, agentpool name) with operation create or delete
+        :return: list of dict with the name, operation, succeeded and error of every operation
+        '''
+        results = []
+        pollers = []
+        for operation, name in operations:
+            result = dict(name=name, operation=operation, succeeded=False, error=None)
             try:
-                poller = self.managedcluster_client.agent_pools.begin_delete(self.resource_group, self.name, name)
-                self.get_poller_result(poller)
+                if operation == 'create':
+                    profile = [profile for profile in self.agent_pool_profiles if profile['name'] == name][0]
+                    pollers.append(self.create_update_agentpool(profile))
+                else:
+                    pollers.append(self.delete_agentpool(name))
+                results.append(result)
             except Exception as exc:
-                self.fail("Error attempting to update AKS agentpool: {0}".format(exc.message))
+                result['error'] = str(exc)
+                results.append(result)
+                pollers.append(None)
+
+        started = [poller for poller in pollers if poller is not None]
+        responses = iter(self.get_multiple_pollers_results(started, wait=5, return_exceptions=True) if started else [])
+        for result, poller in zip(results, pollers):
+            if poller is None:
+                continue
+            response = next(responses)
+            if isinstance(response, Exception):
+                result['error'] = str(response)
+                continue
+            result['succeeded'] = True
+            if result['operation'] == 'create':
+                result['profile'] = create_agent_pool_profiles_dict([response])[0]
+        return results
+
+    def create_update_agentpool(self, profile):
+        self.log("Creating / Updating the AKS agentpool {0}".format(profile['name']))
+        parameters = self.managedcluster_models.AgentPool(
+            count=profile["count"],
+            vm_size=profile["vm_size"],
+            os_disk_size_gb=profile["os_disk_size_gb"],
+            max_count=profile["max_count"],
+            node_labels=profile["node_labels"],
+            min_count=profile["min_count"],
+            orchestrator_version=profile["orchestrator_version"],
+            max_pods=profile["max_pods"],
+            enable_auto_scaling=profile["enable_auto_scaling"],
+            agent_pool_type=profile["type"],
+            mode=profile["mode"]
+        )
+        return self.managedcluster_client.agent_pools.begin_create_or_update(self.resource_group, self.name, profile["name"], parameters)
+
+    def delete_agentpool(self, name):
+        self.log("Deleting the AKS agentpool {0}".format(name))
+        return self.managedcluster_client.agent_pools.begin_delete(self.resource_group, self.name, name)
 
     def delete_aks(self):
         '''
@@ -1310,10 +1407,8 @@ class AzureRMManagedCluster(AzureRMModuleBaseExt):
     def get_all_versions(self):
         try:
             result = dict()
-            response = self.containerservice_client.container_services.list_orchestrators(self.location, resource_type='managedClusters')
-            orchestrators = response.orchestrators
-            for item in orchestrators:
-                result[item.orchestrator_version] = [x.orchestrator_version for x in item.upgrades] if item.upgrades else []
+            for item in list_orchestrators(self, self.location, self.cache_ttl):
+                result[item['orchestrator_version']] = [x['orchestrator_version'] for x in item['upgrades']]
             return result
         except Exception as exc:
             self.fail('Error when getting AKS supported kubernetes version list for location {0} - {1}'.format(self.location, exc.message or str(exc)))
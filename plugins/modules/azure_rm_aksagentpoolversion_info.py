@@ -96,14 +96,10 @@ class AzureRMAksAgentPoolVersion(AzureRMModuleBase):
         Get all avaliable orchestrator version
         '''
         try:
-            result = list()
             response = self.managedcluster_client.agent_pools.get_available_agent_pool_versions(self.resource_group, self.cluster_name)
-            orchestrators = response.agent_pool_versions
-            for item in orchestrators:
-                result.append(item.kubernetes_version)
-            return result
+            return [item.kubernetes_version for item in response.agent_pool_versions]
         except Exception as exc:
-            self.fail('Error when getting Agentpool supported orchestrator version list for locatio', exc)
+            self.fail('Error when getting Agentpool supported orchestrator version list for location - {0}'.format(str(exc)))
 
 
 def main():
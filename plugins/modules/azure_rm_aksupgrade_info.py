@@ -30,6 +30,14 @@ options:
             - Name of the managed Azure Container Services (AKS) instance.
         required: true
         type: str
+    cache_ttl:
+        description:
+            - Seconds the upgrade profile of the cluster is cached on disk, in C(~/.ansible/azure_rm_cache).
+            - The cache entry is keyed by the location and the Kubernetes versions of the control plane and agent pools, so
+              clusters running the same versions in a location share it. The cluster itself is still read on every run.
+            - Set to C(0) to disable the cache.
+        type: int
+        default: 3600
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -110,7 +118,8 @@ azure_aks_upgrades:
                     sample: "1.18.1"
 '''
 
-from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, normalize_location_name
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_aksversion import AKS_METADATA_CACHE_TTL
 
 try:
     from azure.core.exceptions import ResourceNotFoundError
@@ -128,7 +137,8 @@ class AzureRMAKSUpgrade(AzureRMModuleBase):
 
         self.module_args = dict(
             name=dict(type='str', required=True),
-            resource_group=dict(type='str', required=True)
+            resource_group=dict(type='str', required=True),
+            cache_ttl=dict(type='int', default=AKS_METADATA_CACHE_TTL)
         )
 
         self.results = dict(
@@ -138,6 +148,7 @@ class AzureRMAKSUpgrade(AzureRMModuleBase):
 
         self.name = None
         self.resource_group = None
+        self.cache_ttl = None
 
         super(AzureRMAKSUpgrade, self).__init__(
             derived_arg_spec=self.module_args,
@@ -162,7 +173,6 @@ class AzureRMAKSUpgrade(AzureRMModuleBase):
         :return: dict with available versions for pool profiles and control plane
         '''
         cluster = None
-        upgrade_profiles = None
 
         self.log('Get properties for {0}'.format(self.name))
         try:
@@ -170,6 +180,24 @@ class AzureRMAKSUpgrade(AzureRMModuleBase):
         except ResourceNotFoundError as err:
             self.fail('Error when getting AKS cluster information for {0} : {1}'.format(self.name, err.message or str(err)))
 
+        # the upgrade versions only depend on the location and the versions the cluster runs
+        key = dict(location=normalize_location_name(cluster.location),
+                   kubernetes_version=cluster.kubernetes_version,
+                   agent_pool_profiles=[[profile.name, profile.orchestrator_version, profile.os_type]
+                                        for profile in cluster.agent_pool_profiles or []])
+        return self.get_cached_metadata('aks_upgrades', key, self.cache_ttl,
+                                        lambda: self.get_upgrade_profile(cluster, name, resource_group))
+
+    def get_upgrade_profile(self, cluster, name, resource_group):
+        '''
+        Get the upgrade profile of an AKS cluster
+        :param: cluster: ManagedCluster with AKS instance information
+        :param: name: str with name of AKS cluster instance
+        :param: resource_group: str with resource group containing AKS instance
+        :return: dict with available versions for pool profiles and control plane
+        '''
+        upgrade_profiles = None
+
         self.log('Get available upgrade versions for {0}'.format(self.name))
         try:
             upgrade_profiles = self.managedcluster_client.managed_clusters.get_upgrade_profile(resource_group_name=resource_group,
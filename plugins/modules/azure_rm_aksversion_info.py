@@ -36,6 +36,14 @@ options:
             - If I(allow_preview=False), returns the Kubernetes version in a non-current preview state.
             - If no set C(allow_preview), returns all the avaiable Kubernetes version.
         type: bool
+    cache_ttl:
+        description:
+            - Seconds the Kubernetes versions available in the location are cached on disk, in C(~/.ansible/azure_rm_cache),
+              so repeated runs for the same location query Azure once per period.
+            - M(azure.azcollection.azure_rm_aks) reads and writes the same cache entries.
+            - Set to C(0) to disable the cache.
+        type: int
+        default: 3600
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -66,6 +74,7 @@ azure_aks_versions:
 '''
 
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_aksversion import list_orchestrators, AKS_METADATA_CACHE_TTL
 
 
 class AzureRMAKSVersion(AzureRMModuleBase):
@@ -75,7 +84,8 @@ class AzureRMAKSVersion(AzureRMModuleBase):
         self.module_args = dict(
             location=dict(type='str', required=True),
             version=dict(type='str'),
-            allow_preview=dict(type='bool')
+            allow_preview=dict(type='bool'),
+            cache_ttl=dict(type='int', default=AKS_METADATA_CACHE_TTL)
         )
 
         self.results = dict(
@@ -86,6 +96,7 @@ class AzureRMAKSVersion(AzureRMModuleBase):
         self.location = None
         self.version = None
         self.allow_preview = None
+        self.cache_ttl = None
 
         super(AzureRMAKSVersion, self).__init__(
             derived_arg_spec=self.module_args,
@@ -114,17 +125,9 @@ class AzureRMAKSVersion(AzureRMModuleBase):
         '''
         try:
             result = dict()
-            response = self.containerservice_client.container_services.list_orchestrators(self.location, resource_type='managedClusters')
-            orchestrators = response.orchestrators
-            for item in orchestrators:
-                if self.allow_preview is None:
-                    result[item.orchestrator_version] = [x.orchestrator_version for x in item.upgrades] if item.upgrades else []
-                elif self.allow_preview:
-                    if item.is_preview:
-                        result[item.orchestrator_version] = [x.orchestrator_version for x in item.upgrades] if item.upgrades else []
-                else:
-                    if not item.is_preview:
-                        result[item.orchestrator_version] = [x.orchestrator_version for x in item.upgrades] if item.upgrades else []
+            for item in list_orchestrators(self, self.location, self.cache_ttl):
+                if self.allow_preview is None or self.allow_preview == item['is_preview']:
+                    result[item['orchestrator_version']] = [x['orchestrator_version'] for x in item['upgrades']]
             if version:
                 return result.get(version) or []
             else:
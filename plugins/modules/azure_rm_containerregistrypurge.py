@@ -0,0 +1,430 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2026 xuzhang3 (@xuzhang3), Fred-sun (@Fred-sun)
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_containerregistrypurge
+version_added: "2.4.0"
+short_description: Purge tags and manifests from Azure Container Registry
+description:
+    - Delete stale tags and manifests from the repositories of an Azure Container Registry.
+    - Tags are selected by name pattern, age and number of most recent tags to keep, per repository.
+    - Repositories are listed and tags are deleted in parallel.
+    - Running the module again with the same selection deletes nothing, so the task is idempotent.
+
+options:
+    registry:
+        description:
+            - The name of the container registry.
+        type: str
+        required: true
+    repository_name:
+        description:
+            - Only purge this repository. If omitted, all repositories are purged.
+        type: str
+    repository_prefix:
+        description:
+            - Only purge repositories whose name starts with this prefix.
+            - Ignored when I(repository_name) is set.
+        type: str
+    name_pattern:
+        description:
+            - Only purge tags whose name matches this shell-style wildcard pattern, for example C(build-*).
+            - Tags that don't match are neither deleted nor counted by I(keep).
+        type: str
+    older_than_days:
+        description:
+            - Only purge tags last updated more than this number of days ago.
+        type: int
+    keep:
+        description:
+            - Number of most recently updated matching tags to keep in every repository, regardless of their age.
+        type: int
+    untagged:
+        description:
+            - Also delete manifests that have no tags, and the manifests of purged tags when all of their tags are purged.
+            - Without this option only the tags are deleted and the storage of their manifests isn't reclaimed.
+            - Untagged manifests are subject to I(older_than_days) as well.
+            - The platform-specific manifests of a multi-arch image whose manifest list or OCI index is kept are never deleted,
+              although they have no tags.
+        type: bool
+        default: false
+    max_workers:
+        description:
+            - Maximum number of repositories listed and of tags or manifests deleted in parallel.
+        type: int
+        default: 8
+
+notes:
+    - At least one of I(older_than_days), I(keep) or I(untagged) must be set, the module never purges all tags of a repository implicitly.
+    - Tags and manifests locked against deletion are skipped.
+
+extends_documentation_fragment:
+    - azure.azcollection.azure
+
+author:
+    - xuzhang3 (@xuzhang3)
+    - Fred-sun (@Fred-sun)
+'''
+
+EXAMPLES = '''
+- name: Delete tags older than 30 days, keeping the 5 most recent tags of every repository
+  azure_rm_containerregistrypurge:
+    registry: myRegistry
+    older_than_days: 30
+    keep: 5
+
+- name: Delete build tags and their manifests in the repositories of a team
+  azure_rm_containerregistrypurge:
+    registry: myRegistry
+    repository_prefix: team-a/
+    name_pattern: "build-*"
+    older_than_days: 7
+    untagged: true
+    max_workers: 16
+
+- name: Report what would be deleted in a repository
+  azure_rm_containerregistrypurge:
+    registry: myRegistry
+    repository_name: myRepository
+    keep: 10
+  check_mode: true
+'''
+
+RETURN = '''
+tags:
+    description:
+        - The tags that were deleted, or would be deleted in check mode.
+        - Tags deleted together with their manifest are included.
+    returned: always
+    type: complex
+    contains:
+        repository:
+            description:
+                - The name of the repository.
+            returned: always
+            type: str
+            sample: my-app
+        name:
+            description:
+                - Name of the tag.
+            returned: always
+            type: str
+            sample: build-123
+        digest:
+            description:
+                - Digest of the manifest the tag referenced.
+            returned: always
+            type: str
+            sample: sha256:7bd8fcb425afc34a7865f85868126e9c4fef5b2d6291986524687d289ab3a64a
+        last_updated_on:
+            description:
+                - Datetime of when the tag was last updated.
+            returned: always
+            type: str
+            sample: "2022-02-02T18:18:57.145778+00:00"
+manifests:
+    description:
+        - The manifests that were deleted, or would be deleted in check mode, when I(untagged=true).
+    returned: always
+    type: complex
+    contains:
+        repository:
+            description:
+                - The name of the repository.
+            returned: always
+            type: str
+            sample: my-app
+        digest:
+            description:
+                - Digest of the manifest.
+            returned: always
+            type: str
+            sample: sha256:7bd8fcb425afc34a7865f85868126e9c4fef5b2d6291986524687d289ab3a64a
+        tags:
+            description:
+                - The tags that referenced the manifest.
+            returned: always
+            type: list
+            elements: str
+            sample: ["build-123"]
+errors:
+    description:
+        - The repositories, tags and manifests that could not be listed or deleted.
+        - The module fails after all other deletions are done when this list isn't empty.
+    returned: always
+    type: complex
+    contains:
+        name:
+            description:
+                - The repository, C(repository:tag) or C(repository@digest) that failed.
+            returned: always
+            type: str
+            sample: my-app:build-123
+        error:
+            description:
+                - The error returned by the registry.
+            returned: always
+            type: str
+            sample: "(TAG_UNKNOWN) the specified tag does not exist"
+'''
+
+from datetime import datetime, timedelta, timezone
+
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, map_bounded
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_containerregistry import ContainerRegistryTagScanner
+
+try:
+    from azure.containerregistry import ContainerRegistryClient, ArtifactTagOrder
+    from azure.core.exceptions import ResourceNotFoundError
+except ImportError as exc:
+    # This is handled in azure_rm_common
+    pass
+
+
+# media types of the manifests referencing the manifests of other platforms
+INDEX_MEDIA_TYPES = (
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+)
+
+
+class AzureRMContainerRegistryPurge(AzureRMModuleBase):
+    def __init__(self):
+        self.module_arg_spec = dict(
+            registry=dict(
+                type="str",
+                required=True,
+            ),
+            repository_name=dict(
+                type="str",
+            ),
+            repository_prefix=dict(
+                type="str",
+            ),
+            name_pattern=dict(
+                type="str",
+            ),
+            older_than_days=dict(
+                type="int",
+            ),
+            keep=dict(
+                type="int",
+            ),
+            untagged=dict(
+                type="bool",
+                default=False,
+            ),
+            max_workers=dict(
+                type="int",
+                default=8,
+            ),
+        )
+
+        self.results = dict(
+            changed=False,
+            tags=[],
+            manifests=[],
+            errors=[],
+        )
+
+        self.registry = None
+        self.repository_name = None
+        self.repository_prefix = None
+        self.name_pattern = None
+        self.older_than_days = None
+        self.keep = None
+        self.untagged = None
+        self.max_workers = None
+
+        self._client = None
+        self._cutoff = None
+
+        super(AzureRMContainerRegistryPurge, self).__init__(self.module_arg_spec,
+                                                            supports_check_mode=True,
+                                                            supports_tags=False,
+                                                            facts_module=False)
+
+    def exec_module(self, **kwargs):
+        for key in list(self.module_arg_spec.keys()):
+            setattr(self, key, kwargs[key])
+
+        if self.older_than_days is None and self.keep is None and not self.untagged:
+            self.fail("one of the following is required: older_than_days, keep, untagged")
+        if self.keep is not None and self.keep < 0:
+            self.fail("keep must be 0 or greater")
+
+        if self.older_than_days is not None:
+            self._cutoff = datetime.now(timezone.utc) - timedelta(days=self.older_than_days)
+
+        self._client = self.get_client()
+
+        repositories = self.list_repositories()
+        plans = map_bounded(self.plan_repository, repositories, self.max_workers)
+        tag_deletes = []
+        manifest_deletes = []
+        for (repository_name, dummy), plan in zip(repositories, plans):
+            if isinstance(plan, Exception):
+                self.results["errors"].append(dict(name=repository_name, error=str(plan)))
+                continue
+            tag_deletes.extend(plan[0])
+            manifest_deletes.extend(plan[1])
+
+        self.results["tags"] = [tag for tag, dummy in tag_deletes]
+        self.results["manifests"] = manifest_deletes
+        self.results["changed"] = bool(tag_deletes or manifest_deletes)
+
+        if not self.check_mode:
+            deletes = [(self.delete_manifest, manifest) for manifest in manifest_deletes]
+            # tags of deleted manifests go away with the manifest
+            deletes.extend((self.delete_tag, tag) for tag, covered in tag_deletes if not covered)
+            for (delete, item), result in zip(deletes, map_bounded(lambda delete: delete[0](delete[1]), deletes, self.max_workers)):
+                if isinstance(result, Exception):
+                    self.log(f"Could not delete {format_name(item)} - {str(result)}")
+                    self.results["errors"].append(dict(name=format_name(item), error=str(result)))
+
+        if self.results["errors"]:
+            self.fail(f"Could not purge {len(self.results['errors'])} repositories, tags or manifests", **self.results)
+
+        return self.results
+
+    def get_client(self):
+        registry_endpoint = self.registry if self.registry.endswith(".azurecr.io") else self.registry + ".azurecr.io"
+        return ContainerRegistryClient(
+            endpoint=registry_endpoint,
+            credential=self.azure_auth.azure_credential_track2,
+            audience="https://management.azure.com",
+        )
+
+    def list_repositories(self):
+        # newest first, so the tags to keep are the first ones of every repository
+        scanner = ContainerRegistryTagScanner(self._client,
+                                              name_pattern=self.name_pattern,
+                                              order_by=ArtifactTagOrder.LAST_UPDATED_ON_DESCENDING,
+                                              log=self.log)
+        if self.repository_name:
+            try:
+                return [(self.repository_name, scanner.list_tags(self.repository_name))]
+            except ResourceNotFoundError as e:
+                self.log(f"Could not get ACR tags for {self.repository_name} - {str(e)}")
+                return []
+            except Exception as e:
+                self.fail(f"Could not get ACR tags for {self.repository_name} - {str(e)}")
+
+        try:
+            repositories, errors = scanner.scan(repository_prefix=self.repository_prefix, max_workers=self.max_workers)
+        except Exception as e:
+            self.fail(f"Could not get ACR repositories - {str(e)}")
+        self.results["errors"].extend(errors)
+        return repositories
+
+    def is_stale(self, properties):
+        return self._cutoff is None or properties.last_updated_on < self._cutoff
+
+    def plan_repository(self, repository):
+        '''
+        Selects the tags and manifests to delete in a repository.
+
+        :return: tuple of a list of (tag dict, deleted with its manifest) and a list of manifest dicts
+        '''
+        repository_name, tags = repository
+        selected = []
+        if self.older_than_days is not None or self.keep is not None:
+            for tag in tags[self.keep or 0:]:
+                if not self.is_stale(tag):
+                    continue
+                if tag.can_delete is False:
+                    self.log(f"Skipping locked tag {repository_name}:{tag.name}")
+                    continue
+                selected.append(tag)
+
+        manifests = []
+        covered = set()
+        if self.untagged:
+            selected_names = set(tag.name for tag in selected)
+            candidates = []
+            kept = []
+            for manifest in self._client.list_manifest_properties(repository=repository_name):
+                manifest_tags = manifest.tags or []
+                if manifest_tags:
+                    # only reclaim a manifest once nothing that is kept references it
+                    deletable = selected_names.issuperset(manifest_tags)
+                else:
+                    deletable = self.is_stale(manifest)
+                if deletable and manifest.can_delete is False:
+                    self.log(f"Skipping locked manifest {repository_name}@{manifest.digest}")
+                    deletable = False
+                (candidates if deletable else kept).append(manifest)
+
+            referenced = self.list_referenced_digests(repository_name, kept) if candidates else set()
+            for manifest in candidates:
+                if manifest.digest in referenced:
+                    self.log(f"Skipping manifest {repository_name}@{manifest.digest} referenced by a kept manifest list")
+                    continue
+                manifests.append(dict(repository=repository_name, digest=manifest.digest, tags=list(manifest.tags or [])))
+                covered.update(manifest.tags or [])
+
+        tag_deletes = [(dict(repository=repository_name,
+                             name=tag.name,
+                             digest=tag.digest,
+                             last_updated_on=tag.last_updated_on), tag.name in covered) for tag in selected]
+        return tag_deletes, manifests
+
+    def list_referenced_digests(self, repository_name, manifests):
+        '''
+        Collects the digests of the platform-specific manifests referenced by the manifest lists and OCI indexes
+        among the kept manifests, so they aren't purged as untagged.
+        '''
+        referenced = set()
+        # manifest lists and indexes have no platform of their own
+        pending = [manifest.digest for manifest in manifests if manifest.architecture is None]
+        while pending:
+            results = map_bounded(lambda digest: self._client.get_manifest(repository_name, digest), pending, self.max_workers)
+            pending = []
+            for result in results:
+                if isinstance(result, Exception):
+                    # without the references of a kept manifest nothing untagged can be deleted safely
+                    raise result
+                for child in result.manifest.get("manifests") or []:
+                    if child.get("digest") and child["digest"] not in referenced:
+                        referenced.add(child["digest"])
+                        if child.get("mediaType") in INDEX_MEDIA_TYPES:
+                            pending.append(child["digest"])
+        return referenced
+
+    def delete_tag(self, tag):
+        self.log(f"deleting tag {tag['repository']}:{tag['name']}")
+        try:
+            self._client.delete_tag(repository=tag["repository"], tag=tag["name"])
+        except ResourceNotFoundError:
+            # already deleted
+            pass
+
+    def delete_manifest(self, manifest):
+        self.log(f"deleting manifest {manifest['repository']}@{manifest['digest']}")
+        try:
+            self._client.delete_manifest(repository=manifest["repository"], tag_or_digest=manifest["digest"])
+        except ResourceNotFoundError:
+            # already deleted
+            pass
+
+
+def format_name(item):
+    if "name" in item:
+        return item["repository"] + ":" + item["name"]
+    return item["repository"] + "@" + item["digest"]
+
+
+def main():
+    AzureRMContainerRegistryPurge()
+
+
+if __name__ == "__main__":
+    main()
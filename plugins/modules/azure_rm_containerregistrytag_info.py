@@ -30,6 +30,25 @@ options:
         description:
             - Filter results by tags with a desired name.
         type: str
+    repository_prefix:
+        description:
+            - Only list tags of repositories whose name starts with this prefix.
+            - Ignored when I(repository_name) is set.
+        type: str
+    name_pattern:
+        description:
+            - Filter results by tags whose name matches this shell-style wildcard pattern, for example C(v1.*).
+        type: str
+    last_updated_before:
+        description:
+            - Only return tags last updated before this date and time.
+            - Accepts an ISO 8601 date or date and time. Values without a timezone are treated as UTC.
+        type: str
+    max_workers:
+        description:
+            - Maximum number of repositories whose tags are listed in parallel when all repositories are retrieved.
+        type: int
+        default: 8
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -53,6 +72,14 @@ EXAMPLES = '''
     registry: myRegistry
     repository_name: myRepository
     name: myTag
+
+- name: List tags older than a date in repositories starting with a prefix
+  azure_rm_containerregistrytag_info:
+    registry: myRegistry
+    repository_prefix: team-a/
+    name_pattern: "build-*"
+    last_updated_before: "2023-01-01T00:00:00Z"
+    max_workers: 16
 '''
 
 RETURN = '''
@@ -98,13 +125,36 @@ repositories:
                     type: str
                     returned: always
                     sample: "2022-02-02T18:18:57.145778+00:00"
+errors:
+    description:
+        - A list of repositories whose tags could not be listed when all repositories were retrieved.
+        - Repositories in this list are not included in I(repositories).
+    returned: always
+    type: complex
+    contains:
+        name:
+            description:
+                - The name of the repository.
+            returned: always
+            type: str
+            sample: my-app
+        error:
+            description:
+                - The error returned when listing the tags of the repository.
+            returned: always
+            type: str
+            sample: "(NAME_UNKNOWN) repository name not known to registry"
 '''
 
+from datetime import timezone
+
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_containerregistry import ContainerRegistryTagScanner, format_tag
 
 try:
     from azure.containerregistry import ContainerRegistryClient
     from azure.core.exceptions import ResourceNotFoundError
+    import dateutil.parser
 except ImportError as exc:
     # This is handled in azure_rm_common
     pass
@@ -123,15 +173,33 @@ class AzureRMContainerRegistryTagInfo(AzureRMModuleBase):
             name=dict(
                 type="str",
             ),
+            repository_prefix=dict(
+                type="str",
+            ),
+            name_pattern=dict(
+                type="str",
+            ),
+            last_updated_before=dict(
+                type="str",
+            ),
+            max_workers=dict(
+                type="int",
+                default=8,
+            ),
         )
 
         self.results = dict(
-            changed=False
+            changed=False,
+            errors=[],
         )
 
         self.registry = None
         self.repository_name = None
         self.name = None
+        self.repository_prefix = None
+        self.name_pattern = None
+        self.last_updated_before = None
+        self.max_workers = None
 
         self._client = None
 
@@ -144,6 +212,14 @@ class AzureRMContainerRegistryTagInfo(AzureRMModuleBase):
         for key in list(self.module_arg_spec.keys()):
             setattr(self, key, kwargs[key])
 
+        if self.last_updated_before:
+            try:
+                self.last_updated_before = dateutil.parser.isoparse(self.last_updated_before)
+            except ValueError as e:
+                self.fail(f"Invalid last_updated_before {self.last_updated_before} - {str(e)}")
+            if self.last_updated_before.tzinfo is None:
+                self.last_updated_before = self.last_updated_before.replace(tzinfo=timezone.utc)
+
         self._client = self.get_client()
 
         if self.repository_name and self.name:
@@ -164,6 +240,13 @@ class AzureRMContainerRegistryTagInfo(AzureRMModuleBase):
             audience="https://management.azure.com",
         )
 
+    def get_scanner(self, tag_name):
+        return ContainerRegistryTagScanner(self._client,
+                                           name=tag_name,
+                                           name_pattern=self.name_pattern,
+                                           last_updated_before=self.last_updated_before,
+                                           log=self.log)
+
     def get_tag(self, repository_name, tag_name):
         response = None
         try:
@@ -173,7 +256,7 @@ class AzureRMContainerRegistryTagInfo(AzureRMModuleBase):
             self.log(f"Could not get ACR tag for {repository_name}:{tag_name} - {str(e)}")
 
         tags = []
-        if response is not None:
+        if response is not None and self.get_scanner(tag_name).tag_matches(response):
             tags.append(format_tag(response))
 
         return {
@@ -183,16 +266,10 @@ class AzureRMContainerRegistryTagInfo(AzureRMModuleBase):
 
     def list_by_repository(self, repository_name, tag_name):
         try:
-            response = self._client.list_tag_properties(repository=repository_name)
-            self.log(f"Response : {response}")
-            tags = []
-            for tag in response:
-                if not tag_name or tag.name == tag_name:
-                    tags.append(format_tag(tag))
-
+            tags = self.get_scanner(tag_name).list_tags(repository_name)
             return {
                 "name": repository_name,
-                "tags": tags
+                "tags": [format_tag(tag) for tag in tags]
             }
         except ResourceNotFoundError as e:
             self.log(f"Could not get ACR tags for {repository_name} - {str(e)}")
@@ -200,32 +277,24 @@ class AzureRMContainerRegistryTagInfo(AzureRMModuleBase):
         return None
 
     def list_all_repositories(self, tag_name):
-        response = None
         try:
-            response = self._client.list_repository_names()
-            self.log(f"Response : {response}")
+            repositories, errors = self.get_scanner(tag_name).scan(repository_prefix=self.repository_prefix,
+                                                                    max_workers=self.max_workers)
         except Exception as e:
             self.fail(f"Could not get ACR repositories - {str(e)}")
 
-        if response is not None:
-            results = []
-            for repo_name in response:
-                tags = self.list_by_repository(repo_name, tag_name)
-                if tags:
-                    results.append(tags)
-
-            return results
-
-        return None
-
-
-def format_tag(tag):
-    return {
-        "name": tag.name,
-        "digest": tag.digest,
-        "created_on": tag.created_on,
-        "last_updated_on": tag.last_updated_on,
-    }
+        self.results["errors"] = errors
+        filtered = self.name_pattern or self.last_updated_before
+        results = []
+        for repo_name, tags in repositories:
+            if filtered and not tags:
+                continue
+            results.append({
+                "name": repo_name,
+                "tags": [format_tag(tag) for tag in tags]
+            })
+
+        return results
 
 
 def main():
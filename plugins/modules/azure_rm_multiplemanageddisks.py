@@ -19,6 +19,8 @@ short_description: Manage Multiple Azure Manage Disks
 description:
     - Create, update and delete one or more Azure Managed Disk.
     - This module can be used also to attach/detach disks to/from one or more virtual machines.
+    - The virtual machines are read and updated in parallel, an update rejected because another operation is running
+      on the virtual machine is retried.
 
 options:
     state:
@@ -156,6 +158,12 @@ options:
                 description:
                     - The name of the attache VM.
                 type: str
+    max_concurrency:
+        description:
+            - Maximum number of virtual machines read or updated in parallel.
+        type: int
+        default: 20
+        version_added: "2.4.0"
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -309,9 +317,11 @@ state:
 '''
 
 
-from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+import itertools
+
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, map_bounded
 try:
-    from azure.core.exceptions import ResourceNotFoundError, AzureError
+    from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
     from azure.mgmt.core.tools import parse_resource_id
     import time
 except ImportError:
@@ -319,6 +329,11 @@ except ImportError:
     pass
 
 
+# attempts of a virtual machine update rejected with a conflict, the delay between attempts doubles
+VM_UPDATE_ATTEMPTS = 5
+VM_UPDATE_RETRY_DELAY = 5
+
+
 # duplicated in azure_rm_manageddisk_facts
 def managed_disk_to_dict(managed_disk):
     create_data = managed_disk.creation_data
@@ -414,6 +429,10 @@ class AzureRMMultipleManagedDisk(AzureRMModuleBase):
                 elements='dict',
                 options=managed_by_extended_spec,
             ),
+            max_concurrency=dict(
+                type='int',
+                default=20
+            ),
         )
         self.results = dict(
             changed=False,
@@ -488,12 +507,13 @@ class AzureRMMultipleManagedDisk(AzureRMModuleBase):
         state = kwargs.get("state")
         self.managed_disks = kwargs.get("managed_disks")
         self.managed_by_extended = kwargs.get("managed_by_extended")
+        self.max_concurrency = kwargs.get("max_concurrency")
 
         self.validate_disks_parameter()
 
         managed_vm_id = []
         if self.managed_by_extended:
-            managed_vm_id = [self._get_vm(vm['resource_group'], vm['name']) for vm in self.managed_by_extended]
+            managed_vm_id = self._get_vms([(vm['resource_group'], vm['name']) for vm in self.managed_by_extended])
 
         if state == "present":
             return self.create_or_attach_disks(managed_vm_id)
@@ -527,14 +547,17 @@ class AzureRMMultipleManagedDisk(AzureRMModuleBase):
             # Attach the disk to multiple VM
             attach_config = []
             for vm in managed_vm_id:
-                time.sleep(5)
-                disks = [(d, i) for d, i in disk_instances if not self._is_disk_attached_to_vm(vm.id, i)]
+                disks = self._get_unattached_disks(vm, disk_instances)
                 if len(disks) > 0:
                     attach_config.append(self.create_attachment_configuration(vm, disks))
 
+            def reconfigure(vm):
+                disks = self._get_unattached_disks(vm, disk_instances)
+                return self.create_attachment_configuration(vm, disks)[2] if disks else None
+
             if len(attach_config) > 0:
                 changed = True
-                self.update_virtual_machines(attach_config)
+                self.update_virtual_machines(attach_config, reconfigure)
 
         elif self.managed_by_extended == []:
             # Detach disks from all VMs attaching them
@@ -561,7 +584,7 @@ class AzureRMMultipleManagedDisk(AzureRMModuleBase):
 
             if len(attach_config) > 0:
                 changed = True
-                self.update_virtual_machines(attach_config)
+                self.update_virtual_machines(attach_config, lambda vm: self._remove_data_disks(vm, disks_names))
             result = self.compute_disks_result(disk_instances)
 
         elif self.managed_by_extended is None:
@@ -591,15 +614,13 @@ class AzureRMMultipleManagedDisk(AzureRMModuleBase):
         if unique_vm_id:
             disks_names = [instance.get("name").lower() for d, instance in disk_instances]
             changed = True
-            attach_config = []
-            for vm_id in unique_vm_id:
-                vm_name_id = parse_resource_id(vm_id)
-                vm_instance = self._get_vm(vm_name_id['resource_group'], vm_name_id['resource_name'])
-                attach_config.append(self.create_detachment_configuration(vm_instance, disks_names))
+            vm_name_ids = [parse_resource_id(vm_id) for vm_id in unique_vm_id]
+            vm_instances = self._get_vms([(vm['resource_group'], vm['resource_name']) for vm in vm_name_ids])
+            attach_config = [self.create_detachment_configuration(vm_instance, disks_names) for vm_instance in vm_instances]
 
             if len(attach_config) > 0:
                 changed = True
-                self.update_virtual_machines(attach_config)
+                self.update_virtual_machines(attach_config, lambda vm: self._remove_data_disks(vm, disks_names))
         return changed
 
     def _is_disk_attached_to_vm(self, vm_id, item):
@@ -611,23 +632,39 @@ class AzureRMMultipleManagedDisk(AzureRMModuleBase):
             return True
         return False
 
-    def create_attachment_configuration(self, vm, disks):
-        vm_id = parse_resource_id(vm.id)
-
-        # attach all disks to the virtual machine
+    def _get_unattached_disks(self, vm, disk_instances):
+        data_disks = vm.storage_profile.data_disks or []
+        attached = set(d.managed_disk.id.lower() for d in data_disks if d.managed_disk and d.managed_disk.id)
+        return [(d, i) for d, i in disk_instances if i.get('id').lower() not in attached]
+
+    def allocate_luns(self, vm, disks):
+        '''
+        Assign a LUN to every disk to attach: the requested LUN, the LUN of a data disk of the VM with the same name,
+        or the lowest LUN neither used by the VM nor requested by another disk.
+        '''
+        data_disks = vm.storage_profile.data_disks or []
+        luns_by_name = dict((d.name, d.lun) for d in data_disks)
+        reserved = set(d.lun for d in data_disks)
+        reserved.update(managed_disk.get("lun") for managed_disk, disk_instance in disks if managed_disk.get("lun") is not None)
+        free_luns = (lun for lun in itertools.count() if lun not in reserved)
+
+        luns = []
         for managed_disk, disk_instance in disks:
             lun = managed_disk.get("lun")
             if lun is None:
-                luns = ([d.lun for d in vm.storage_profile.data_disks] if vm.storage_profile.data_disks else [])
-                lun = 0
-                while True:
-                    if lun not in luns:
-                        break
-                    lun = lun + 1
-                for item in vm.storage_profile.data_disks:
-                    if item.name == managed_disk.get("name"):
-                        lun = item.lun
+                lun = luns_by_name.get(managed_disk.get("name"))
+            if lun is None:
+                lun = next(free_luns)
+            luns.append(lun)
+        return luns
+
+    def create_attachment_configuration(self, vm, disks):
+        vm_id = parse_resource_id(vm.id)
+        if vm.storage_profile.data_disks is None:
+            vm.storage_profile.data_disks = []
 
+        # attach all disks to the virtual machine
+        for (managed_disk, disk_instance), lun in zip(disks, self.allocate_luns(vm, disks)):
             # prepare the data disk
             params = self.compute_models.ManagedDiskParameters(id=disk_instance.get('id'), storage_account_type=disk_instance.get('storage_account_type'))
             attach_caching = managed_disk.get("attach_caching")
@@ -641,21 +678,40 @@ class AzureRMMultipleManagedDisk(AzureRMModuleBase):
             vm.storage_profile.data_disks.append(data_disk)
         return vm_id["resource_group"], vm_id["resource_name"], vm
 
+    def _remove_data_disks(self, vm_instance, disks_names):
+        '''
+        Remove the named disks from the data disks of the VM.
+
+        :return: the VM, None if none of the disks is attached to it
+        '''
+        data_disks = vm_instance.storage_profile.data_disks or []
+        leftovers = [d for d in data_disks if d.name.lower() not in disks_names]
+        if len(data_disks) == len(leftovers):
+            return None
+        vm_instance.storage_profile.data_disks = leftovers
+        return vm_instance
+
     def create_detachment_configuration(self, vm_instance, disks_names):
         vm_data = parse_resource_id(vm_instance.id)
-        leftovers = [d for d in vm_instance.storage_profile.data_disks if d.name.lower() not in disks_names]
-        if len(vm_instance.storage_profile.data_disks) == len(leftovers):
+        if self._remove_data_disks(vm_instance, disks_names) is None:
             self.fail("None of the following disks '{0}' are attached to the VM '{1}/{2}'.".format(
                 disks_names, vm_data["resource_group"], vm_data["resource_name"]
             ))
-        vm_instance.storage_profile.data_disks = leftovers
         return vm_data["resource_group"], vm_data["resource_name"], vm_instance
 
-    def _get_vm(self, resource_group, name):
-        try:
-            return self.compute_client.virtual_machines.get(resource_group, name, expand='instanceview')
-        except Exception as exc:
-            self.fail("Error getting virtual machine {0}/{1} - {2}".format(resource_group, name, str(exc)))
+    def _get_vms(self, names):
+        '''
+        Read the VMs given as (resource group, name) tuples in parallel.
+        '''
+        def get_vm(name):
+            return self.compute_client.virtual_machines.get(name[0], name[1], expand='instanceview')
+
+        vms = map_bounded(get_vm, names, self.max_concurrency)
+        errors = ["Error getting virtual machine {0}/{1} - {2}".format(resource_group, name, str(vm))
+                  for (resource_group, name), vm in zip(names, vms) if isinstance(vm, Exception)]
+        if errors:
+            self.fail(msg="Error getting virtual machines.", errors=errors)
+        return vms
 
     def create_or_update_disks(self, disks_to_create):
         pollers = []
@@ -710,15 +766,38 @@ class AzureRMMultipleManagedDisk(AzureRMModuleBase):
                 self.fail("Error deleting the managed disk {0}/{1}: {2}".format(resource_group, name, str(e)))
         return self.get_multiple_pollers_results(pollers)
 
-    def update_virtual_machines(self, config):
-        pollers = []
-        for resource_group, name, params in config:
-            try:
-                poller = self.compute_client.virtual_machines.begin_create_or_update(resource_group, name, params)
-                pollers.append(poller)
-            except AzureError as exc:
-                self.fail("Error updating virtual machine (attaching/detaching disks) {0}/{1} - {2}".format(resource_group, name, exc.message))
-        return self.get_multiple_pollers_results(pollers)
+    def update_virtual_machines(self, config, reconfigure):
+        '''
+        Update the VMs in parallel.
+
+        An update rejected with a conflict, while another operation runs on the VM, is retried with the
+        parameters returned by reconfigure for a fresh read of the VM, until reconfigure returns None.
+
+        :param config: list of (resource group, name, VM parameters)
+        :param reconfigure: function applying the change to a VM and returning it, None if it is already applied
+        '''
+        def update(item):
+            resource_group, name, params = item
+            for attempt in range(VM_UPDATE_ATTEMPTS):
+                if attempt > 0:
+                    time.sleep(VM_UPDATE_RETRY_DELAY * 2 ** (attempt - 1))
+                    params = reconfigure(self.compute_client.virtual_machines.get(resource_group, name))
+                    if params is None:
+                        return None
+                try:
+                    poller = self.compute_client.virtual_machines.begin_create_or_update(resource_group, name, params)
+                    return self.get_poller_result(poller)
+                except HttpResponseError as exc:
+                    if exc.status_code != 409 or attempt == VM_UPDATE_ATTEMPTS - 1:
+                        raise
+                    self.log("Conflict updating virtual machine {0}/{1}, retrying - {2}".format(resource_group, name, str(exc)))
+
+        results = map_bounded(update, config, self.max_concurrency)
+        errors = ["Error updating virtual machine (attaching/detaching disks) {0}/{1} - {2}".format(resource_group, name, str(result))
+                  for (resource_group, name, params), result in zip(config, results) if isinstance(result, Exception)]
+        if errors:
+            self.fail(msg="Error updating virtual machines.", errors=errors)
+        return results
 
     def get_managed_disk(self, resource_group, name):
         try:
@@ -0,0 +1,674 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2026 xuzhang3 (@xuzhang3), Fred-sun (@Fred-sun)
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_multiplevirtualmachines
+
+version_added: "2.4.0"
+
+short_description: Create or delete many identical Azure virtual machines
+
+description:
+    - Create or delete a set of identically configured virtual machines (VMs) in one task.
+    - The VM size, image, subnet, security group and availability set are resolved once for the whole set.
+    - The public IP, network interface and VM of every new VM are created with up to I(max_concurrency) VMs in flight.
+    - Existing VMs are left as they are, use M(azure.azcollection.azure_rm_virtualmachine) to change the configuration of a VM.
+    - Requires a resource group containing at least one virtual network with at least one subnet.
+
+options:
+    resource_group:
+        description:
+            - Name of the resource group containing the VMs.
+        required: true
+        type: str
+    names:
+        description:
+            - Names of the VMs.
+            - Mutually exclusive with I(name_prefix).
+        type: list
+        elements: str
+    name_prefix:
+        description:
+            - Prefix of the names of the VMs, the VMs are named I(name_prefix) followed by C(1) to I(count).
+            - Requires I(count).
+        type: str
+    count:
+        description:
+            - Number of VMs named after I(name_prefix).
+        type: int
+    state:
+        description:
+            - State of the VMs.
+            - Set to C(present) to create the missing VMs.
+            - Set to C(absent) to remove the VMs, together with their OS disk and the network interface and public IP created with them.
+            - Data disks attached to the VMs are detached by the deletion of the VMs but not deleted, they may be shared with other VMs.
+        default: present
+        type: str
+        choices:
+            - absent
+            - present
+    location:
+        description:
+            - Valid Azure location for the VMs. Defaults to location of the resource group.
+        type: str
+    vm_size:
+        description:
+            - A valid Azure VM size value. For example, C(Standard_D4).
+            - Required when creating VMs.
+        type: str
+    admin_username:
+        description:
+            - Admin username used to access the VMs after they are created.
+            - Required when creating VMs.
+        type: str
+    admin_password:
+        description:
+            - Password for the admin username.
+            - Not required if the I(os_type=Linux) and SSH password authentication is disabled by setting I(ssh_password_enabled=false).
+        type: str
+    ssh_password_enabled:
+        description:
+            - Whether to enable or disable SSH passwords.
+            - When I(os_type=Linux), set to C(false) to disable SSH password authentication and require use of SSH keys.
+        default: true
+        type: bool
+    ssh_public_keys:
+        description:
+            - For I(os_type=Linux) provide a list of SSH keys.
+            - Accepts a list of dicts where each dictionary contains two keys, I(path) and I(key_data).
+            - Set I(path) to the default location of the authorized_keys files. For example, I(path=/home/<admin username>/.ssh/authorized_keys).
+            - Set I(key_data) to the actual value of the public key.
+        type: list
+        elements: dict
+    image:
+        description:
+            - The image used to build the VMs.
+            - For custom images, the name of the image. To narrow the search to a specific resource group, a dict with the keys I(name) and I(resource_group).
+            - For Marketplace images, a dict with the keys I(publisher), I(offer), I(sku), and I(version).
+            - Set I(version=latest) to get the most recent version of a given image, the version is resolved once and used for all VMs.
+            - For an image given by ID, a dict with the key I(id).
+            - Required when creating VMs.
+        type: raw
+    os_type:
+        description:
+            - Base type of operating system.
+        type: str
+        choices:
+            - Windows
+            - Linux
+        default: Linux
+    managed_disk_type:
+        description:
+            - Managed OS disk type.
+        type: str
+        choices:
+            - Standard_LRS
+            - StandardSSD_LRS
+            - StandardSSD_ZRS
+            - Premium_LRS
+            - Premium_ZRS
+        default: Standard_LRS
+    os_disk_caching:
+        description:
+            - Type of OS disk caching.
+        type: str
+        choices:
+            - ReadOnly
+            - ReadWrite
+        default: ReadOnly
+    os_disk_size_gb:
+        description:
+            - Size of OS disk in GB.
+        type: int
+    custom_data:
+        description:
+            - Data made available to the VMs and used by C(cloud-init).
+            - Only used on Linux images with C(cloud-init) enabled.
+        type: str
+    virtual_network_name:
+        description:
+            - The virtual network of the network interfaces of the VMs.
+            - If not specified, the first virtual network found in I(virtual_network_resource_group) is used.
+        type: str
+        aliases:
+            - virtual_network
+    virtual_network_resource_group:
+        description:
+            - The resource group of I(virtual_network_name). Defaults to I(resource_group).
+        type: str
+    subnet_name:
+        description:
+            - Subnet of the network interfaces of the VMs.
+            - If not specified, the first subnet of the virtual network is used.
+        type: str
+        aliases:
+            - subnet
+    public_ip_allocation_method:
+        description:
+            - Allocation method of the public IP created for every VM.
+            - The public IPs are created with the C(Standard) SKU, which only supports C(Static) allocation and works with I(zones).
+            - Set to C(Disabled) to create the VMs without public IP.
+        type: str
+        choices:
+            - Static
+            - Disabled
+        default: Static
+    security_group:
+        description:
+            - Name or ID of an existing network security group applied to the network interfaces of the VMs.
+            - If not specified, the network interfaces have no security group, the security group of the subnet applies.
+        type: str
+    availability_set:
+        description:
+            - Name or ID of an existing availability set to add the VMs to.
+        type: str
+    zones:
+        description:
+            - Availability zones the VMs are spread over, in the order of I(names).
+        type: list
+        elements: str
+        choices:
+            - '1'
+            - '2'
+            - '3'
+    max_concurrency:
+        description:
+            - Maximum number of VMs created or deleted at the same time.
+        type: int
+        default: 20
+    cache_ttl:
+        description:
+            - Seconds the VM sizes of the location and the resolved marketplace image version are cached on disk,
+              in C(~/.ansible/azure_rm_cache).
+            - Set to C(0) to disable the cache.
+        type: int
+        default: 3600
+
+extends_documentation_fragment:
+    - azure.azcollection.azure
+    - azure.azcollection.azure_tags
+
+author:
+    - xuzhang3 (@xuzhang3)
+    - Fred-sun (@Fred-sun)
+'''
+
+EXAMPLES = '''
+- name: Create 50 VMs without public IP
+  azure_rm_multiplevirtualmachines:
+    resource_group: myResourceGroup
+    name_prefix: web
+    count: 50
+    vm_size: Standard_D2s_v3
+    admin_username: azureuser
+    ssh_password_enabled: false
+    ssh_public_keys:
+      - path: /home/azureuser/.ssh/authorized_keys
+        key_data: "ssh-rsa AAAAB3Nz..."
+    image:
+      offer: 0001-com-ubuntu-server-focal
+      publisher: Canonical
+      sku: 20_04-lts
+      version: latest
+    virtual_network_name: myVirtualNetwork
+    subnet_name: mySubnet
+    security_group: mySecurityGroup
+    zones: ['1', '2', '3']
+    max_concurrency: 25
+
+- name: Delete VMs
+  azure_rm_multiplevirtualmachines:
+    resource_group: myResourceGroup
+    names:
+      - web1
+      - web2
+    state: absent
+'''
+
+RETURN = '''
+vms:
+    description:
+        - Outcome for every VM, in the order of I(names).
+    returned: always
+    type: complex
+    contains:
+        name:
+            description:
+                - Name of the VM.
+            returned: always
+            type: str
+            sample: web1
+        id:
+            description:
+                - Resource ID of the VM, C(None) if the VM doesn't exist.
+            returned: always
+            type: str
+            sample: /subscriptions/xxx-xxx/resourceGroups/myResourceGroup/providers/Microsoft.Compute/virtualMachines/web1
+        changed:
+            description:
+                - Whether the VM was created or deleted, or would be in check mode.
+            returned: always
+            type: bool
+            sample: true
+        error:
+            description:
+                - The error that occurred creating or deleting the VM.
+                - The module fails after all other VMs are done when any VM has an error.
+            returned: always
+            type: str
+            sample: null
+'''
+
+import base64
+
+try:
+    from azure.core.exceptions import ResourceNotFoundError
+    from azure.mgmt.core.tools import parse_resource_id
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+from ansible.module_utils.basic import to_native, to_bytes
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import (AzureRMModuleBase,
+                                                                                         format_resource_id,
+                                                                                         map_bounded)
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_computemetadata import (COMPUTE_METADATA_CACHE_TTL,
+                                                                                                  list_vm_sizes,
+                                                                                                  get_image_version,
+                                                                                                  get_custom_image_id)
+
+
+class AzureRMMultipleVirtualMachines(AzureRMModuleBase):
+
+    def __init__(self):
+
+        self.module_arg_spec = dict(
+            resource_group=dict(type='str', required=True),
+            names=dict(type='list', elements='str'),
+            name_prefix=dict(type='str'),
+            count=dict(type='int'),
+            state=dict(choices=['present', 'absent'], default='present', type='str'),
+            location=dict(type='str'),
+            vm_size=dict(type='str'),
+            admin_username=dict(type='str'),
+            admin_password=dict(type='str', no_log=True),
+            ssh_password_enabled=dict(type='bool', default=True, no_log=False),
+            ssh_public_keys=dict(type='list', elements='dict'),
+            image=dict(type='raw'),
+            os_type=dict(type='str', choices=['Linux', 'Windows'], default='Linux'),
+            managed_disk_type=dict(type='str', choices=['Standard_LRS', 'StandardSSD_LRS', 'StandardSSD_ZRS', 'Premium_LRS', 'Premium_ZRS'],
+                                   default='Standard_LRS'),
+            os_disk_caching=dict(type='str', choices=['ReadOnly', 'ReadWrite'], default='ReadOnly'),
+            os_disk_size_gb=dict(type='int'),
+            custom_data=dict(type='str'),
+            virtual_network_name=dict(type='str', aliases=['virtual_network']),
+            virtual_network_resource_group=dict(type='str'),
+            subnet_name=dict(type='str', aliases=['subnet']),
+            public_ip_allocation_method=dict(type='str', choices=['Static', 'Disabled'], default='Static'),
+            security_group=dict(type='str'),
+            availability_set=dict(type='str'),
+            zones=dict(type='list', elements='str', choices=['1', '2', '3']),
+            max_concurrency=dict(type='int', default=20),
+            cache_ttl=dict(type='int', default=COMPUTE_METADATA_CACHE_TTL),
+        )
+
+        self.resource_group = None
+        self.names = None
+        self.name_prefix = None
+        self.count = None
+        self.state = None
+        self.location = None
+        self.vm_size = None
+        self.admin_username = None
+        self.admin_password = None
+        self.ssh_password_enabled = None
+        self.ssh_public_keys = None
+        self.image = None
+        self.os_type = None
+        self.managed_disk_type = None
+        self.os_disk_caching = None
+        self.os_disk_size_gb = None
+        self.custom_data = None
+        self.virtual_network_name = None
+        self.virtual_network_resource_group = None
+        self.subnet_name = None
+        self.public_ip_allocation_method = None
+        self.security_group = None
+        self.availability_set = None
+        self.zones = None
+        self.max_concurrency = None
+        self.cache_ttl = None
+        self.tags = None
+
+        self._image_reference = None
+        self._subnet_id = None
+        self._security_group_id = None
+        self._availability_set_id = None
+
+        self.results = dict(
+            changed=False,
+            vms=[]
+        )
+
+        mutually_exclusive = [('names', 'name_prefix'), ('availability_set', 'zones')]
+        required_together = [('name_prefix', 'count')]
+        required_one_of = [('names', 'name_prefix')]
+
+        super(AzureRMMultipleVirtualMachines, self).__init__(derived_arg_spec=self.module_arg_spec,
+                                                             supports_check_mode=True,
+                                                             mutually_exclusive=mutually_exclusive,
+                                                             required_together=required_together,
+                                                             required_one_of=required_one_of)
+
+    def exec_module(self, **kwargs):
+
+        for key in list(self.module_arg_spec.keys()) + ['tags']:
+            setattr(self, key, kwargs[key])
+
+        if self.name_prefix:
+            self.names = ['{0}{1}'.format(self.name_prefix, index) for index in range(1, self.count + 1)]
+        if len(set(name.lower() for name in self.names)) != len(self.names):
+            self.fail("Parameter error: names must be unique")
+
+        resource_group = self.get_resource_group(self.resource_group)
+        if not self.location:
+            self.location = resource_group.location
+
+        try:
+            existing = dict((vm.name.lower(), vm) for vm in self.compute_client.virtual_machines.list(self.resource_group))
+        except Exception as exc:
+            self.fail("Error listing virtual machines in resource group {0} - {1}".format(self.resource_group, str(exc)))
+
+        vms = []
+        for index, name in enumerate(self.names):
+            vm = existing.get(name.lower())
+            zone = self.zones[index % len(self.zones)] if self.zones else None
+            vms.append(dict(name=name, id=vm.id if vm else None, zone=zone, vm=vm))
+
+        if self.state == 'present':
+            pending = [vm for vm in vms if not vm['vm']]
+            if pending:
+                self.resolve_shared_inputs()
+            operation = self.create_vm
+        else:
+            pending = [vm for vm in vms if vm['vm']]
+            operation = self.delete_vm
+
+        if pending and not self.check_mode:
+            outcomes = map_bounded(operation, pending, self.max_concurrency)
+        else:
+            outcomes = [None] * len(pending)
+
+        errors = 0
+        for vm, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                self.log("Error {0} virtual machine {1} - {2}".format('creating' if self.state == 'present' else 'deleting',
+                                                                     vm['name'], str(outcome)))
+                vm['error'] = str(outcome)
+                errors += 1
+            else:
+                vm['id'] = outcome if self.state == 'present' else None
+            vm['changed'] = True
+
+        self.results['vms'] = [dict(name=vm['name'], id=vm['id'], changed=vm.get('changed', False), error=vm.get('error'))
+                               for vm in vms]
+        self.results['changed'] = bool(pending)
+
+        if errors:
+            self.fail("Error {0} {1} of {2} virtual machines".format('creating' if self.state == 'present' else 'deleting', errors, len(pending)),
+                      **self.results)
+
+        return self.results
+
+    def resolve_shared_inputs(self):
+        '''
+        Validate the parameters and resolve the references shared by all new VMs.
+        '''
+        if not self.vm_size:
+            self.fail("Parameter error: vm_size required when creating virtual machines.")
+        if not self.admin_username:
+            self.fail("Parameter error: admin_username required when creating virtual machines.")
+        if self.os_type == 'Linux' and not self.ssh_password_enabled and not self.ssh_public_keys:
+            self.fail("Parameter error: ssh_public_keys required when disabling SSH password.")
+        if not self.image:
+            self.fail("Parameter error: an image is required when creating virtual machines.")
+
+        try:
+            sizes = list_vm_sizes(self, self.location, self.cache_ttl)
+        except Exception as exc:
+            self.fail("Error retrieving available machine sizes - {0}".format(str(exc)))
+        if not any(size['name'] == self.vm_size for size in sizes):
+            self.fail("Parameter error: vm_size {0} is not valid for your subscription and location.".format(self.vm_size))
+
+        self._image_reference = self.get_image_reference()
+        self._subnet_id = self.get_subnet_id()
+
+        if self.security_group:
+            security_group = parse_resource_id(format_resource_id(self.security_group, self.subscription_id, 'Microsoft.Network',
+                                                                  'networkSecurityGroups', self.resource_group))
+            try:
+                self._security_group_id = self.network_client.network_security_groups.get(security_group['resource_group'],
+                                                                                          security_group['name']).id
+            except Exception as exc:
+                self.fail("Error fetching security group {0} - {1}".format(self.security_group, str(exc)))
+
+        if self.availability_set:
+            availability_set = parse_resource_id(format_resource_id(self.availability_set, self.subscription_id, 'Microsoft.Compute',
+                                                                    'availabilitySets', self.resource_group))
+            try:
+                self._availability_set_id = self.compute_client.availability_sets.get(availability_set['resource_group'],
+                                                                                      availability_set['name']).id
+            except Exception as exc:
+                self.fail("Error fetching availability set {0} - {1}".format(self.availability_set, str(exc)))
+
+    def get_image_reference(self):
+        if isinstance(self.image, dict):
+            if all(key in self.image for key in ('publisher', 'offer', 'sku', 'version')):
+                try:
+                    version = get_image_version(self, self.location, self.image['publisher'], self.image['offer'], self.image['sku'],
+                                                self.image['version'], self.cache_ttl)
+                except Exception as exc:
+                    self.fail("Error fetching image {0} {1} {2} - {3}".format(self.image['publisher'],
+                                                                              self.image['offer'],
+                                                                              self.image['sku'],
+                                                                              str(exc)))
+                if not version:
+                    self.fail("Error could not find image {0} {1} {2} {3}".format(self.image['publisher'],
+                                                                                  self.image['offer'],
+                                                                                  self.image['sku'],
+                                                                                  self.image['version']))
+                self.log("Using image version {0}".format(version['name']))
+                return self.compute_models.ImageReference(publisher=self.image['publisher'],
+                                                          offer=self.image['offer'],
+                                                          sku=self.image['sku'],
+                                                          version=version['name'])
+            if self.image.get('name'):
+                return self.get_custom_image_reference(self.image['name'], self.image.get('resource_group'))
+            if self.image.get('id'):
+                return self.compute_models.ImageReference(id=self.image['id'])
+            self.fail("parameter error: expecting image to contain [publisher, offer, sku, version], [name, resource_group] or [id]")
+        if isinstance(self.image, str):
+            return self.get_custom_image_reference(self.image)
+        self.fail("parameter error: expecting image to be a string or dict not {0}".format(type(self.image).__name__))
+
+    def get_custom_image_reference(self, name, resource_group=None):
+        try:
+            image_id = get_custom_image_id(self, name, resource_group, self.cache_ttl)
+        except Exception as exc:
+            self.fail("Error fetching custom images from subscription - {0}".format(str(exc)))
+
+        if not image_id:
+            self.fail("Error could not find image with name {0}".format(name))
+        self.log("Using custom image id {0}".format(image_id))
+        return self.compute_models.ImageReference(id=image_id)
+
+    def get_subnet_id(self):
+        virtual_network_resource_group = self.virtual_network_resource_group or self.resource_group
+        virtual_network_name = self.virtual_network_name
+        if not virtual_network_name:
+            try:
+                vnet = next(iter(self.network_client.virtual_networks.list(virtual_network_resource_group)), None)
+            except Exception:
+                vnet = None
+            if not vnet:
+                self.fail("Error: unable to find virtual network in resource group {0}. A virtual network "
+                          "with at least one subnet must exist in order to create the virtual machines.".format(virtual_network_resource_group))
+            virtual_network_name = vnet.name
+
+        try:
+            if self.subnet_name:
+                return self.network_client.subnets.get(virtual_network_resource_group, virtual_network_name, self.subnet_name).id
+            subnet = next(iter(self.network_client.subnets.list(virtual_network_resource_group, virtual_network_name)), None)
+        except Exception as exc:
+            self.fail("Error: fetching subnet of virtual network {0} - {1}".format(virtual_network_name, str(exc)))
+        if not subnet:
+            self.fail("Error: unable to find a subnet in virtual network {0}. A virtual network "
+                      "with at least one subnet must exist in order to create the virtual machines.".format(virtual_network_name))
+        return subnet.id
+
+    def create_vm(self, vm):
+        '''
+        Create the public IP, network interface and VM of a new VM, raising an exception on error.
+
+        :param vm: dict with the name and zone of the VM
+        :return: ID of the VM
+        '''
+        name = vm['name']
+        tags = dict(self.tags or {})
+        resource_name = name + '01'
+
+        public_ip = None
+        if self.public_ip_allocation_method != 'Disabled':
+            self.log("Creating public IP {0}".format(resource_name))
+            # Basic public IPs are retired, Standard public IPs are zone redundant and always static
+            sku = self.network_models.PublicIPAddressSku(name="Standard")
+            poller = self.network_client.public_ip_addresses.begin_create_or_update(
+                self.resource_group,
+                resource_name,
+                self.network_models.PublicIPAddress(location=self.location,
+                                                    public_ip_allocation_method=self.public_ip_allocation_method,
+                                                    sku=sku))
+            public_ip = self.network_models.PublicIPAddress(id=poller.result().id)
+            tags['_own_pip_'] = resource_name
+
+        self.log("Creating NIC {0}".format(resource_name))
+        nic = self.network_models.NetworkInterface(
+            location=self.location,
+            ip_configurations=[
+                self.network_models.NetworkInterfaceIPConfiguration(
+                    name='default',
+                    private_ip_allocation_method='Dynamic',
+                    subnet=self.network_models.Subnet(id=self._subnet_id),
+                    public_ip_address=public_ip
+                )
+            ]
+        )
+        if self._security_group_id:
+            nic.network_security_group = self.network_models.NetworkSecurityGroup(id=self._security_group_id)
+        poller = self.network_client.network_interfaces.begin_create_or_update(self.resource_group, resource_name, nic)
+        nic_id = poller.result().id
+        tags['_own_nic_'] = resource_name
+
+        vm_resource = self.compute_models.VirtualMachine(
+            location=self.location,
+            tags=tags,
+            os_profile=self.compute_models.OSProfile(
+                admin_username=self.admin_username,
+                computer_name=name,
+            ),
+            hardware_profile=self.compute_models.HardwareProfile(
+                vm_size=self.vm_size
+            ),
+            storage_profile=self.compute_models.StorageProfile(
+                os_disk=self.compute_models.OSDisk(
+                    name=name,
+                    managed_disk=self.compute_models.ManagedDiskParameters(storage_account_type=self.managed_disk_type),
+                    create_option=self.compute_models.DiskCreateOptionTypes.from_image,
+                    caching=self.os_disk_caching,
+                    disk_size_gb=self.os_disk_size_gb,
+                ),
+                image_reference=self._image_reference,
+            ),
+            network_profile=self.compute_models.NetworkProfile(
+                network_interfaces=[self.compute_models.NetworkInterfaceReference(id=nic_id, primary=True)]
+            ),
+            availability_set=self.compute_models.SubResource(id=self._availability_set_id) if self._availability_set_id else None,
+            zones=[vm['zone']] if vm['zone'] else None,
+        )
+
+        if self.admin_password:
+            vm_resource.os_profile.admin_password = self.admin_password
+
+        if self.custom_data:
+            # Azure SDK (erroneously?) wants native string type for this
+            vm_resource.os_profile.custom_data = to_native(base64.b64encode(to_bytes(self.custom_data)))
+
+        if self.os_type == 'Linux':
+            vm_resource.os_profile.linux_configuration = self.compute_models.LinuxConfiguration(
+                disable_password_authentication=not self.ssh_password_enabled
+            )
+            if self.ssh_public_keys:
+                vm_resource.os_profile.linux_configuration.ssh = self.compute_models.SshConfiguration(
+                    public_keys=[self.compute_models.SshPublicKey(path=key['path'], key_data=key['key_data']) for key in self.ssh_public_keys]
+                )
+        else:
+            vm_resource.os_profile.windows_configuration = self.compute_models.WindowsConfiguration(
+                provision_vm_agent=True,
+                enable_automatic_updates=True,
+            )
+
+        self.log("Creating virtual machine {0}".format(name))
+        poller = self.compute_client.virtual_machines.begin_create_or_update(self.resource_group, name, vm_resource)
+        return poller.result().id
+
+    def delete_vm(self, vm):
+        '''
+        Delete a VM, then its OS disk and the network interface and public IP created with it, raising an exception on error.
+        Data disks are left in place.
+
+        :param vm: dict with the name and the VirtualMachine object of the VM
+        '''
+        name = vm['name']
+        tags = vm['vm'].tags or {}
+
+        self.log("Deleting virtual machine {0}".format(name))
+        self.compute_client.virtual_machines.begin_delete(self.resource_group, name).result()
+
+        # the disk and the NIC are released by the VM, the public IP by the NIC
+        pollers = []
+        os_disk = vm['vm'].storage_profile.os_disk
+        if os_disk.managed_disk and os_disk.managed_disk.id:
+            disk = parse_resource_id(os_disk.managed_disk.id)
+            pollers.append(self.compute_client.disks.begin_delete(disk['resource_group'], disk['name']))
+        if tags.get('_own_nic_'):
+            pollers.append(self.delete_if_exists(self.network_client.network_interfaces.begin_delete, tags['_own_nic_']))
+        for poller in pollers:
+            if poller:
+                poller.result()
+
+        if tags.get('_own_pip_'):
+            poller = self.delete_if_exists(self.network_client.public_ip_addresses.begin_delete, tags['_own_pip_'])
+            if poller:
+                poller.result()
+
+    def delete_if_exists(self, begin_delete, name):
+        try:
+            return begin_delete(self.resource_group, name)
+        except ResourceNotFoundError:
+            return None
+
+
+def main():
+    AzureRMMultipleVirtualMachines()
+
+
+if __name__ == '__main__':
+    main()
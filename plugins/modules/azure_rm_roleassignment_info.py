@@ -56,6 +56,14 @@ options:
             - Option will be silently ignored if no scope is provided.
         type: bool
         default: False
+    resolve_names:
+        description:
+            - If True, adds the role name and the display name of the principal to every returned role assignment.
+            - Role definitions are listed once per role definition scope and principals are resolved through Microsoft Graph
+              C(getByIds) in chunks of 1000, so the number of calls doesn't grow with the number of assignments.
+            - Names that can't be resolved, for example principals that were deleted, are returned as null.
+        type: bool
+        default: False
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -89,6 +97,11 @@ EXAMPLES = '''
 - name: Get role assignments by id
   azure_rm_roleassignment_info:
     id: /subscriptions/xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx/providers/Microsoft.Authorization/roleAssignments/xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
+
+- name: Audit the role assignments of a subscription with role and principal names
+  azure_rm_roleassignment_info:
+    scope: /subscriptions/xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
+    resolve_names: true
 '''
 
 RETURN = '''
@@ -140,6 +153,18 @@ roleassignments:
             type: str
             returned: always
             sample: /subscriptions/xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
+        role_name:
+            description:
+                - Name of the role definition that was assigned to principal_id.
+            type: str
+            returned: when I(resolve_names=true)
+            sample: Contributor
+        principal_display_name:
+            description:
+                - Display name of the user, group or service principal the role is assigned to.
+            type: str
+            returned: when I(resolve_names=true)
+            sample: my-service-principal
 '''
 
 try:
@@ -148,6 +173,15 @@ except ImportError:
     # This is handled in azure_rm_common
     pass
 
+try:
+    from msgraph.generated.directory_objects.get_by_ids.get_by_ids_post_request_body import GetByIdsPostRequestBody
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+# getByIds accepts at most 1000 ids per request
+GET_BY_IDS_CHUNK_SIZE = 1000
+
 
 class AzureRMRoleAssignmentInfo(AzureRMModuleBase):
 
@@ -158,7 +192,8 @@ class AzureRMRoleAssignmentInfo(AzureRMModuleBase):
             name=dict(type='str'),
             role_definition_id=dict(type='str'),
             scope=dict(type='str'),
-            strict_scope_match=dict(type='bool', default=False)
+            strict_scope_match=dict(type='bool', default=False),
+            resolve_names=dict(type='bool', default=False)
         )
 
         self.assignee = None
@@ -167,6 +202,12 @@ class AzureRMRoleAssignmentInfo(AzureRMModuleBase):
         self.role_definition_id = None
         self.scope = None
         self.strict_scope_match = None
+        self.resolve_names = None
+        self._client = None
+
+        # in-run caches, role definition scope -> {role definition name: role name}, principal id -> display name
+        self._role_names = {}
+        self._principal_names = {}
 
         self.results = dict(
             changed=False,
@@ -203,8 +244,66 @@ class AzureRMRoleAssignmentInfo(AzureRMModuleBase):
         else:
             self.results['roleassignments'] = self.list_assignments()
 
+        if self.resolve_names:
+            self.add_names(self.results['roleassignments'])
+
         return self.results
 
+    def add_names(self, assignments):
+        '''
+        Adds role and principal names to role assignment dictionaries.
+        '''
+        self.load_role_names(set(assignment['role_definition_id'] for assignment in assignments))
+        self.load_principal_names(set(assignment['principal_id'] for assignment in assignments))
+
+        for assignment in assignments:
+            role_scope, role_name = self.split_role_definition_id(assignment['role_definition_id'])
+            assignment['role_name'] = self._role_names.get(role_scope, {}).get(role_name)
+            assignment['principal_display_name'] = self._principal_names.get(assignment['principal_id'])
+
+    @staticmethod
+    def split_role_definition_id(role_definition_id):
+        scope, dummy, name = role_definition_id.lower().rpartition('/providers/microsoft.authorization/roledefinitions/')
+        return scope or '/', name
+
+    def load_role_names(self, role_definition_ids):
+        for role_definition_id in role_definition_ids:
+            role_scope, role_name = self.split_role_definition_id(role_definition_id)
+            if role_scope in self._role_names and role_name in self._role_names[role_scope]:
+                continue
+            if role_scope not in self._role_names:
+                # one list per scope resolves every role definition assignable there
+                self._role_names[role_scope] = {}
+                try:
+                    for role_definition in self.authorization_client.role_definitions.list(scope=role_scope):
+                        self._role_names[role_scope][role_definition.name.lower()] = role_definition.role_name
+                except Exception as ex:
+                    self.log("Failed to list role definitions at scope {0}: {1}".format(role_scope, str(ex)))
+            if role_name not in self._role_names[role_scope]:
+                try:
+                    role_definition = self.authorization_client.role_definitions.get_by_id(role_id=role_definition_id)
+                    self._role_names[role_scope][role_name] = role_definition.role_name
+                except Exception as ex:
+                    self.log("Failed to get role definition {0}: {1}".format(role_definition_id, str(ex)))
+                    self._role_names[role_scope][role_name] = None
+
+    def load_principal_names(self, principal_ids):
+        principal_ids = sorted(principal_id for principal_id in principal_ids if principal_id and principal_id not in self._principal_names)
+        if not principal_ids:
+            return
+        try:
+            self._client = self._client or self.get_msgraph_client()
+            chunks = [principal_ids[i:i + GET_BY_IDS_CHUNK_SIZE] for i in range(0, len(principal_ids), GET_BY_IDS_CHUNK_SIZE)]
+            for response in self.run_async_batch([self.get_directory_objects(chunk) for chunk in chunks]):
+                for directory_object in response.value or []:
+                    self._principal_names[directory_object.id] = getattr(directory_object, 'display_name', None)
+        except Exception as ex:
+            self.module.warn("Failed to resolve principal names: {0}".format(str(ex)))
+
+    async def get_directory_objects(self, ids):
+        request_body = GetByIdsPostRequestBody(ids=ids)
+        return await self._client.directory_objects.get_by_ids.post(body=request_body)
+
     def get_by_id(self):
         '''
         Gets the role assignments by specific assignment id.
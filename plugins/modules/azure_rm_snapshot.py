@@ -127,7 +127,6 @@ id:
     sample: /subscriptions/xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxxx/resourceGroups/myResourceGroup/providers/Microsoft.Compute/snapshots/mySnapshot
 '''
 
-import time
 import json
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_rest import GenericRestClient
@@ -312,8 +311,9 @@ class AzureRMSnapshots(AzureRMModuleBaseExt):
 
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_resource():
-                time.sleep(20)
+            self.wait_for_provisioning_state(self.get_resource, lambda response: not response, 600,
+                                             "deletion of snapshot {0}".format(self.name), initial_delay=2, max_delay=20,
+                                             timeout_message="Error waiting for deletion of snapshot {0} after 600 seconds".format(self.name))
         else:
             self.log('Snapshot instance unchanged')
             self.results['changed'] = False
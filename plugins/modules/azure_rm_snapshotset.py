@@ -0,0 +1,503 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2026 xuzhang3 (@xuzhang3), Fred-sun (@Fred-sun)
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_snapshotset
+version_added: "2.4.0"
+short_description: Manage sets of Azure snapshots taken together
+description:
+    - Snapshot several managed disks, or all disks of a virtual machine, at nearly the same moment.
+    - The snapshots of a set are created in parallel and tagged with the name and the ID of the set.
+    - Older sets of the same name are pruned by count and age after a new set is created.
+options:
+    resource_group:
+        description:
+            - The name of the resource group of the snapshots.
+        required: true
+        type: str
+    name:
+        description:
+            - Name of the series of snapshot sets, for example C(myVM-nightly).
+            - The snapshots are tagged with C(snapshot_set=<name>), C(snapshot_set_id=<set_id>) and C(snapshot_set_size=<number of snapshots>).
+        required: true
+        type: str
+    set_id:
+        description:
+            - ID of the snapshot set, part of the name of every snapshot of the set.
+            - Defaults to the current UTC time, for example C(20240101T020000Z), so every run creates a new set.
+            - When a complete set with this ID exists no snapshot is created.
+            - With I(state=absent), only delete this set.
+        type: str
+    disks:
+        description:
+            - Managed disks to snapshot, as names of disks in I(resource_group) or resource IDs.
+            - Mutually exclusive with I(virtual_machine).
+        type: list
+        elements: str
+    virtual_machine:
+        description:
+            - Snapshot the managed disks of this virtual machine, given as name in I(resource_group) or resource ID.
+            - Mutually exclusive with I(disks).
+        type: str
+    include_os_disk:
+        description:
+            - Whether to snapshot the OS disk of I(virtual_machine) along with its data disks.
+        type: bool
+        default: true
+    incremental:
+        description:
+            - Whether the snapshots are incremental.
+            - Incremental snapshots only store the changes since the previous snapshot of the disk.
+        type: bool
+        default: true
+    sku:
+        description:
+            - The snapshots SKU.
+        type: str
+        choices:
+            - Standard_LRS
+            - Premium_LRS
+            - Standard_ZRS
+    keep:
+        description:
+            - Number of most recent complete sets of I(name) to keep, including the new set.
+        type: int
+    older_than_days:
+        description:
+            - Delete the sets of I(name) created more than this number of days ago.
+            - Combined with I(keep), the sets kept by I(keep) aren't deleted regardless of their age.
+        type: int
+    max_concurrency:
+        description:
+            - Maximum number of snapshots created or deleted in parallel.
+        type: int
+        default: 20
+    state:
+        description:
+            - Assert the state of the snapshot set.
+            - Use C(present) to create a set and prune the old sets, C(absent) to delete the set I(set_id) or all sets of I(name).
+        default: present
+        type: str
+        choices:
+            - absent
+            - present
+notes:
+    - The snapshots of a set are requested in parallel, they are crash-consistent per disk and taken within seconds of each other.
+      For application consistency, quiesce the application while the module runs.
+    - When a snapshot of the new set fails, the snapshots of the set that were created are deleted and no set is pruned,
+      so a failed run never leaves a partial set behind nor deletes an older complete set.
+    - A set is complete when it has as many snapshots as its C(snapshot_set_size) tag and all of them are provisioned.
+      Incomplete sets, for example left by an interrupted run, aren't counted by I(keep) and are deleted when I(keep) or I(older_than_days) is set.
+extends_documentation_fragment:
+    - azure.azcollection.azure
+    - azure.azcollection.azure_tags
+author:
+    - xuzhang3 (@xuzhang3)
+    - Fred-sun (@Fred-sun)
+'''
+
+EXAMPLES = '''
+- name: Snapshot all disks of a VM, keeping the 7 most recent sets
+  azure_rm_snapshotset:
+    resource_group: myResourceGroup
+    name: myVM-nightly
+    virtual_machine: myVM
+    keep: 7
+
+- name: Snapshot data disks of a database cluster together
+  azure_rm_snapshotset:
+    resource_group: myResourceGroup
+    name: db-hourly
+    disks:
+      - db1-data
+      - db2-data
+      - /subscriptions/xxx-xxx/resourceGroups/otherResourceGroup/providers/Microsoft.Compute/disks/db3-data
+    older_than_days: 2
+    max_concurrency: 50
+
+- name: Delete a snapshot set
+  azure_rm_snapshotset:
+    resource_group: myResourceGroup
+    name: myVM-nightly
+    set_id: 20240101T020000Z
+    state: absent
+'''
+
+RETURN = '''
+set_id:
+    description:
+        - ID of the snapshot set.
+    returned: always
+    type: str
+    sample: 20240101T020000Z
+snapshots:
+    description:
+        - The snapshots of the set, created or found.
+        - With I(state=absent), the deleted snapshots.
+    returned: always
+    type: complex
+    contains:
+        id:
+            description:
+                - Resource ID of the snapshot, C(None) in check mode if the snapshot would be created.
+            returned: always
+            type: str
+            sample: /subscriptions/xxx-xxx/resourceGroups/myResourceGroup/providers/Microsoft.Compute/snapshots/myDisk-20240101T020000Z
+        name:
+            description:
+                - Name of the snapshot.
+            returned: always
+            type: str
+            sample: myDisk-20240101T020000Z
+        set_id:
+            description:
+                - ID of the set of the snapshot.
+            returned: always
+            type: str
+            sample: 20240101T020000Z
+        source_id:
+            description:
+                - Resource ID of the snapshotted disk.
+            returned: always
+            type: str
+            sample: /subscriptions/xxx-xxx/resourceGroups/myResourceGroup/providers/Microsoft.Compute/disks/myDisk
+        error:
+            description:
+                - The error that occurred creating or deleting the snapshot.
+                - The module fails after all other snapshots are done when any snapshot has an error.
+            returned: always
+            type: str
+            sample: null
+rolled_back:
+    description:
+        - The snapshots of the new set that were deleted because another snapshot of the set failed.
+        - Same fields as I(snapshots).
+    returned: when a snapshot of the new set fails
+    type: list
+    elements: dict
+pruned:
+    description:
+        - The snapshots of the older sets that were deleted, or would be deleted in check mode.
+        - Same fields as I(snapshots).
+    returned: always
+    type: list
+    elements: dict
+'''
+
+from datetime import datetime, timedelta, timezone
+
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, map_bounded
+
+try:
+    from azure.mgmt.core.tools import parse_resource_id, resource_id
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+
+SET_NAME_TAG = 'snapshot_set'
+SET_ID_TAG = 'snapshot_set_id'
+SET_SIZE_TAG = 'snapshot_set_size'
+# maximum length of a snapshot name
+MAX_NAME_LENGTH = 80
+
+
+class AzureRMSnapshotSet(AzureRMModuleBase):
+
+    def __init__(self):
+
+        self.module_arg_spec = dict(
+            resource_group=dict(type='str', required=True),
+            name=dict(type='str', required=True),
+            set_id=dict(type='str'),
+            disks=dict(type='list', elements='str'),
+            virtual_machine=dict(type='str'),
+            include_os_disk=dict(type='bool', default=True),
+            incremental=dict(type='bool', default=True),
+            sku=dict(type='str', choices=['Standard_LRS', 'Premium_LRS', 'Standard_ZRS']),
+            keep=dict(type='int'),
+            older_than_days=dict(type='int'),
+            max_concurrency=dict(type='int', default=20),
+            state=dict(type='str', default='present', choices=['present', 'absent']),
+        )
+
+        self.resource_group = None
+        self.name = None
+        self.set_id = None
+        self.disks = None
+        self.virtual_machine = None
+        self.include_os_disk = None
+        self.incremental = None
+        self.sku = None
+        self.keep = None
+        self.older_than_days = None
+        self.max_concurrency = None
+        self.state = None
+        self.tags = None
+
+        self.results = dict(
+            changed=False,
+            set_id=None,
+            snapshots=[],
+            pruned=[]
+        )
+
+        mutually_exclusive = [('disks', 'virtual_machine')]
+        required_if = [('state', 'present', ['disks', 'virtual_machine'], True)]
+
+        super(AzureRMSnapshotSet, self).__init__(self.module_arg_spec,
+                                                 supports_check_mode=True,
+                                                 supports_tags=True,
+                                                 mutually_exclusive=mutually_exclusive,
+                                                 required_if=required_if)
+
+    def exec_module(self, **kwargs):
+
+        for key in list(self.module_arg_spec.keys()) + ['tags']:
+            setattr(self, key, kwargs[key])
+
+        if self.keep is not None and self.keep < 1:
+            self.fail("keep must be 1 or greater")
+
+        sets = self.list_snapshot_sets()
+
+        if self.state == 'absent':
+            if self.set_id:
+                snapshots = sets.get(self.set_id, [])
+            else:
+                snapshots = [snapshot for set_snapshots in sets.values() for snapshot in set_snapshots]
+            self.results['set_id'] = self.set_id
+            self.results['snapshots'] = self.delete_snapshots([snapshot_to_dict(snapshot) for snapshot in snapshots])
+            errors = [snapshot for snapshot in self.results['snapshots'] if snapshot['error']]
+            if errors:
+                self.fail("Error deleting {0} of {1} snapshots".format(len(errors), len(snapshots)), **self.results)
+            return self.results
+
+        self.set_id = self.set_id or datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        self.results['set_id'] = self.set_id
+
+        if self.set_id in sets and is_complete_set(sets[self.set_id]):
+            self.log("Snapshot set {0} {1} already exists".format(self.name, self.set_id))
+            self.results['snapshots'] = [snapshot_to_dict(snapshot) for snapshot in sets[self.set_id]]
+        else:
+            self.results['snapshots'] = self.create_snapshots(self.get_source_disks())
+            errors = [snapshot for snapshot in self.results['snapshots'] if snapshot['error']]
+            if errors:
+                # don't leave a partial set behind
+                self.results['rolled_back'] = self.delete_snapshots([dict(snapshot) for snapshot in self.results['snapshots'] if snapshot['id']])
+                self.fail("Error creating {0} of {1} snapshots of set {2}".format(len(errors), len(self.results['snapshots']), self.set_id),
+                          **self.results)
+
+        self.results['pruned'] = self.delete_snapshots([snapshot_to_dict(snapshot) for snapshot in self.get_expired_snapshots(sets)])
+        errors = [snapshot for snapshot in self.results['pruned'] if snapshot['error']]
+        if errors:
+            self.fail("Error pruning {0} of {1} snapshots".format(len(errors), len(self.results['pruned'])), **self.results)
+
+        return self.results
+
+    def list_snapshot_sets(self):
+        '''
+        List the snapshots of the resource group tagged with the name of the set series.
+
+        :return: dict of set ID to list of snapshots
+        '''
+        sets = dict()
+        try:
+            for snapshot in self.compute_client.snapshots.list_by_resource_group(self.resource_group):
+                tags = snapshot.tags or {}
+                if tags.get(SET_NAME_TAG) == self.name and tags.get(SET_ID_TAG):
+                    sets.setdefault(tags[SET_ID_TAG], []).append(snapshot)
+        except Exception as exc:
+            self.fail("Error listing snapshots of resource group {0} - {1}".format(self.resource_group, str(exc)))
+        return sets
+
+    def get_source_disks(self):
+        '''
+        Resolve the disks to snapshot, reading the given disks in parallel.
+
+        :return: list of dict(id, name, location)
+        '''
+        if self.virtual_machine:
+            return self.get_virtual_machine_disks()
+
+        disk_ids = []
+        for disk in self.disks:
+            if '/' not in disk:
+                disk = resource_id(subscription=self.subscription_id, resource_group=self.resource_group,
+                                   namespace='Microsoft.Compute', type='disks', name=disk)
+            disk_ids.append(disk)
+
+        def get_disk(disk_id):
+            parsed = parse_resource_id(disk_id)
+            return self.compute_client.disks.get(parsed.get('resource_group'), parsed.get('name'))
+
+        disks = []
+        errors = []
+        for disk_id, disk in zip(disk_ids, map_bounded(get_disk, disk_ids, self.max_concurrency)):
+            if isinstance(disk, Exception):
+                errors.append("Error getting managed disk {0} - {1}".format(disk_id, str(disk)))
+            else:
+                disks.append(dict(id=disk.id, name=disk.name, location=disk.location))
+        if errors:
+            self.fail(msg="Error getting managed disks.", errors=errors)
+        return disks
+
+    def get_virtual_machine_disks(self):
+        if '/' in self.virtual_machine:
+            parsed = parse_resource_id(self.virtual_machine)
+            resource_group, name = parsed.get('resource_group'), parsed.get('name')
+        else:
+            resource_group, name = self.resource_group, self.virtual_machine
+        try:
+            vm = self.compute_client.virtual_machines.get(resource_group, name)
+        except Exception as exc:
+            self.fail("Error getting virtual machine {0}/{1} - {2}".format(resource_group, name, str(exc)))
+
+        storage_profile = vm.storage_profile
+        vm_disks = list(storage_profile.data_disks or [])
+        if self.include_os_disk:
+            vm_disks.insert(0, storage_profile.os_disk)
+
+        disks = []
+        for vm_disk in vm_disks:
+            if not vm_disk.managed_disk or not vm_disk.managed_disk.id:
+                self.fail("Disk {0} of virtual machine {1} is not a managed disk and can't be snapshotted".format(vm_disk.name, name))
+            disks.append(dict(id=vm_disk.managed_disk.id, name=vm_disk.name, location=vm.location))
+        return disks
+
+    def get_snapshot_name(self, disk_name):
+        return "{0}-{1}".format(disk_name[:MAX_NAME_LENGTH - len(self.set_id) - 1], self.set_id)
+
+    def create_snapshots(self, disks):
+        '''
+        Request the snapshots of all disks in parallel, then wait for them together.
+        '''
+        snapshots = [dict(id=None, name=self.get_snapshot_name(disk['name']), set_id=self.set_id, source_id=disk['id'], error=None)
+                     for disk in disks]
+        names = [snapshot['name'] for snapshot in snapshots]
+        duplicates = sorted(set(name for name in names if names.count(name) > 1))
+        if duplicates:
+            self.fail("Snapshot names {0} of set {1} aren't unique, the disks must have different names".format(duplicates, self.set_id))
+
+        self.results['changed'] = bool(snapshots)
+        if self.check_mode or not snapshots:
+            return snapshots
+
+        tags = dict(self.tags or {})
+        tags[SET_NAME_TAG] = self.name
+        tags[SET_ID_TAG] = self.set_id
+        tags[SET_SIZE_TAG] = str(len(snapshots))
+
+        def begin_create(item):
+            snapshot, disk = item
+            parameters = self.compute_models.Snapshot(
+                location=disk['location'],
+                tags=tags,
+                sku=self.compute_models.SnapshotSku(name=self.sku) if self.sku else None,
+                creation_data=self.compute_models.CreationData(create_option=self.compute_models.DiskCreateOption.copy,
+                                                               source_resource_id=disk['id']),
+                incremental=self.incremental
+            )
+            self.log("Creating snapshot {0} of disk {1}".format(snapshot['name'], disk['id']))
+            return self.compute_client.snapshots.begin_create_or_update(self.resource_group, snapshot['name'], parameters)
+
+        pollers = map_bounded(begin_create, list(zip(snapshots, disks)), self.max_concurrency)
+        pending = [(snapshot, poller) for snapshot, poller in zip(snapshots, pollers) if not isinstance(poller, Exception)]
+        results = self.get_multiple_pollers_results([poller for snapshot, poller in pending], return_exceptions=True)
+
+        outcomes = dict((snapshot['name'], result) for (snapshot, poller), result in zip(pending, results))
+        for snapshot, poller in zip(snapshots, pollers):
+            outcome = outcomes.get(snapshot['name'], poller)
+            if isinstance(outcome, Exception):
+                self.log("Error creating snapshot {0} - {1}".format(snapshot['name'], str(outcome)))
+                snapshot['error'] = str(outcome)
+            else:
+                snapshot['id'] = outcome.id
+        return snapshots
+
+    def get_expired_snapshots(self, sets):
+        '''
+        Select the snapshots of the complete sets beyond the I(keep) most recent sets and older than I(older_than_days),
+        and of the incomplete sets.
+        '''
+        if self.keep is None and self.older_than_days is None:
+            return []
+
+        expired = []
+        complete = dict()
+        for set_id, snapshots in sets.items():
+            if set_id == self.set_id:
+                continue
+            if is_complete_set(snapshots):
+                complete[set_id] = snapshots
+            else:
+                self.log("Snapshot set {0} {1} is incomplete".format(self.name, set_id))
+                expired.extend(snapshots)
+
+        now = datetime.now(timezone.utc)
+        created = dict((set_id, min(snapshot.time_created or now for snapshot in snapshots)) for set_id, snapshots in complete.items())
+        # the set of this run is the most recent one
+        created[self.set_id] = now
+        newest_first = sorted(created, key=lambda set_id: created[set_id], reverse=True)
+
+        cutoff = now - timedelta(days=self.older_than_days) if self.older_than_days is not None else None
+        for set_id in newest_first[self.keep or 0:]:
+            if set_id == self.set_id or (cutoff and created[set_id] >= cutoff):
+                continue
+            expired.extend(complete[set_id])
+        return expired
+
+    def delete_snapshots(self, snapshots):
+        '''
+        Delete the snapshots, given as dicts, in parallel, waiting for every deletion to complete.
+        '''
+        if not snapshots:
+            return snapshots
+        self.results['changed'] = True
+        if self.check_mode:
+            return snapshots
+
+        def delete(snapshot):
+            self.log("Deleting snapshot {0}".format(snapshot['name']))
+            parsed = parse_resource_id(snapshot['id'])
+            self.get_poller_result(self.compute_client.snapshots.begin_delete(parsed.get('resource_group'), snapshot['name']))
+
+        for snapshot, outcome in zip(snapshots, map_bounded(delete, snapshots, self.max_concurrency)):
+            if isinstance(outcome, Exception):
+                self.log("Error deleting snapshot {0} - {1}".format(snapshot['name'], str(outcome)))
+                snapshot['error'] = str(outcome)
+        return snapshots
+
+
+def is_complete_set(snapshots):
+    '''
+    Whether all snapshots of a set were created, per the size the set was tagged with.
+    '''
+    size = (snapshots[0].tags or {}).get(SET_SIZE_TAG)
+    return size == str(len(snapshots)) and all(snapshot.provisioning_state == 'Succeeded' for snapshot in snapshots)
+
+
+def snapshot_to_dict(snapshot):
+    return dict(
+        id=snapshot.id,
+        name=snapshot.name,
+        set_id=(snapshot.tags or {}).get(SET_ID_TAG),
+        source_id=snapshot.creation_data.source_resource_id if snapshot.creation_data else None,
+        error=None
+    )
+
+
+def main():
+    AzureRMSnapshotSet()
+
+
+if __name__ == '__main__':
+    main()
@@ -605,6 +605,25 @@ options:
                     - The flag that enables or disables a capability to have one or more managed data disks with UltraSSD_LRS storage account type on the VM.
                     - Managed disks with storage account type UltraSSD_LRS can be added to a virtual machine set only if this property is enabled.
                 type: bool
+    provisioning_timeout:
+        description:
+            - Maximum number of seconds to wait for the virtual machine to leave a transitional provisioning state such as C(Updating)
+              before reading or changing it.
+            - The state is polled after 5 seconds, then with a doubling interval of up to 60 seconds.
+        type: int
+        default: 3000
+
+    cache_ttl:
+        description:
+            - Seconds the VM sizes of the location and the resolved marketplace image version are cached on disk,
+              in C(~/.ansible/azure_rm_cache).
+            - The cache is shared with the other virtual machine modules, so creating many virtual machines in a location validates the size
+              and resolves the image once per period.
+            - With I(image.version=latest), a version published during the period is used once the cached entry expires.
+            - Also caches the index of image names used to find a custom I(image) given without a resource group.
+            - Set to C(0) to disable the cache.
+        type: int
+        default: 3600
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -905,6 +924,23 @@ deleted_public_ips:
     returned: 'on delete'
     type: list
     sample: ["testvm1001"]
+deleted_resources:
+    description:
+        - Outcome of the deletion of every resource removed with the VM according to I(remove_on_absent).
+        - Disks and NICs are deleted concurrently once the VM is deleted, public IPs, NSGs and storage accounts once the NICs are.
+        - A failed deletion doesn't stop the others, the module fails once all were attempted.
+    returned: 'on delete'
+    type: list
+    elements: dict
+    sample: [
+        {
+            "type": "network_interface",
+            "resource_group": "myResourceGroup",
+            "name": "testvm1001",
+            "deleted": true,
+            "error": null
+        }
+    ]
 azure_vm:
     description:
         - Facts about the current state of the object. Note that facts are not part of the registered output but available directly.
@@ -1059,7 +1095,7 @@ azure_vm:
 import base64
 import random
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from azure.core.exceptions import ResourceNotFoundError
@@ -1076,12 +1112,19 @@ from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common
                                                                                          normalize_location_name,
                                                                                          format_resource_id
                                                                                          )
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_computemetadata import (COMPUTE_METADATA_CACHE_TTL,
+                                                                                                  list_vm_sizes,
+                                                                                                  get_image_version,
+                                                                                                  get_custom_image_id)
 
 
 AZURE_OBJECT_CLASS = 'VirtualMachine'
 
 AZURE_ENUM_MODULES = ['azure.mgmt.compute.models']
 
+# resources of a deleted VM deleted in parallel
+DELETE_CONCURRENCY = 8
+
 
 def extract_names_from_blob_uri(blob_uri, storage_suffix):
     # HACK: ditch this once python SDK supports get by URI
@@ -1223,12 +1266,16 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
                 options=dict(
                     ultra_ssd_enabled=dict(type='bool')
                 )
-            )
+            ),
+            provisioning_timeout=dict(type='int', default=3000),
+            cache_ttl=dict(type='int', default=COMPUTE_METADATA_CACHE_TTL)
         )
 
         self.resource_group = None
         self.name = None
         self.custom_data = None
+        self.provisioning_timeout = None
+        self.cache_ttl = None
         self.state = None
         self.location = None
         self.short_hostname = None
@@ -1396,7 +1443,7 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
                     marketplace_image = self.get_marketplace_image_version()
 
                     if self.image['version'] == 'latest':
-                        self.image['version'] = marketplace_image.name
+                        self.image['version'] = marketplace_image['name']
                         self.log("Using image version {0}".format(self.image['version']))
 
                     image_reference = self.compute_models.ImageReference(
@@ -1444,18 +1491,11 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
 
         try:
             self.log("Fetching virtual machine {0}".format(self.name))
-            vm = self.compute_client.virtual_machines.get(self.resource_group, self.name, expand='instanceview')
-            retry_count = 0
-            while True:
-                if retry_count == 10:
-                    self.fail("Error {0} has a provisioning state of Updating. Expecting state to be Successed.".format(self.name))
-
-                if vm.provisioning_state == 'Updating':
-                    retry_count = retry_count + 1
-                    time.sleep(300)
-                    vm = self.compute_client.virtual_machines.get(self.resource_group, self.name, expand='instanceview')
-                else:
-                    break
+            vm = self.wait_for_provisioning_state(
+                lambda: self.compute_client.virtual_machines.get(self.resource_group, self.name, expand='instanceview'),
+                lambda vm: vm.provisioning_state != 'Updating',
+                self.provisioning_timeout,
+                "virtual machine {0}".format(self.name))
 
             vm_dict = self.serialize_vm(vm)
 
@@ -2384,24 +2424,16 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
         :return: VirtualMachine object
         '''
         try:
-            retry_count = 0
-            vm = self.compute_client.virtual_machines.get(self.resource_group, self.name, expand='instanceview')
-            while True:
-                if retry_count == 20:
-                    self.fail("Error {0} has a provisioning state of Updating. Expecting state to be Successed.".format(self.name))
-
-                if vm.provisioning_state != 'Succeeded':
-                    retry_count = retry_count + 1
-                    time.sleep(150)
-                    vm = self.compute_client.virtual_machines.get(self.resource_group, self.name, expand='instanceview')
-                else:
-                    p_state = None
-                    for s in vm.instance_view.statuses:
-                        if s.code.startswith('PowerState'):
-                            p_state = s.code
-                    if p_state is not None:
-                        break
-            return vm
+            def is_ready(vm):
+                # the power state is reported once provisioning succeeded
+                return vm.provisioning_state == 'Succeeded' and \
+                    any(s.code.startswith('PowerState') for s in vm.instance_view.statuses)
+
+            return self.wait_for_provisioning_state(
+                lambda: self.compute_client.virtual_machines.get(self.resource_group, self.name, expand='instanceview'),
+                is_ready,
+                self.provisioning_timeout,
+                "virtual machine {0}".format(self.name))
         except Exception as exc:
             self.fail("Error getting virtual machine {0} - {1}".format(self.name, str(exc)))
 
@@ -2581,32 +2613,93 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
         except Exception as exc:
             self.fail("Error deleting virtual machine {0} - {1}".format(self.name, str(exc)))
 
-        # TODO: parallelize nic, vhd, and public ip deletions with begin_deleting
-        # TODO: best-effort to keep deleting other linked resources if we encounter an error
+        # disks and NICs are released by the VM, public IPs and NSGs by the NICs, the storage account holds the VHDs
+        disks_and_nics = []
+        ips_and_nsgs = []
         if self.remove_on_absent.intersection(set(['all', 'virtual_storage'])):
-            self.log('Deleting VHDs')
-            self.delete_vm_storage(vhd_uris)
-            self.log('Deleting managed disks')
-            self.delete_managed_disks(managed_disk_ids)
-
-        if 'all' in self.remove_on_absent or 'all_autocreated' in self.remove_on_absent:
-            self.remove_autocreated_resources(vm.tags)
-
+            disks_and_nics.extend(('vhd', None, uri) for uri in vhd_uris)
+            disks_and_nics.extend(('managed_disk', None, mdi) for mdi in managed_disk_ids)
         if self.remove_on_absent.intersection(set(['all', 'network_interfaces'])):
-            self.log('Deleting network interfaces')
-            for nic_dict in nic_names:
-                self.delete_nic(nic_dict['resource_group'], nic_dict['name'])
-
+            disks_and_nics.extend(('network_interface', nic_dict['resource_group'], nic_dict['name']) for nic_dict in nic_names)
         if self.remove_on_absent.intersection(set(['all', 'public_ips'])):
-            self.log('Deleting public IPs')
-            for pip_dict in pip_names:
-                self.delete_pip(pip_dict['resource_group'], pip_dict['name'])
-
-        if 'all' in self.remove_on_absent or 'all_autocreated' in self.remove_on_absent:
-            self.remove_autocreated_resources(vm.tags)
+            ips_and_nsgs.extend(('public_ip', pip_dict['resource_group'], pip_dict['name']) for pip_dict in pip_names)
+
+        if vm.tags and ('all' in self.remove_on_absent or 'all_autocreated' in self.remove_on_absent):
+            if vm.tags.get('_own_nic_'):
+                disks_and_nics.append(('network_interface', self.resource_group, vm.tags['_own_nic_']))
+            if vm.tags.get('_own_pip_'):
+                ips_and_nsgs.append(('public_ip', self.resource_group, vm.tags['_own_pip_']))
+            if vm.tags.get('_own_nsg_'):
+                ips_and_nsgs.append(('network_security_group', self.resource_group, vm.tags['_own_nsg_']))
+            if vm.tags.get('_own_sa_'):
+                ips_and_nsgs.append(('storage_account', self.resource_group, vm.tags['_own_sa_']))
+
+        outcomes = self.delete_resources(disks_and_nics)
+        outcomes.extend(self.delete_resources(ips_and_nsgs))
+        self.results['deleted_resources'] = outcomes
+
+        failed = [outcome for outcome in outcomes if not outcome['deleted']]
+        if failed:
+            self.fail("Deleted virtual machine {0} but failed to delete {1}".format(
+                      self.name, ', '.join('{0} {1} - {2}'.format(outcome['type'], outcome['name'], outcome['error']) for outcome in failed)),
+                      deleted_resources=outcomes)
 
         return True
 
+    def delete_resources(self, resources):
+        '''
+        Delete resources concurrently, continuing with the others when a deletion fails.
+
+        :param resources: list of (resource type, resource group, name) tuples, duplicates are deleted once
+        :return: list of dict with the type, name, deleted and error of every resource
+        '''
+        unique = []
+        for resource_type, resource_group, name in resources:
+            if not any(resource_type == other[0] and (resource_group or '').lower() == (other[1] or '').lower() and
+                       name.lower() == other[2].lower() for other in unique):
+                unique.append((resource_type, resource_group, name))
+
+        outcomes = []
+        if not unique:
+            return outcomes
+        with ThreadPoolExecutor(max_workers=DELETE_CONCURRENCY) as executor:
+            futures = [executor.submit(self.delete_resource, *resource) for resource in unique]
+            for (resource_type, resource_group, name), future in zip(unique, futures):
+                outcome = dict(type=resource_type, resource_group=resource_group, name=name, deleted=True, error=None)
+                try:
+                    future.result()
+                    self.results['actions'].append("Deleted {0} {1}".format(resource_type, name))
+                except Exception as exc:
+                    self.log("Error deleting {0} {1} - {2}".format(resource_type, name, str(exc)))
+                    outcome.update(deleted=False, error=str(exc))
+                outcomes.append(outcome)
+        return outcomes
+
+    def delete_resource(self, resource_type, resource_group, name):
+        '''
+        Delete a resource of a deleted VM, raising an exception on error.
+
+        :param resource_type: vhd, managed_disk, network_interface, public_ip, network_security_group or storage_account
+        :param resource_group: resource group of the resource, None for VHD URIs and managed disk IDs
+        :param name: name of the resource, VHD URI or managed disk ID
+        '''
+        self.log("Deleting {0} {1}".format(resource_type, name))
+        if resource_type == 'vhd':
+            self.delete_vhd(name)
+            return
+        if resource_type == 'storage_account':
+            self.storage_client.storage_accounts.delete(resource_group, name)
+            return
+        if resource_type == 'managed_disk':
+            poller = self.rm_client.resources.begin_delete_by_id(name, '2017-03-30')
+        elif resource_type == 'network_interface':
+            poller = self.network_client.network_interfaces.begin_delete(resource_group, name)
+        elif resource_type == 'public_ip':
+            poller = self.network_client.public_ip_addresses.begin_delete(resource_group, name)
+        else:
+            poller = self.network_client.network_security_groups.begin_delete(resource_group, name)
+        self.get_poller_result(poller)
+
     def get_network_interface(self, resource_group, name):
         try:
             nic = self.network_client.network_interfaces.get(resource_group, name)
@@ -2645,15 +2738,6 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
             self.fail("Error deleting {0} - {1}".format(name, str(exc)))
         return True
 
-    def delete_managed_disks(self, managed_disk_ids):
-        for mdi in managed_disk_ids:
-            try:
-                poller = self.rm_client.resources.begin_delete_by_id(mdi, '2017-03-30')
-                self.get_poller_result(poller)
-            except Exception as exc:
-                self.fail("Error deleting managed disk {0} - {1}".format(mdi, str(exc)))
-        return True
-
     def delete_storage_account(self, resource_group, name):
         self.log("Delete storage account {0}".format(name))
         self.results['actions'].append("Deleted storage account {0}".format(name))
@@ -2663,46 +2747,31 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
             self.fail("Error deleting storage account {0} - {1}".format(name, str(exc)))
         return True
 
-    def delete_vm_storage(self, vhd_uris):
+    def delete_vhd(self, uri):
         # FUTURE: figure out a cloud_env indepdendent way to delete these
-        for uri in vhd_uris:
-            self.log("Extracting info from blob uri '{0}'".format(uri))
-            try:
-                blob_parts = extract_names_from_blob_uri(uri, self._cloud_environment.suffixes.storage_endpoint)
-            except Exception as exc:
-                self.fail("Error parsing blob URI {0}".format(str(exc)))
-            storage_account_name = blob_parts['accountname']
-            container_name = blob_parts['containername']
-            blob_name = blob_parts['blobname']
+        self.log("Extracting info from blob uri '{0}'".format(uri))
+        blob_parts = extract_names_from_blob_uri(uri, self._cloud_environment.suffixes.storage_endpoint)
+        storage_account_name = blob_parts['accountname']
+        container_name = blob_parts['containername']
+        blob_name = blob_parts['blobname']
 
-            blob_service_client = self.get_blob_service_client(self.resource_group, storage_account_name)
+        blob_service_client = self.get_blob_service_client(self.resource_group, storage_account_name)
 
-            self.log("Delete blob {0}:{1}".format(container_name, blob_name))
-            self.results['actions'].append("Deleted blob {0}:{1}".format(container_name, blob_name))
-            try:
-                blob_service_client.get_blob_client(container=container_name, blob=blob_name).delete_blob()
-            except Exception as exc:
-                self.fail("Error deleting blob {0}:{1} - {2}".format(container_name, blob_name, str(exc)))
+        self.log("Delete blob {0}:{1}".format(container_name, blob_name))
+        blob_service_client.get_blob_client(container=container_name, blob=blob_name).delete_blob()
         return True
 
     def get_marketplace_image_version(self):
         try:
-            versions = self.compute_client.virtual_machine_images.list(self.location,
-                                                                       self.image['publisher'],
-                                                                       self.image['offer'],
-                                                                       self.image['sku'],
-                                                                       orderby='name')
+            version = get_image_version(self, self.location, self.image['publisher'], self.image['offer'], self.image['sku'],
+                                        self.image['version'], self.cache_ttl)
         except Exception as exc:
             self.fail("Error fetching image {0} {1} {2} - {3}".format(self.image['publisher'],
                                                                       self.image['offer'],
                                                                       self.image['sku'],
                                                                       str(exc)))
-        if versions and len(versions) > 0:
-            if self.image['version'] == 'latest':
-                return versions[len(versions) - 1]
-            for version in versions:
-                if version.name == self.image['version']:
-                    return version
+        if version:
+            return version
 
         self.fail("Error could not find image {0} {1} {2} {3}".format(self.image['publisher'],
                                                                       self.image['offer'],
@@ -2712,17 +2781,13 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
 
     def get_custom_image_reference(self, name, resource_group=None):
         try:
-            if resource_group:
-                vm_images = self.compute_client.images.list_by_resource_group(resource_group)
-            else:
-                vm_images = self.compute_client.images.list()
+            image_id = get_custom_image_id(self, name, resource_group, self.cache_ttl)
         except Exception as exc:
             self.fail("Error fetching custom images from subscription - {0}".format(str(exc)))
 
-        for vm_image in vm_images:
-            if vm_image.name == name:
-                self.log("Using custom image id {0}".format(vm_image.id))
-                return self.compute_models.ImageReference(id=vm_image.id)
+        if image_id:
+            self.log("Using custom image id {0}".format(image_id))
+            return self.compute_models.ImageReference(id=image_id)
 
         self.fail("Error could not find image with name {0}".format(name))
         return None
@@ -2763,13 +2828,10 @@ class AzureRMVirtualMachine(AzureRMModuleBase):
         :return: boolean
         '''
         try:
-            sizes = self.compute_client.virtual_machine_sizes.list(self.location)
+            sizes = list_vm_sizes(self, self.location, self.cache_ttl)
         except Exception as exc:
             self.fail("Error retrieving available machine sizes - {0}".format(str(exc)))
-        for size in sizes:
-            if size.name == self.vm_size:
-                return True
-        return False
+        return any(size['name'] == self.vm_size for size in sizes)
 
     def create_default_storage_account(self, vm_dict=None):
         '''
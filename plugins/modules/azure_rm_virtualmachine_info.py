@@ -334,11 +334,15 @@ except Exception:
 
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
 from ansible.module_utils.six.moves.urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 import re
 
 
 AZURE_OBJECT_CLASS = 'VirtualMachine'
 
+# instance views of listed virtual machines fetched in parallel
+INSTANCE_VIEW_CONCURRENCY = 10
+
 AZURE_ENUM_MODULES = ['azure.mgmt.compute.models']
 
 
@@ -404,11 +408,7 @@ class AzureRMVirtualMachineInfo(AzureRMModuleBase):
         except ResourceNotFoundError as exc:
             self.fail("Failed to list all items - {0}".format(str(exc)))
 
-        results = []
-        for item in items:
-            if self.has_tags(item.tags, self.tags):
-                results.append(self.get_vm(self.resource_group, item.name))
-        return results
+        return self.serialize_vms([item for item in items if self.has_tags(item.tags, self.tags)])
 
     def list_all_items(self):
         self.log('List all items')
@@ -417,11 +417,7 @@ class AzureRMVirtualMachineInfo(AzureRMModuleBase):
         except ResourceNotFoundError as exc:
             self.fail("Failed to list all items - {0}".format(str(exc)))
 
-        results = []
-        for item in items:
-            if self.has_tags(item.tags, self.tags):
-                results.append(self.get_vm(parse_resource_id(item.id).get('resource_group'), item.name))
-        return results
+        return self.serialize_vms([item for item in items if self.has_tags(item.tags, self.tags)])
 
     def get_vm(self, resource_group, name):
         '''
@@ -435,26 +431,50 @@ class AzureRMVirtualMachineInfo(AzureRMModuleBase):
         except ResourceNotFoundError as exc:
             self.fail("Error getting virtual machine {0} - {1}".format(self.name, str(exc)))
 
+    def get_instance_view(self, vm):
+        resource_group = parse_resource_id(vm.id).get('resource_group')
+        return self.compute_client.virtual_machines.instance_view(resource_group, vm.name)
+
+    def serialize_vms(self, vms):
+        '''
+        Convert listed VirtualMachine objects to dicts.
+
+        The list API doesn't return instance views, they are fetched in parallel instead of getting every VM again.
+
+        :param vms: list of VirtualMachine objects
+        :return: list of dict
+        '''
+        results = []
+        with ThreadPoolExecutor(max_workers=INSTANCE_VIEW_CONCURRENCY) as executor:
+            futures = [executor.submit(self.get_instance_view, vm) for vm in vms]
+            for vm, future in zip(vms, futures):
+                try:
+                    vm.instance_view = future.result()
+                except Exception as exc:
+                    self.fail("Error getting virtual machine {0} instance view - {1}".format(vm.name, str(exc)))
+                results.append(self.serialize_vm(vm))
+        return results
+
     def serialize_vm(self, vm):
         '''
         Convert a VirtualMachine object to dict.
 
-        :param vm: VirtualMachine object
+        :param vm: VirtualMachine object, the instance view is fetched unless it was expanded
         :return: dict
         '''
 
+        if vm.instance_view is None:
+            try:
+                vm.instance_view = self.get_instance_view(vm)
+            except Exception as exc:
+                self.fail("Error getting virtual machine {0} instance view - {1}".format(vm.name, str(exc)))
+
         result = self.serialize_obj(vm, AZURE_OBJECT_CLASS, enum_modules=AZURE_ENUM_MODULES)
         resource_group = parse_resource_id(result['id']).get('resource_group')
-        instance = None
+        instance = result['instance_view']
         power_state = None
         display_status = None
 
-        try:
-            instance = self.compute_client.virtual_machines.instance_view(resource_group, vm.name)
-            instance = self.serialize_obj(instance, AZURE_OBJECT_CLASS, enum_modules=AZURE_ENUM_MODULES)
-        except Exception as exc:
-            self.fail("Error getting virtual machine {0} instance view - {1}".format(vm.name, str(exc)))
-
         for index in range(len(instance['statuses'])):
             code = instance['statuses'][index]['code'].split('/')
             if code[0] == 'PowerState':
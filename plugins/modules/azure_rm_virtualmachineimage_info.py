@@ -42,7 +42,17 @@ options:
     version:
         description:
             - Specific version number of an image.
+            - Use C(latest) to get the most recent version.
         type: str
+    cache_ttl:
+        description:
+            - Seconds a specific image version is cached on disk, in C(~/.ansible/azure_rm_cache).
+            - The cache is shared with M(azure.azcollection.azure_rm_virtualmachine) and M(azure.azcollection.azure_rm_virtualmachinescaleset).
+            - Only used when I(version) is set, listings of publishers, offers and versions aren't cached.
+            - Set to C(0) to disable the cache.
+        type: int
+        default: 3600
+        version_added: "2.4.0"
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -119,6 +129,7 @@ except Exception:
     pass
 
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_computemetadata import COMPUTE_METADATA_CACHE_TTL, get_image_version
 
 
 AZURE_ENUM_MODULES = ['azure.mgmt.compute.models']
@@ -133,7 +144,8 @@ class AzureRMVirtualMachineImageInfo(AzureRMModuleBase):
             publisher=dict(type='str'),
             offer=dict(type='str'),
             sku=dict(type='str'),
-            version=dict(type='str')
+            version=dict(type='str'),
+            cache_ttl=dict(type='int', default=COMPUTE_METADATA_CACHE_TTL)
         )
 
         self.results = dict(
@@ -145,6 +157,7 @@ class AzureRMVirtualMachineImageInfo(AzureRMModuleBase):
         self.offer = None
         self.sku = None
         self.version = None
+        self.cache_ttl = None
 
         super(AzureRMVirtualMachineImageInfo, self).__init__(self.module_arg_spec, supports_check_mode=True, supports_tags=False)
 
@@ -179,31 +192,8 @@ class AzureRMVirtualMachineImageInfo(AzureRMModuleBase):
         return self.results
 
     def get_item(self):
-        item = None
-        result = []
-        versions = None
-
-        try:
-            versions = self.compute_client.virtual_machine_images.list(self.location,
-                                                                       self.publisher,
-                                                                       self.offer,
-                                                                       self.sku,
-                                                                       top=1,
-                                                                       orderby='name desc')
-        except ResourceNotFoundError:
-            pass
-
-        if self.version == 'latest':
-            item = versions[-1]
-        else:
-            for version in versions:
-                if version.name == self.version:
-                    item = version
-
-        if item:
-            result = [self.serialize_obj(item, 'VirtualMachineImage', enum_modules=AZURE_ENUM_MODULES)]
-
-        return result
+        item = get_image_version(self, self.location, self.publisher, self.offer, self.sku, self.version, self.cache_ttl)
+        return [item] if item else []
 
     def list_images(self):
         response = None
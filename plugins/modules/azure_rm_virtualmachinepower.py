@@ -0,0 +1,315 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2026 xuzhang3 (@xuzhang3), Fred-sun (@Fred-sun)
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_virtualmachinepower
+
+version_added: "2.4.0"
+
+short_description: Change the power state of many Azure virtual machines
+
+description:
+    - Start, stop, deallocate or restart a set of virtual machines (VMs) in one task.
+    - The VMs are selected by ID, or by resource group and tags.
+    - The power states of the VMs are read in bulk and only the VMs not yet in the requested state are changed,
+      with up to I(max_concurrency) operations in flight.
+
+options:
+    ids:
+        description:
+            - Resource IDs of the VMs.
+            - Mutually exclusive with I(resource_group) and I(tags).
+        type: list
+        elements: str
+    resource_group:
+        description:
+            - Select all VMs of this resource group.
+        type: str
+    tags:
+        description:
+            - Select the VMs having all these tags, in the resource group if I(resource_group) is set, in the subscription otherwise.
+            - Format tags as 'key' or 'key:value'.
+        type: list
+        elements: str
+    power_state:
+        description:
+            - The requested power state of the VMs.
+            - C(running) starts the VMs that aren't starting or running.
+            - C(stopped) powers off the running VMs, they stay allocated and billed.
+            - C(deallocated) deallocates the VMs that aren't deallocating or deallocated.
+            - C(restarted) restarts the running VMs, other VMs are left as they are.
+        required: true
+        type: str
+        choices:
+            - running
+            - stopped
+            - deallocated
+            - restarted
+    force:
+        description:
+            - Set to C(true) with I(power_state=stopped) to stop the VMs forcefully (hard poweroff -- skip_shutdown).
+        default: false
+        type: bool
+    max_concurrency:
+        description:
+            - Maximum number of power operations in flight.
+        type: int
+        default: 20
+
+notes:
+    - One of I(ids), I(resource_group) or I(tags) is required, the module never selects all VMs of the subscription implicitly.
+
+extends_documentation_fragment:
+    - azure.azcollection.azure
+
+author:
+    - xuzhang3 (@xuzhang3)
+    - Fred-sun (@Fred-sun)
+'''
+
+EXAMPLES = '''
+- name: Deallocate the VMs tagged for the nightly shutdown
+  azure_rm_virtualmachinepower:
+    tags:
+      - shutdown:nightly
+    power_state: deallocated
+    max_concurrency: 50
+
+- name: Start all VMs of a resource group
+  azure_rm_virtualmachinepower:
+    resource_group: myResourceGroup
+    power_state: running
+
+- name: Restart VMs
+  azure_rm_virtualmachinepower:
+    ids:
+      - /subscriptions/xxx-xxx/resourceGroups/myResourceGroup/providers/Microsoft.Compute/virtualMachines/vm1
+      - /subscriptions/xxx-xxx/resourceGroups/myResourceGroup/providers/Microsoft.Compute/virtualMachines/vm2
+    power_state: restarted
+'''
+
+RETURN = '''
+vms:
+    description:
+        - Outcome for every selected VM.
+    returned: always
+    type: complex
+    contains:
+        id:
+            description:
+                - Resource ID of the VM.
+            returned: always
+            type: str
+            sample: /subscriptions/xxx-xxx/resourceGroups/myResourceGroup/providers/Microsoft.Compute/virtualMachines/vm1
+        name:
+            description:
+                - Name of the VM.
+            returned: always
+            type: str
+            sample: vm1
+        resource_group:
+            description:
+                - Resource group of the VM.
+            returned: always
+            type: str
+            sample: myResourceGroup
+        power_state:
+            description:
+                - Power state of the VM before the operation, for example C(running) or C(deallocated).
+            returned: always
+            type: str
+            sample: running
+        action:
+            description:
+                - The operation run on the VM, C(start), C(power_off), C(deallocate) or C(restart).
+                - C(None) if the VM was already in the requested state.
+            returned: always
+            type: str
+            sample: deallocate
+        error:
+            description:
+                - The error that occurred reading the power state of the VM or changing it.
+                - The module fails after all other VMs are done when any VM has an error.
+            returned: always
+            type: str
+            sample: null
+'''
+
+try:
+    from azure.core.exceptions import ResourceNotFoundError
+    from azure.mgmt.core.tools import parse_resource_id
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, map_bounded
+
+
+class AzureRMVirtualMachinePower(AzureRMModuleBase):
+
+    def __init__(self):
+
+        self.module_arg_spec = dict(
+            ids=dict(type='list', elements='str'),
+            resource_group=dict(type='str'),
+            tags=dict(type='list', elements='str'),
+            power_state=dict(type='str', required=True, choices=['running', 'stopped', 'deallocated', 'restarted']),
+            force=dict(type='bool', default=False),
+            max_concurrency=dict(type='int', default=20),
+        )
+
+        self.ids = None
+        self.resource_group = None
+        self.tags = None
+        self.power_state = None
+        self.force = None
+        self.max_concurrency = None
+
+        self.results = dict(
+            changed=False,
+            vms=[]
+        )
+
+        mutually_exclusive = [('ids', 'resource_group'), ('ids', 'tags')]
+        required_one_of = [('ids', 'resource_group', 'tags')]
+
+        super(AzureRMVirtualMachinePower, self).__init__(self.module_arg_spec,
+                                                         supports_check_mode=True,
+                                                         supports_tags=False,
+                                                         mutually_exclusive=mutually_exclusive,
+                                                         required_one_of=required_one_of)
+
+    def exec_module(self, **kwargs):
+
+        for key in self.module_arg_spec:
+            setattr(self, key, kwargs[key])
+
+        if self.ids:
+            vms = self.get_vms_by_id()
+        else:
+            vms = self.list_vms()
+
+        pending = []
+        for vm in vms:
+            if vm['error']:
+                continue
+            vm['action'] = self.get_action(vm['power_state'])
+            if vm['action']:
+                pending.append(vm)
+
+        if pending and not self.check_mode:
+            for vm, outcome in zip(pending, map_bounded(self.change_power_state, pending, self.max_concurrency)):
+                if isinstance(outcome, Exception):
+                    self.log("Error running {0} on virtual machine {1} - {2}".format(vm['action'], vm['name'], str(outcome)))
+                    vm['error'] = str(outcome)
+
+        self.results['vms'] = vms
+        self.results['changed'] = bool(pending)
+
+        errors = [vm for vm in vms if vm['error']]
+        if errors:
+            self.fail("Error changing the power state of {0} of {1} virtual machines".format(len(errors), len(vms)), **self.results)
+
+        return self.results
+
+    def get_vms_by_id(self):
+        '''
+        Read the power states of the VMs given by ID, in parallel.
+        '''
+        vms = []
+        for vm_id in self.ids:
+            parsed = parse_resource_id(vm_id)
+            vms.append(dict(id=vm_id, name=parsed.get('name'), resource_group=parsed.get('resource_group'),
+                            power_state=None, action=None, error=None))
+
+        def instance_view(vm):
+            return self.compute_client.virtual_machines.instance_view(vm['resource_group'], vm['name'])
+
+        for vm, view in zip(vms, map_bounded(instance_view, vms, self.max_concurrency)):
+            if isinstance(view, ResourceNotFoundError):
+                vm['error'] = "Virtual machine {0} not found".format(vm['id'])
+            elif isinstance(view, Exception):
+                vm['error'] = "Error fetching instance view of virtual machine {0} - {1}".format(vm['name'], str(view))
+            else:
+                vm['power_state'] = get_power_state(view)
+        return vms
+
+    def list_vms(self):
+        '''
+        List the VMs of the resource group or the subscription having the tags, then read their
+        power states with one status-only listing of the subscription.
+        '''
+        try:
+            if self.resource_group:
+                response = self.compute_client.virtual_machines.list(self.resource_group)
+            else:
+                response = self.compute_client.virtual_machines.list_all()
+            vms = [dict(id=vm.id, name=vm.name, resource_group=parse_resource_id(vm.id).get('resource_group'),
+                        power_state=None, action=None, error=None)
+                   for vm in response if self.has_tags(vm.tags, self.tags)]
+        except Exception as exc:
+            self.fail("Error listing virtual machines - {0}".format(str(exc)))
+
+        if not vms:
+            return vms
+
+        try:
+            views = dict((vm.id.lower(), vm.instance_view) for vm in self.compute_client.virtual_machines.list_all(status_only='true'))
+        except Exception as exc:
+            self.fail("Error listing virtual machine power states - {0}".format(str(exc)))
+
+        for vm in vms:
+            view = views.get(vm['id'].lower())
+            if view:
+                vm['power_state'] = get_power_state(view)
+            else:
+                vm['error'] = "Error fetching the power state of virtual machine {0}".format(vm['name'])
+        return vms
+
+    def get_action(self, power_state):
+        if self.power_state == 'running' and power_state not in ('starting', 'running'):
+            return 'start'
+        if self.power_state == 'stopped' and power_state in ('starting', 'running'):
+            return 'power_off'
+        if self.power_state == 'deallocated' and power_state not in ('deallocating', 'deallocated'):
+            return 'deallocate'
+        if self.power_state == 'restarted' and power_state == 'running':
+            return 'restart'
+        return None
+
+    def change_power_state(self, vm):
+        '''
+        Run the action of a VM and wait for it, raising an exception on error.
+        '''
+        self.log("Running {0} on virtual machine {1}".format(vm['action'], vm['name']))
+        operations = self.compute_client.virtual_machines
+        if vm['action'] == 'start':
+            poller = operations.begin_start(vm['resource_group'], vm['name'])
+        elif vm['action'] == 'power_off':
+            poller = operations.begin_power_off(vm['resource_group'], vm['name'], skip_shutdown=self.force)
+        elif vm['action'] == 'deallocate':
+            poller = operations.begin_deallocate(vm['resource_group'], vm['name'])
+        else:
+            poller = operations.begin_restart(vm['resource_group'], vm['name'])
+        poller.result()
+
+
+def get_power_state(instance_view):
+    return next((status.code.replace('PowerState/', '') for status in instance_view.statuses or []
+                 if status.code.startswith('PowerState')), None)
+
+
+def main():
+    AzureRMVirtualMachinePower()
+
+
+if __name__ == '__main__':
+    main()
@@ -365,6 +365,64 @@ options:
                         description:
                             - Specifies whether vTPM should be enabled on the virtual machine scalset.
                         type: bool
+    provisioning_timeout:
+        description:
+            - Maximum number of seconds to wait for the scale set to leave a transitional provisioning state such as C(Updating)
+              before reading or changing it.
+            - The state is polled after 5 seconds, then with a doubling interval of up to 60 seconds.
+        type: int
+        default: 3000
+
+    cache_ttl:
+        description:
+            - Seconds the VM sizes of the location and the resolved marketplace image version are cached on disk,
+              in C(~/.ansible/azure_rm_cache).
+            - The cache is shared with the other virtual machine modules, so creating many scale sets in a location validates the size
+              and resolves the image once per period.
+            - With I(image.version=latest), a version published during the period is used once the cached entry expires.
+            - Also caches the index of image names used to find a custom I(image) given without a resource group.
+            - Set to C(0) to disable the cache.
+        type: int
+        default: 3600
+    rolling_upgrade:
+        description:
+            - Apply the latest model to the out-of-date instances of the scale set, a batch of instances at a time.
+            - Meant for I(upgrade_policy=Manual), where changing the model doesn't update the existing instances.
+            - Runs after the scale set is updated, and on every run while instances are out of date.
+            - In check mode, reports the instances that are out of date before the scale set is updated.
+        type: dict
+        version_added: "2.4.0"
+        suboptions:
+            batch_size:
+                description:
+                    - Number of instances upgraded at a time.
+                    - Takes precedence over I(batch_percentage).
+                type: int
+            batch_percentage:
+                description:
+                    - Percentage of the instances of the scale set upgraded at a time, rounded up.
+                type: int
+                default: 20
+            health_check:
+                description:
+                    - Wait for the instances of a batch to be healthy before upgrading the next batch.
+                    - An instance is healthy when its application health extension reports C(HealthState/healthy),
+                      or without the extension, when it is provisioned and running.
+                type: bool
+                default: true
+            health_timeout:
+                description:
+                    - Seconds to wait for the instances of a batch to be healthy, instances that aren't are counted as unhealthy.
+                    - Throttling, server errors and connection errors reading the health of an instance are retried until then,
+                      other errors stop the upgrade.
+                type: int
+                default: 600
+            max_unhealthy_percentage:
+                description:
+                    - Stop the upgrade and fail when more than this percentage of the upgraded instances is unhealthy.
+                    - Must be between 0 and 100.
+                type: int
+                default: 20
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -644,21 +702,52 @@ azure_vmss:
         "tags": null,
         "type": "Microsoft.Compute/virtualMachineScaleSets"
     }
+rolling_upgrade:
+    description:
+        - The outcome of I(rolling_upgrade).
+    returned: when I(rolling_upgrade) is set and the scale set exists
+    type: complex
+    contains:
+        upgraded:
+            description:
+                - The IDs of the instances upgraded to the latest model, or out of date in check mode.
+            returned: always
+            type: list
+            elements: str
+            sample: ["0", "1"]
+        unhealthy:
+            description:
+                - The IDs of the upgraded instances that weren't healthy within I(rolling_upgrade.health_timeout).
+            returned: always
+            type: list
+            elements: str
+            sample: []
+        batches:
+            description:
+                - Number of batches upgraded.
+            returned: always
+            type: int
+            sample: 1
 '''  # NOQA
 
 import base64
+import math
 import time
 
 try:
     from azure.core.exceptions import ResourceNotFoundError
     from azure.mgmt.core.tools import parse_resource_id
-    from azure.core.exceptions import ResourceNotFoundError
+    from azure.core.exceptions import ResourceNotFoundError, HttpResponseError, ServiceRequestError
 
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
-from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, azure_id_to_dict, format_resource_id
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, azure_id_to_dict, format_resource_id, map_bounded
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_computemetadata import (COMPUTE_METADATA_CACHE_TTL,
+                                                                                                  list_vm_sizes,
+                                                                                                  get_image_version,
+                                                                                                  get_custom_image_id)
 from ansible.module_utils.basic import to_native, to_bytes
 
 
@@ -744,6 +833,18 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
                     )
                 )
             ),
+            provisioning_timeout=dict(type='int', default=3000),
+            cache_ttl=dict(type='int', default=COMPUTE_METADATA_CACHE_TTL),
+            rolling_upgrade=dict(
+                type='dict',
+                options=dict(
+                    batch_size=dict(type='int'),
+                    batch_percentage=dict(type='int', default=20),
+                    health_check=dict(type='bool', default=True),
+                    health_timeout=dict(type='int', default=600),
+                    max_unhealthy_percentage=dict(type='int', default=20),
+                )
+            ),
         )
 
         self.resource_group = None
@@ -786,6 +887,9 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         self.orchestration_mode = None
         self.os_disk_size_gb = None
         self.security_profile = None
+        self.provisioning_timeout = None
+        self.cache_ttl = None
+        self.rolling_upgrade = None
 
         mutually_exclusive = [('load_balancer', 'application_gateway')]
         self.results = dict(
@@ -817,6 +921,15 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         if not self.virtual_network_resource_group:
             self.virtual_network_resource_group = self.resource_group
 
+        if self.rolling_upgrade:
+            # validate before the model is changed
+            if self.rolling_upgrade.get('batch_size') is not None and self.rolling_upgrade['batch_size'] < 1:
+                self.fail("rolling_upgrade.batch_size must be 1 or greater")
+            if not 0 < self.rolling_upgrade['batch_percentage'] <= 100:
+                self.fail("rolling_upgrade.batch_percentage must be between 1 and 100")
+            if not 0 <= self.rolling_upgrade['max_unhealthy_percentage'] <= 100:
+                self.fail("rolling_upgrade.max_unhealthy_percentage must be between 0 and 100")
+
         changed = False
         results = dict()
         vmss = None
@@ -863,7 +976,7 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
                 if all(key in self.image for key in ('publisher', 'offer', 'sku', 'version')):
                     marketplace_image = self.get_marketplace_image_version()
                     if self.image['version'] == 'latest':
-                        self.image['version'] = marketplace_image.name
+                        self.image['version'] = marketplace_image['name']
                         self.log("Using image version {0}".format(self.image['version']))
 
                     image_reference = self.compute_models.ImageReference(
@@ -1103,6 +1216,8 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         self.results['ansible_facts']['azure_vmss'] = results
 
         if self.check_mode:
+            if vmss and self.state == 'present' and self.rolling_upgrade:
+                self.run_rolling_upgrade()
             return self.results
 
         if changed:
@@ -1367,6 +1482,9 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
                 self.results['ansible_facts']['azure_vmss'] = None
                 self.delete_vmss(vmss)
 
+        if vmss and self.state == 'present' and self.rolling_upgrade:
+            self.run_rolling_upgrade()
+
         # until we sort out how we want to do this globally
         del self.results['actions']
 
@@ -1379,22 +1497,88 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         :return: VirtualMachineScaleSet object
         '''
         try:
-            retry_count = 0
-            vmss = self.compute_client.virtual_machine_scale_sets.get(self.resource_group, self.name)
-            while True:
-                if retry_count == 20:
-                    self.fail("Error {0} has a provisioning state of Updating. Expecting state to be Successed.".format(self.name))
-
-                if vmss.provisioning_state != 'Succeeded':
-                    retry_count = retry_count + 1
-                    time.sleep(150)
-                    vmss = self.compute_client.virtual_machine_scale_sets.get(self.resource_group, self.name)
-                else:
-                    break
-            return vmss
+            return self.wait_for_provisioning_state(
+                lambda: self.compute_client.virtual_machine_scale_sets.get(self.resource_group, self.name),
+                lambda vmss: vmss.provisioning_state == 'Succeeded',
+                self.provisioning_timeout,
+                "virtual machine scale set {0}".format(self.name))
         except ResourceNotFoundError as exc:
             self.fail("Error getting virtual machine scale set {0} - {1}".format(self.name, str(exc)))
 
+    def run_rolling_upgrade(self):
+        '''
+        Apply the latest model to the out-of-date instances, a batch at a time, waiting for the
+        instances of a batch to be healthy before the next one.
+        '''
+        options = self.rolling_upgrade
+        try:
+            instances = list(self.compute_client.virtual_machine_scale_set_vms.list(self.resource_group, self.name))
+        except Exception as exc:
+            self.fail("Error listing instances of virtual machine scale set {0} - {1}".format(self.name, str(exc)))
+
+        outdated = [instance.instance_id for instance in instances
+                    if instance.latest_model_applied is False and instance.provisioning_state != 'Deleting']
+        outcome = dict(upgraded=[], unhealthy=[], batches=0)
+        self.results['rolling_upgrade'] = outcome
+        if not outdated:
+            return
+        self.results['changed'] = True
+        if self.check_mode:
+            outcome['upgraded'] = outdated
+            return
+
+        batch_size = options.get('batch_size') or max(1, int(math.ceil(len(instances) * options['batch_percentage'] / 100.0)))
+        for start in range(0, len(outdated), batch_size):
+            batch = outdated[start:start + batch_size]
+            self.log("Upgrading instances {0} of virtual machine scale set {1}".format(', '.join(batch), self.name))
+            try:
+                poller = self.compute_client.virtual_machine_scale_sets.begin_update_instances(
+                    self.resource_group, self.name, vm_instance_i_ds=self.compute_models.VirtualMachineScaleSetVMInstanceRequiredIDs(instance_ids=batch))
+                self.get_poller_result(poller)
+            except Exception as exc:
+                self.fail("Error upgrading instances {0} of virtual machine scale set {1} - {2}".format(', '.join(batch), self.name, str(exc)),
+                          rolling_upgrade=outcome)
+            outcome['upgraded'].extend(batch)
+            outcome['batches'] += 1
+
+            if options['health_check']:
+                outcome['unhealthy'].extend(self.wait_for_healthy_instances(batch, options['health_timeout']))
+                if len(outcome['unhealthy']) * 100.0 / len(outcome['upgraded']) > options['max_unhealthy_percentage']:
+                    self.fail("Stopped the upgrade of virtual machine scale set {0}, instances {1} are unhealthy".format(
+                              self.name, ', '.join(outcome['unhealthy'])), rolling_upgrade=outcome)
+
+    def wait_for_healthy_instances(self, instance_ids, timeout):
+        '''
+        Poll the instance views of the instances in parallel until all of them are healthy or timeout expires.
+
+        :return: list of the IDs of the instances that aren't healthy
+        '''
+        def is_healthy(instance_id):
+            view = self.compute_client.virtual_machine_scale_set_vms.get_instance_view(self.resource_group, self.name, instance_id)
+            if view.vm_health and view.vm_health.status:
+                return view.vm_health.status.code == 'HealthState/healthy'
+            codes = [status.code for status in view.statuses or []]
+            return 'ProvisioningState/succeeded' in codes and 'PowerState/running' in codes
+
+        deadline = time.time() + timeout
+        delay = 5
+        pending = list(instance_ids)
+        while True:
+            results = map_bounded(is_healthy, pending)
+            errors = [(instance_id, result) for instance_id, result in zip(pending, results)
+                      if isinstance(result, Exception) and not is_transient_error(result)]
+            if errors:
+                self.fail("Error reading the health of instances of virtual machine scale set {0} - {1}".format(
+                          self.name, '; '.join('{0}: {1}'.format(instance_id, str(exc)) for instance_id, exc in errors)),
+                          rolling_upgrade=self.results['rolling_upgrade'])
+            pending = [instance_id for instance_id, healthy in zip(pending, results) if healthy is not True]
+            remaining = deadline - time.time()
+            if not pending or remaining <= 0:
+                return pending
+            self.log("Waiting {0} sec for instances {1} to be healthy".format(min(delay, remaining), ', '.join(pending)))
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 30)
+
     def get_virtual_network(self, name):
         try:
             vnet = self.network_client.virtual_networks.get(self.virtual_network_resource_group, name)
@@ -1458,21 +1642,15 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
 
     def get_marketplace_image_version(self):
         try:
-            versions = self.compute_client.virtual_machine_images.list(self.location,
-                                                                       self.image['publisher'],
-                                                                       self.image['offer'],
-                                                                       self.image['sku'])
+            version = get_image_version(self, self.location, self.image['publisher'], self.image['offer'], self.image['sku'],
+                                        self.image['version'], self.cache_ttl)
         except ResourceNotFoundError as exc:
             self.fail("Error fetching image {0} {1} {2} - {3}".format(self.image['publisher'],
                                                                       self.image['offer'],
                                                                       self.image['sku'],
                                                                       str(exc)))
-        if versions and len(versions) > 0:
-            if self.image['version'] == 'latest':
-                return versions[len(versions) - 1]
-            for version in versions:
-                if version.name == self.image['version']:
-                    return version
+        if version:
+            return version
 
         self.fail("Error could not find image {0} {1} {2} {3}".format(self.image['publisher'],
                                                                       self.image['offer'],
@@ -1481,17 +1659,13 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
 
     def get_custom_image_reference(self, name, resource_group=None):
         try:
-            if resource_group:
-                vm_images = self.compute_client.images.list_by_resource_group(resource_group)
-            else:
-                vm_images = self.compute_client.images.list()
+            image_id = get_custom_image_id(self, name, resource_group, self.cache_ttl)
         except ResourceNotFoundError as exc:
             self.fail("Error fetching custom images from subscription - {0}".format(str(exc)))
 
-        for vm_image in vm_images:
-            if vm_image.name == name:
-                self.log("Using custom image id {0}".format(vm_image.id))
-                return self.compute_models.ImageReference(id=vm_image.id)
+        if image_id:
+            self.log("Using custom image id {0}".format(image_id))
+            return self.compute_models.ImageReference(id=image_id)
 
         self.fail("Error could not find image with name {0}".format(name))
 
@@ -1509,13 +1683,10 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         :return: boolean
         '''
         try:
-            sizes = self.compute_client.virtual_machine_sizes.list(self.location)
+            sizes = list_vm_sizes(self, self.location, self.cache_ttl)
         except ResourceNotFoundError as exc:
             self.fail("Error retrieving available machine sizes - {0}".format(str(exc)))
-        for size in sizes:
-            if size.name == self.vm_size:
-                return True
-        return False
+        return any(size['name'] == self.vm_size for size in sizes)
 
     def parse_nsg(self):
         nsg = self.security_group
@@ -1549,6 +1720,15 @@ class AzureRMVirtualMachineScaleSet(AzureRMModuleBase):
         return self.compute_models.ScaleInPolicy(rules=[self.scale_in_policy])
 
 
+def is_transient_error(exc):
+    '''
+    Whether a failed request is worth retrying: throttling, server errors and connection errors.
+    '''
+    if isinstance(exc, ServiceRequestError):
+        return True
+    return isinstance(exc, HttpResponseError) and (exc.status_code == 429 or (exc.status_code or 0) >= 500)
+
+
 def main():
     AzureRMVirtualMachineScaleSet()
 
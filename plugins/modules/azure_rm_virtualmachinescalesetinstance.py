@@ -30,8 +30,25 @@ options:
     instance_id:
         description:
             - The instance ID of the virtual machine.
+            - Mutually exclusive with I(instance_ids).
         type: str
-        required: true
+    instance_ids:
+        description:
+            - The instance IDs of several virtual machines of the scale set.
+            - Power state changes, model upgrades and deletions of all instances are done with scale set operations
+              covering I(batch_size) instances each.
+            - With I(state=present), the module fails when one of the instances doesn't exist in the scale set.
+            - Mutually exclusive with I(instance_id).
+        type: list
+        elements: str
+        version_added: "2.4.0"
+    batch_size:
+        description:
+            - Maximum number of instances changed by one scale set operation.
+            - The operations run one after the other, so at most I(batch_size) instances are restarted, upgraded or deleted at a time.
+            - By default all instances are changed by a single operation.
+        type: int
+        version_added: "2.4.0"
     latest_model:
         type: bool
         description:
@@ -77,6 +94,14 @@ EXAMPLES = '''
     instance_id: "2"
     latest_model: true
 
+- name: Upgrade instances to the latest model, 10 at a time
+  azure_rm_virtualmachinescalesetinstance:
+    resource_group: myResourceGroup
+    vmss_name: myVMSS
+    instance_ids: "{{ instances.instances | map(attribute='instance_id') | list }}"
+    latest_model: true
+    batch_size: 10
+
 - name: Turn on protect from scale in
   azure_rm_virtualmachinescalesetinstance:
     resource_group: myResourceGroup
@@ -100,7 +125,7 @@ instances:
             sample: /subscriptions/xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx/resourceGroups/TestGroup/providers/Microsoft.Compute/scalesets/myscaleset/vms/myvm
 '''
 
-from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase, map_bounded, DEFAULT_ASYNC_CONCURRENCY
 
 try:
     from azure.core.exceptions import ResourceNotFoundError
@@ -123,8 +148,14 @@ class AzureRMVirtualMachineScaleSetInstance(AzureRMModuleBase):
                 required=True
             ),
             instance_id=dict(
-                type='str',
-                required=True
+                type='str'
+            ),
+            instance_ids=dict(
+                type='list',
+                elements='str'
+            ),
+            batch_size=dict(
+                type='int'
             ),
             latest_model=dict(
                 type='bool'
@@ -153,12 +184,17 @@ class AzureRMVirtualMachineScaleSetInstance(AzureRMModuleBase):
         self.resource_group = None
         self.vmss_name = None
         self.instance_id = None
+        self.instance_ids = None
+        self.batch_size = None
         self.latest_model = None
         self.power_state = None
         self.state = None
         self.protect_from_scale_in = None
         self.protect_from_scale_set_actions = None
-        super(AzureRMVirtualMachineScaleSetInstance, self).__init__(self.module_arg_spec, supports_tags=False)
+        super(AzureRMVirtualMachineScaleSetInstance, self).__init__(self.module_arg_spec,
+                                                                    supports_tags=False,
+                                                                    mutually_exclusive=[('instance_id', 'instance_ids')],
+                                                                    required_one_of=[('instance_id', 'instance_ids')])
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -167,56 +203,83 @@ class AzureRMVirtualMachineScaleSetInstance(AzureRMModuleBase):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2021-04-01')
 
+        if self.batch_size is not None and self.batch_size < 1:
+            self.fail("batch_size must be 1 or greater")
+
         instances = self.get()
 
         if self.state == 'absent':
-            for item in instances:
+            if instances:
                 if not self.check_mode:
-                    self.delete(item['instance_id'])
+                    self.run_batches(self.delete, [item['instance_id'] for item in instances])
                 self.results['changed'] = True
             self.results['instances'] = []
         else:
             if self.latest_model is not None:
-                for item in instances:
-                    if not item.get('latest_model', None):
-                        if not self.check_mode:
-                            self.apply_latest_model([item['instance_id']])
+                outdated = [item for item in instances if not item.get('latest_model', None)]
+                if outdated:
+                    if not self.check_mode:
+                        self.run_batches(self.apply_latest_model, [item['instance_id'] for item in outdated])
+                    for item in outdated:
                         item['latest_model'] = True
-                        self.results['changed'] = True
+                    self.results['changed'] = True
 
             if self.power_state is not None:
-                for item in instances:
-                    if self.power_state == 'stopped' and item['power_state'] not in ['stopped', 'stopping']:
-                        if not self.check_mode:
-                            self.stop(item['instance_id'])
-                        self.results['changed'] = True
-                    elif self.power_state == 'deallocated' and item['power_state'] not in ['deallocated']:
-                        if not self.check_mode:
-                            self.deallocate(item['instance_id'])
-                        self.results['changed'] = True
-                    elif self.power_state == 'running' and item['power_state'] not in ['running']:
-                        if not self.check_mode:
-                            self.start(item['instance_id'])
-                        self.results['changed'] = True
+                if self.power_state == 'stopped':
+                    operation = self.stop
+                    pending = [item['instance_id'] for item in instances if item['power_state'] not in ['stopped', 'stopping']]
+                elif self.power_state == 'deallocated':
+                    operation = self.deallocate
+                    pending = [item['instance_id'] for item in instances if item['power_state'] not in ['deallocated']]
+                else:
+                    operation = self.start
+                    pending = [item['instance_id'] for item in instances if item['power_state'] not in ['running']]
+                if pending:
+                    if not self.check_mode:
+                        self.run_batches(operation, pending)
+                    self.results['changed'] = True
             if self.protect_from_scale_in is not None or self.protect_from_scale_set_actions is not None:
+                pending = []
                 for item in instances:
                     protection_policy = item['protection_policy']
                     if protection_policy is None or self.protect_from_scale_in != protection_policy['protect_from_scale_in'] or \
                             self.protect_from_scale_set_actions != protection_policy['protect_from_scale_set_actions']:
-                        if not self.check_mode:
-                            self.update_protection_policy(self.instance_id, self.protect_from_scale_in, self.protect_from_scale_set_actions)
-                        self.results['changed'] = True
+                        pending.append(item['instance_id'])
+                if pending:
+                    if not self.check_mode:
+                        self.update_protection_policies(pending)
+                    self.results['changed'] = True
 
         self.results['instances'] = [{'id': item['id']} for item in instances]
         return self.results
 
     def get(self):
-        response = None
         results = []
+        if self.instance_ids is not None:
+            # one listing with the instance views instead of two requests per instance
+            instance_ids = set(self.instance_ids)
+            try:
+                response = self.mgmt_client.virtual_machine_scale_set_vms.list(resource_group_name=self.resource_group,
+                                                                               virtual_machine_scale_set_name=self.vmss_name,
+                                                                               expand='instanceView')
+                results = [self.format_response(item) for item in response if item.instance_id in instance_ids]
+            except ResourceNotFoundError as e:
+                self.log('Could not get facts for Virtual Machine Scale Set VMs.')
+            found = set(item['instance_id'] for item in results)
+            missing = [instance_id for instance_id in self.instance_ids if instance_id not in found]
+            if missing:
+                if self.state == 'present':
+                    self.fail("Instances {0} not found in virtual machine scale set {1}".format(missing, self.vmss_name))
+                # already deleted
+                self.log("Instances {0} not found in virtual machine scale set {1}".format(missing, self.vmss_name))
+            return results
+
+        response = None
         try:
             response = self.mgmt_client.virtual_machine_scale_set_vms.get(resource_group_name=self.resource_group,
                                                                           vm_scale_set_name=self.vmss_name,
-                                                                          instance_id=self.instance_id)
+                                                                          instance_id=self.instance_id,
+                                                                          expand='instanceView')
             self.log("Response : {0}".format(response))
         except ResourceNotFoundError as e:
             self.log('Could not get facts for Virtual Machine Scale Set VM.')
@@ -226,78 +289,102 @@ class AzureRMVirtualMachineScaleSetInstance(AzureRMModuleBase):
 
         return results
 
-    def apply_latest_model(self, instance_id):
+    def run_batches(self, operation, instance_ids):
+        '''
+        Run a scale set operation on the instances, batch_size instances at a time.
+
+        :param operation: function starting the operation on a list of instance IDs and returning its poller
+        :param instance_ids: list of instance IDs
+        '''
+        batch_size = self.batch_size or len(instance_ids)
+        for start in range(0, len(instance_ids), batch_size):
+            self.get_poller_result(operation(instance_ids[start:start + batch_size]))
+
+    def apply_latest_model(self, instance_ids):
         try:
-            poller = self.compute_client.virtual_machine_scale_sets.begin_update_instances(resource_group_name=self.resource_group,
-                                                                                           vm_scale_set_name=self.vmss_name,
-                                                                                           vm_instance_i_ds={'instance_ids': instance_id})
-            self.get_poller_result(poller)
+            return self.compute_client.virtual_machine_scale_sets.begin_update_instances(resource_group_name=self.resource_group,
+                                                                                         vm_scale_set_name=self.vmss_name,
+                                                                                         vm_instance_i_ds={'instance_ids': instance_ids})
         except Exception as exc:
             self.log("Error applying latest model {0} - {1}".format(self.vmss_name, str(exc)))
             self.fail("Error applying latest model {0} - {1}".format(self.vmss_name, str(exc)))
 
-    def delete(self, instance_id):
+    def delete(self, instance_ids):
         try:
-            self.mgmt_client.virtual_machine_scale_set_vms.begin_delete(resource_group_name=self.resource_group,
-                                                                        vm_scale_set_name=self.vmss_name,
-                                                                        instance_id=instance_id)
+            return self.compute_client.virtual_machine_scale_sets.begin_delete_instances(resource_group_name=self.resource_group,
+                                                                                         vm_scale_set_name=self.vmss_name,
+                                                                                         vm_instance_i_ds={'instance_ids': instance_ids})
         except Exception as e:
             self.log('Could not delete instance of Virtual Machine Scale Set VM.')
             self.fail('Could not delete instance of Virtual Machine Scale Set VM.')
 
-    def start(self, instance_id):
+    def start(self, instance_ids):
         try:
-            self.mgmt_client.virtual_machine_scale_set_vms.begin_start(resource_group_name=self.resource_group,
-                                                                       vm_scale_set_name=self.vmss_name,
-                                                                       instance_id=instance_id)
+            return self.compute_client.virtual_machine_scale_sets.begin_start(resource_group_name=self.resource_group,
+                                                                              vm_scale_set_name=self.vmss_name,
+                                                                              vm_instance_i_ds={'instance_ids': instance_ids})
         except Exception as e:
             self.log('Could not start instance of Virtual Machine Scale Set VM.')
             self.fail('Could not start instance of Virtual Machine Scale Set VM.')
 
-    def stop(self, instance_id):
+    def stop(self, instance_ids):
         try:
-            self.mgmt_client.virtual_machine_scale_set_vms.begin_power_off(resource_group_name=self.resource_group,
-                                                                           vm_scale_set_name=self.vmss_name,
-                                                                           instance_id=instance_id)
+            return self.compute_client.virtual_machine_scale_sets.begin_power_off(resource_group_name=self.resource_group,
+                                                                                  vm_scale_set_name=self.vmss_name,
+                                                                                  vm_instance_i_ds={'instance_ids': instance_ids})
         except Exception as e:
             self.log('Could not stop instance of Virtual Machine Scale Set VM.')
             self.fail('Could not stop instance of Virtual Machine Scale Set VM.')
 
-    def deallocate(self, instance_id):
+    def deallocate(self, instance_ids):
         try:
-            self.mgmt_client.virtual_machine_scale_set_vms.begin_deallocate(resource_group_name=self.resource_group,
-                                                                            vm_scale_set_name=self.vmss_name,
-                                                                            instance_id=instance_id)
+            return self.compute_client.virtual_machine_scale_sets.begin_deallocate(resource_group_name=self.resource_group,
+                                                                                   vm_scale_set_name=self.vmss_name,
+                                                                                   vm_instance_i_ds={'instance_ids': instance_ids})
         except Exception as e:
             self.log('Could not deallocate instance of Virtual Machine Scale Set VM.')
             self.fail('Could not deallocate instance of Virtual Machine Scale Set VM.')
 
+    def update_protection_policies(self, instance_ids):
+        '''
+        Update the protection policy of the instances in parallel, there is no scale set operation for it.
+        '''
+        def update(instance_id):
+            return self.update_protection_policy(instance_id, self.protect_from_scale_in, self.protect_from_scale_set_actions)
+
+        failed = []
+        for instance_id, result in zip(instance_ids, map_bounded(update, instance_ids, DEFAULT_ASYNC_CONCURRENCY)):
+            if isinstance(result, Exception):
+                self.log('Could not update protection policy of instance {0} - {1}'.format(instance_id, str(result)))
+                failed.append(instance_id)
+        if failed:
+            self.fail('Could not update instance protection policy of instances {0}.'.format(failed))
+
     def update_protection_policy(self, instance_id, protect_from_scale_in, protect_from_scale_set_actions):
-        try:
-            d = {}
-            if protect_from_scale_in is not None:
-                d['protect_from_scale_in'] = protect_from_scale_in
-            if protect_from_scale_set_actions is not None:
-                d['protect_from_scale_set_actions'] = protect_from_scale_set_actions
-            protection_policy = self.compute_models.VirtualMachineScaleSetVMProtectionPolicy(**d)
-            instance = self.mgmt_client.virtual_machine_scale_set_vms.get(resource_group_name=self.resource_group,
-                                                                          vm_scale_set_name=self.vmss_name,
-                                                                          instance_id=instance_id)
-            instance.protection_policy = protection_policy
-            poller = self.mgmt_client.virtual_machine_scale_set_vms.begin_update(resource_group_name=self.resource_group,
-                                                                                 vm_scale_set_name=self.vmss_name,
-                                                                                 instance_id=instance_id,
-                                                                                 parameters=instance)
-            self.get_poller_result(poller)
-        except Exception as e:
-            self.log('Could not update instance protection policy.')
-            self.fail('Could not update instance protection policy.')
+        d = {}
+        if protect_from_scale_in is not None:
+            d['protect_from_scale_in'] = protect_from_scale_in
+        if protect_from_scale_set_actions is not None:
+            d['protect_from_scale_set_actions'] = protect_from_scale_set_actions
+        protection_policy = self.compute_models.VirtualMachineScaleSetVMProtectionPolicy(**d)
+        instance = self.mgmt_client.virtual_machine_scale_set_vms.get(resource_group_name=self.resource_group,
+                                                                      vm_scale_set_name=self.vmss_name,
+                                                                      instance_id=instance_id)
+        instance.protection_policy = protection_policy
+        poller = self.mgmt_client.virtual_machine_scale_set_vms.begin_update(resource_group_name=self.resource_group,
+                                                                             vm_scale_set_name=self.vmss_name,
+                                                                             instance_id=instance_id,
+                                                                             parameters=instance)
+        return poller.result()
 
     def format_response(self, item):
         d = item.as_dict()
-        iv = self.mgmt_client.virtual_machine_scale_set_vms.get_instance_view(resource_group_name=self.resource_group,
-                                                                              vm_scale_set_name=self.vmss_name,
-                                                                              instance_id=d.get('instance_id', None)).as_dict()
+        if item.instance_view is not None:
+            iv = item.instance_view.as_dict()
+        else:
+            iv = self.mgmt_client.virtual_machine_scale_set_vms.get_instance_view(resource_group_name=self.resource_group,
+                                                                                  vm_scale_set_name=self.vmss_name,
+                                                                                  instance_id=d.get('instance_id', None)).as_dict()
         power_state = ""
         for index in range(len(iv['statuses'])):
             code = iv['statuses'][index]['code'].split('/')
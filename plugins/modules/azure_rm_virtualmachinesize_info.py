@@ -30,6 +30,14 @@ options:
         description:
             - Name of a size to get information about
         type: str
+    cache_ttl:
+        description:
+            - Seconds the sizes of the location are cached on disk, in C(~/.ansible/azure_rm_cache).
+            - The cache is shared with M(azure.azcollection.azure_rm_virtualmachine) and M(azure.azcollection.azure_rm_virtualmachinescaleset).
+            - Set to C(0) to disable the cache.
+        type: int
+        default: 3600
+        version_added: "2.4.0"
 
 extends_documentation_fragment:
     - azure.azcollection.azure
@@ -96,10 +104,7 @@ except Exception:
     pass
 
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common import AzureRMModuleBase
-
-AZURE_OBJECT_CLASS = 'VirtualMachineSize'
-
-AZURE_ENUM_MODULES = ['azure.mgmt.compute.models']
+from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_computemetadata import COMPUTE_METADATA_CACHE_TTL, list_vm_sizes
 
 
 class AzureRMVirtualMachineSizeInfo(AzureRMModuleBase):
@@ -108,7 +113,8 @@ class AzureRMVirtualMachineSizeInfo(AzureRMModuleBase):
 
         self.module_arg_spec = dict(
             location=dict(type='str', required=True),
-            name=dict(type='str')
+            name=dict(type='str'),
+            cache_ttl=dict(type='int', default=COMPUTE_METADATA_CACHE_TTL)
         )
 
         self.results = dict(
@@ -118,6 +124,7 @@ class AzureRMVirtualMachineSizeInfo(AzureRMModuleBase):
 
         self.location = None
         self.name = None
+        self.cache_ttl = None
 
         super(AzureRMVirtualMachineSizeInfo, self).__init__(self.module_arg_spec,
                                                             supports_check_mode=True,
@@ -134,20 +141,10 @@ class AzureRMVirtualMachineSizeInfo(AzureRMModuleBase):
     def list_items_by_location(self):
         self.log('List items by location')
         try:
-            items = self.compute_client.virtual_machine_sizes.list(location=self.location)
+            items = list_vm_sizes(self, self.location, self.cache_ttl)
         except ResourceNotFoundError as exc:
             self.fail("Failed to list items - {0}".format(str(exc)))
-        return [self.serialize_size(item) for item in items if self.name is None or self.name == item.name]
-
-    def serialize_size(self, size):
-        '''
-        Convert a VirtualMachineSize object to dict.
-
-        :param size: VirtualMachineSize object
-        :return: dict
-        '''
-
-        return self.serialize_obj(size, AZURE_OBJECT_CLASS, enum_modules=AZURE_ENUM_MODULES)
+        return [item for item in items if self.name is None or self.name == item['name']]
 
 
 def main():